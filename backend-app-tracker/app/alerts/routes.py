@@ -30,6 +30,9 @@ def get_alerts(
     sortBy: str = Query("createdAt"),
     sortOrder: str = Query("asc"),
     filters: str | None = Query(None),
+    cursor: str | None = Query(None, max_length=1024),
+    includeTotal: bool = Query(True),
+    approxTotal: bool = Query(False),
     current_user_id: str = Depends(get_current_user),
 ):
     db = get_db()
@@ -41,6 +44,9 @@ def get_alerts(
         sort_by=sortBy,
         sort_order=sortOrder,
         filters=filters,
+        cursor=cursor,
+        include_total=includeTotal,
+        approximate_total=approxTotal,
     )
     return success(data=result)
 
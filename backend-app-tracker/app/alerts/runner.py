@@ -13,6 +13,7 @@ from app.config import settings
 from app.database import get_db
 from app.alerts.service import process_due_alerts
 from app.job_alerts.service import process_due_job_alerts
+from app.metrics.registry import endpoint_scope
 from app.notifications.notifier import build_notifier
 
 logger = logging.getLogger("careerlog.alerts")
@@ -28,15 +29,19 @@ async def _run_loop() -> None:
     while True:
         try:
             now = datetime.now(tz=timezone.utc)
-            sent = await asyncio.to_thread(
-                process_due_alerts, get_db(), notifier, now
-            )
+            # to_thread copies the context, so queries are profiled under
+            # these names in the /metrics histograms.
+            with endpoint_scope("background:alerts"):
+                sent = await asyncio.to_thread(
+                    process_due_alerts, get_db(), notifier, now
+                )
             if sent:
                 logger.info("Delivered %s due alert(s)", sent)
             # Saved discovery searches (FEAT-22): notify on new matching postings.
-            notified = await asyncio.to_thread(
-                process_due_job_alerts, get_db(), notifier, now
-            )
+            with endpoint_scope("background:job-alerts"):
+                notified = await asyncio.to_thread(
+                    process_due_job_alerts, get_db(), notifier, now
+                )
             if notified:
                 logger.info("Delivered %s job alert(s)", notified)
         except Exception:
@@ -11,6 +11,7 @@ from fastapi import status
 from app.alerts.schemas import Alert
 from app.common.errors import raise_error
 from app.common.query import parse_filters, paginate
+from app.metrics.queries import profile_query
 from app.notifications.notifier import EMAIL, Notifier
 
 logger = logging.getLogger("careerlog.alerts")
@@ -64,6 +65,9 @@ def list_alerts(
     sort_by: str,
     sort_order: str,
     filters: str | None,
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
 ):
     mongo_filters = parse_filters(filters, user_id, ALERT_FILTERABLE_FIELDS)
 
@@ -76,6 +80,9 @@ def list_alerts(
         sort_order=sort_order,
         serializer=_serialize_alert,
         sortable_fields=ALERT_SORTABLE_FIELDS,
+        cursor=cursor,
+        include_total=include_total,
+        approximate_total=approximate_total,
     )
 
 
@@ -192,7 +199,11 @@ def process_due_alerts(db: Database, notifier: Notifier, now: datetime) -> int:
     """
     now = _to_naive_utc(now)
     sent = 0
-    for alert in db.alerts.find({"scheduledAlert": {"$lte": now}}):
+    query = {"scheduledAlert": {"$lte": now}}
+    with profile_query(db.alerts, "find", filter=query) as span:
+        due = list(db.alerts.find(query))
+        span.returned = len(due)
+    for alert in due:
         if not _is_due(alert, now):
             continue
 
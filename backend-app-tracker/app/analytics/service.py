@@ -4,6 +4,7 @@ from statistics import mean, median
 from pymongo.collection import Collection
 
 from app.analytics.sources import source_from_url
+from app.metrics.queries import profile_query
 
 # The pipeline statuses, in funnel order. Kept here so every analytic agrees on
 # the set of known statuses and their ordering.
@@ -29,7 +30,9 @@ def get_job_status_counts(jobs: Collection, user_id: str) -> dict:
         },
     ]
 
-    results = jobs.aggregate(pipeline)
+    with profile_query(jobs, "aggregate", pipeline=pipeline) as span:
+        results = list(jobs.aggregate(pipeline))
+        span.returned = len(results)
 
     counts = {**_empty_status_counts(), "total": 0}
     total = 0
@@ -218,53 +221,79 @@ def _source_performance_from(jobs_list: list[dict]) -> dict:
     return {"sources": sources}
 
 
+def _fetch(jobs: Collection, query: dict, projection: dict) -> list[dict]:
+    """The user's jobs for an analytic, fetched under query profiling."""
+    with profile_query(jobs, "find", filter=query, projection=projection) as span:
+        jobs_list = list(jobs.find(query, projection))
+        span.returned = len(jobs_list)
+    return jobs_list
+
+
 # ---- per-endpoint wrappers (each does its own fetch) ----
 
 
 def get_funnel(jobs: Collection, user_id: str) -> dict:
     """Status counts plus headline conversion rates."""
-    return _funnel_from(list(jobs.find({"userId": user_id}, {"status": 1})))
+    return _funnel_from(_fetch(jobs, {"userId": user_id}, {"status": 1}))
 
 
 def get_applications_over_time(
     jobs: Collection, user_id: str, interval: str = DEFAULT_INTERVAL
 ) -> dict:
     """Applications bucketed by ``interval`` (week/month/quarter), ascending."""
-    cursor = jobs.find({"userId": user_id}, {"createdAt": 1})
-    return _applications_over_time_from(list(cursor), interval)
+    jobs_list = _fetch(jobs, {"userId": user_id}, {"createdAt": 1})
+    return _applications_over_time_from(jobs_list, interval)
 
 
 def get_time_to_offer(jobs: Collection, user_id: str) -> dict:
     """Average/median days from application to offer, using the status timeline
     (FEAT-13) — exact when history is present, falling back to ``updatedAt`` for
     legacy jobs."""
-    cursor = jobs.find(
+    jobs_list = _fetch(
+        jobs,
         {"userId": user_id, "status": "offer"},
         {"status": 1, "createdAt": 1, "updatedAt": 1, "statusHistory": 1},
     )
-    return _time_to_offer_from(list(cursor))
+    return _time_to_offer_from(jobs_list)
 
 
 def get_company_funnels(jobs: Collection, user_id: str) -> dict:
     """Per-company status breakdown, busiest companies first."""
-    cursor = jobs.find({"userId": user_id}, {"company": 1, "status": 1})
-    return _company_funnels_from(list(cursor))
+    jobs_list = _fetch(jobs, {"userId": user_id}, {"company": 1, "status": 1})
+    return _company_funnels_from(jobs_list)
 
 
 def get_source_performance(jobs: Collection, user_id: str) -> dict:
     """Per-source funnel + conversion rates (which channels produce results)."""
-    cursor = jobs.find({"userId": user_id}, {"url": 1, "status": 1})
-    return _source_performance_from(list(cursor))
+    jobs_list = _fetch(jobs, {"userId": user_id}, {"url": 1, "status": 1})
+    return _source_performance_from(jobs_list)
 
 
-def get_summary(
-    jobs: Collection, user_id: str, interval: str = DEFAULT_INTERVAL
-) -> dict:
-    """All headline analytics from a single per-user fetch (CLN-13)."""
-    jobs_list = list(jobs.find({"userId": user_id}, _ANALYTICS_PROJECTION))
+def _summary_from(jobs_list: list[dict], interval: str) -> dict:
     return {
         "funnel": _funnel_from(jobs_list),
         "applicationsOverTime": _applications_over_time_from(jobs_list, interval),
         "timeToOffer": _time_to_offer_from(jobs_list),
         "byCompany": _company_funnels_from(jobs_list),
     }
+
+
+def get_summary(
+    jobs: Collection, user_id: str, interval: str = DEFAULT_INTERVAL
+) -> dict:
+    """All headline analytics from a single per-user fetch (CLN-13)."""
+    jobs_list = _fetch(jobs, {"userId": user_id}, _ANALYTICS_PROJECTION)
+    return _summary_from(jobs_list, interval)
+
+
+async def get_summary_async(
+    jobs, user_id: str, interval: str = DEFAULT_INTERVAL
+) -> dict:
+    """``get_summary`` over the async (Motor) ``jobs`` collection."""
+    query = {"userId": user_id}
+    with profile_query(
+        jobs, "find", filter=query, projection=_ANALYTICS_PROJECTION
+    ) as span:
+        jobs_list = await jobs.find(query, _ANALYTICS_PROJECTION).to_list(length=None)
+        span.returned = len(jobs_list)
+    return _summary_from(jobs_list, interval)
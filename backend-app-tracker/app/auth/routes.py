@@ -3,9 +3,10 @@ from datetime import datetime, timedelta, timezone
 from bson import ObjectId
 from bson.errors import InvalidId
 from fastapi import APIRouter, Request, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.common.responses import success
 from app.common.errors import raise_error
 from app.common.auth import (
@@ -54,7 +55,7 @@ def _send_email_verification(db, user: dict) -> None:
 
 def _issue_session(user_id: str, email: str, generation: int = 0) -> dict:
     """Build the access + refresh token pair returned by login/register."""
-    access = create_access_token(user_id=user_id, email=email)
+    access = create_access_token(user_id=user_id, email=email, generation=generation)
     refresh = create_refresh_token(
         user_id=user_id, email=email, generation=generation
     )
@@ -123,22 +124,22 @@ def register(request: Request, payload: RegisterRequest):
 
 @router.post("/login")
 @limiter.limit(settings.auth_rate_limit)
-def login(request: Request, payload: LoginRequest):
-    db = get_db()
-    users = db.users
-
-    user = users.find_one({"email": payload.email})
+async def login(request: Request, payload: LoginRequest):
+    user = await get_async_db().users.find_one({"email": payload.email})
+    # Argon2 is deliberately slow CPU work; keep it off the event loop.
     if not user:
         # Verify against a dummy hash so a missing account takes the same time as
         # a wrong password — no timing oracle for which emails exist (SEC-10).
-        service.equalize_password_timing(payload.password)
+        await run_in_threadpool(service.equalize_password_timing, payload.password)
         raise_error(
             code="AUTH_INVALID_CREDENTIALS",
             message="Invalid email or password",
             http_status=status.HTTP_401_UNAUTHORIZED,
         )
 
-    if not verify_password(payload.password, user["passwordHash"]):
+    if not await run_in_threadpool(
+        verify_password, payload.password, user["passwordHash"]
+    ):
         raise_error(
             code="AUTH_INVALID_CREDENTIALS",
             message="Invalid email or password",
@@ -176,8 +177,8 @@ def _reject_refresh(message: str) -> None:
 
 
 @router.post("/refresh")
-def refresh(payload: RefreshRequest):
-    db = get_db()
+async def refresh(payload: RefreshRequest):
+    db = get_async_db()
     claims = decode_jwt(payload.refreshToken, expected_type=REFRESH_TOKEN)
 
     user_id = claims["sub"]
@@ -192,15 +193,15 @@ def refresh(payload: RefreshRequest):
     except (InvalidId, TypeError):
         _reject_refresh("Invalid token subject")
 
-    user = db.users.find_one({"_id": object_id})
+    user = await db.users.find_one({"_id": object_id})
     if not user:
         _reject_refresh("User no longer exists")
 
     # Reuse detection: a presented token whose jti is already revoked means it was
     # rotated (or logged out) earlier. Treat replay as theft and revoke the whole
     # family (bump generation), forcing every session for this user to re-auth.
-    if service.is_refresh_jti_revoked(db, jti):
-        service.revoke_user_refresh_family(db, object_id)
+    if await service.is_refresh_jti_revoked_async(db, jti):
+        await service.revoke_user_refresh_family_async(db, object_id)
         _reject_refresh("Refresh token reuse detected — session revoked")
 
     # Family revocation: reject tokens from a superseded generation.
@@ -209,7 +210,9 @@ def refresh(payload: RefreshRequest):
 
     # Rotate: revoke the presented refresh token, then issue a fresh pair at the
     # user's current generation.
-    service.revoke_refresh_jti(db, jti, service.exp_to_datetime(claims["exp"]))
+    await service.revoke_refresh_jti_async(
+        db, jti, service.exp_to_datetime(claims["exp"])
+    )
 
     return success(
         data=_issue_session(
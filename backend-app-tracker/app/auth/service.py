@@ -5,6 +5,8 @@ from datetime import datetime, timedelta, timezone
 from bson import ObjectId
 from passlib.context import CryptContext
 
+from app.common.auth import live_users
+
 # Argon2 is stable, modern, and Windows-safe
 pwd_context = CryptContext(
     schemes=["argon2"],
@@ -54,10 +56,22 @@ def revoke_refresh_jti(db, jti: str, expires_at: datetime) -> None:
     )
 
 
+async def revoke_refresh_jti_async(db, jti: str, expires_at: datetime) -> None:
+    await db.revoked_tokens.update_one(
+        {"jti": jti},
+        {"$set": {"jti": jti, "expiresAt": expires_at}},
+        upsert=True,
+    )
+
+
 def is_refresh_jti_revoked(db, jti: str) -> bool:
     return db.revoked_tokens.find_one({"jti": jti}, {"_id": 1}) is not None
 
 
+async def is_refresh_jti_revoked_async(db, jti: str) -> bool:
+    return await db.revoked_tokens.find_one({"jti": jti}, {"_id": 1}) is not None
+
+
 def user_token_generation(user: dict) -> int:
     """The user's current refresh-token generation (0 for legacy users)."""
     return user.get("tokenGeneration", 0)
@@ -68,6 +82,12 @@ def revoke_user_refresh_family(db, user_id) -> None:
     generation. Used as a theft response when a rotated token is replayed.
     """
     db.users.update_one({"_id": user_id}, {"$inc": {"tokenGeneration": 1}})
+    live_users.forget(user_id)
+
+
+async def revoke_user_refresh_family_async(db, user_id) -> None:
+    await db.users.update_one({"_id": user_id}, {"$inc": {"tokenGeneration": 1}})
+    live_users.forget(user_id)
 
 
 def is_refresh_generation_stale(user: dict, generation: int) -> bool:
@@ -147,6 +167,7 @@ def set_password(db, user_id: str, new_password: str) -> None:
             "$inc": {"tokenGeneration": 1},
         },
     )
+    live_users.forget(user_id)
 
 
 def mark_email_verified(db, user_id: str) -> None:
@@ -1,3 +1,5 @@
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Dict
@@ -32,8 +34,14 @@ def _encode(payload: dict) -> str:
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
-def create_access_token(user_id: str, email: str) -> Dict[str, str]:
-    """Create a short-lived access token (lifetime = jwt_expiry_hours)."""
+def create_access_token(
+    user_id: str, email: str, generation: int = 0
+) -> Dict[str, str]:
+    """Create a short-lived access token (lifetime = jwt_expiry_hours).
+
+    Carries the user's token ``gen`` so a generation bump (password reset,
+    refresh-token reuse) revokes outstanding access tokens too.
+    """
     now = datetime.now(tz=timezone.utc)
     expires_at = now + timedelta(hours=settings.jwt_expiry_hours)
 
@@ -42,6 +50,7 @@ def create_access_token(user_id: str, email: str) -> Dict[str, str]:
             "sub": user_id,
             "email": email,
             "type": ACCESS_TOKEN,
+            "gen": generation,
             "iat": int(now.timestamp()),
             "exp": int(expires_at.timestamp()),
             "iss": "job-tracker-api",
@@ -100,6 +109,80 @@ def decode_jwt(token: str, expected_type: str | None = None) -> Dict:
     return payload
 
 
+class LiveUserCache:
+    """Recently confirmed live user ids and their token generation.
+
+    Saves ``get_current_user`` a ``users`` lookup on every authenticated
+    request. Entries live for ``auth_user_cache_ttl_seconds``; this process
+    drops an entry as soon as it deletes the user or bumps their generation
+    (``forget``). Other replicas learn of a deletion within the TTL, and of a
+    generation bump as soon as a token from the newer generation arrives (see
+    ``_live_generation``). Bounded: the oldest entries go first once full.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._entries: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> int | None:
+        """The cached generation of a live user, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, user_id: str, generation: int) -> None:
+        ttl = settings.auth_user_cache_ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(user_id, None)
+            if len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[user_id] = (time.monotonic() + ttl, generation)
+
+    def forget(self, user_id) -> None:
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+live_users = LiveUserCache(settings.auth_user_cache_max_entries)
+
+
+def _live_generation(user_id: str, token_generation: int | None) -> int:
+    """The user's current token generation; raises if the user is gone.
+
+    Served from ``live_users`` unless the token is from a newer generation than
+    the cached one, which means the entry is stale.
+    """
+    generation = live_users.get(user_id)
+    if generation is not None and (
+        token_generation is None or token_generation <= generation
+    ):
+        return generation
+
+    # Re-validate that the user still exists — a token for a deleted account
+    # must not remain usable until expiry.
+    try:
+        object_id = ObjectId(user_id)
+    except (InvalidId, TypeError):
+        raise _auth_error("Invalid token subject") from None
+
+    user = get_db().users.find_one({"_id": object_id}, {"_id": 1, "tokenGeneration": 1})
+    if not user:
+        live_users.forget(user_id)
+        raise _auth_error("User no longer exists")
+    generation = user.get("tokenGeneration", 0)
+    live_users.put(user_id, generation)
+    return generation
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> str:
@@ -116,14 +199,10 @@ def get_current_user(
     if not user_id:
         raise _auth_error("Token missing subject")
 
-    # Re-validate that the user still exists — a token for a deleted account
-    # must not remain usable until expiry.
-    try:
-        object_id = ObjectId(user_id)
-    except (InvalidId, TypeError):
-        raise _auth_error("Invalid token subject") from None
-
-    if not get_db().users.find_one({"_id": object_id}, {"_id": 1}):
-        raise _auth_error("User no longer exists")
+    token_generation = payload.get("gen")
+    generation = _live_generation(user_id, token_generation)
+    # Tokens issued before access tokens carried a generation skip this check.
+    if token_generation is not None and token_generation < generation:
+        raise _auth_error("Session has been revoked")
 
     return user_id
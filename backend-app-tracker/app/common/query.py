@@ -5,14 +5,22 @@ jobs and alerts services, and closes the access-control hole where client-suppli
 filters could override the `userId` scope or inject Mongo operators.
 """
 
+import base64
+import binascii
 import json
 import re
+import threading
+import time
 from typing import Any, Callable, Iterable
 
+from bson import json_util
+from bson.json_util import CANONICAL_JSON_OPTIONS
 from fastapi import status
 from pymongo.collection import Collection
 
 from app.common.errors import raise_error
+from app.config import settings
+from app.metrics.queries import profile_query
 
 
 def validate_client_filters(
@@ -100,6 +108,260 @@ def parse_filters(
     return query
 
 
+def encode_cursor(sort_by: str, sort_order: str, value: Any, last_id: Any) -> str:
+    """Opaque continuation token for keyset pagination.
+
+    Carries the sort it was issued for and the last row's sort value and
+    ``_id``. Extended JSON keeps dates and ObjectIds typed across the round
+    trip, so the range query compares like with like.
+    """
+    raw = json_util.dumps(
+        {"s": sort_by, "o": sort_order, "v": value, "id": last_id},
+        json_options=CANONICAL_JSON_OPTIONS,
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_by: str, sort_order: str) -> tuple[Any, Any]:
+    """``(sort value, _id)`` from a token issued for the same sort."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json_util.loads(raw)
+        if not isinstance(data, dict) or "id" not in data:
+            raise ValueError
+    except (ValueError, binascii.Error, TypeError):
+        raise_error(
+            code="VALIDATION_ERROR",
+            message="Invalid cursor",
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
+    if data.get("s") != sort_by or data.get("o") != sort_order:
+        raise_error(
+            code="VALIDATION_ERROR",
+            message="Cursor does not match the requested sort",
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
+    return data.get("v"), data["id"]
+
+
+def keyset_clause(
+    sort_by: str, direction: int, value: Any, last_id: Any, *, id_field: str = "_id"
+) -> dict:
+    """Filter for the rows after ``(value, last_id)`` in ``(sort_by, id_field)``
+    order.
+
+    Mongo sorts null/missing below every other value, and a range operator
+    never matches null, so the null band is handled explicitly: descending,
+    it comes after every non-null value; ascending, before.
+    """
+    op = "$gt" if direction == 1 else "$lt"
+    tie = {sort_by: value, id_field: {op: last_id}}
+    if value is None:
+        if direction == 1:
+            return {"$or": [{sort_by: {"$ne": None}}, tie]}
+        return tie
+    after = [{sort_by: {op: value}}, tie]
+    if direction == -1:
+        after.append({sort_by: None})
+    return {"$or": after}
+
+
+def page_meta(
+    page: int | None,
+    page_size: int,
+    total_items: int | None,
+    next_cursor: str | None,
+    total_is_estimate: bool = False,
+) -> dict:
+    """The standard list ``meta``; totals are None when the count was skipped."""
+    total_pages = (
+        None if total_items is None else (total_items + page_size - 1) // page_size
+    )
+    return {
+        "page": page,
+        "pageSize": page_size,
+        "totalItems": total_items,
+        "totalPages": total_pages,
+        "totalIsEstimate": total_is_estimate,
+        "nextCursor": next_cursor,
+    }
+
+
+class CountCache:
+    """Short-lived list totals keyed by collection and normalized filter.
+
+    Paging through one filter re-counts the same rows on every page; this
+    remembers the count for ``list_count_cache_ttl_seconds``. Writers that
+    change a cached collection call ``invalidate`` with its ``full_name``.
+    The cache is per process, so the TTL bounds how stale another worker's
+    total can be. Bounded: the oldest entries go first once full.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: dict[tuple[str, str], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(mongo_filters: dict) -> str:
+        return json_util.dumps(
+            mongo_filters, sort_keys=True, json_options=CANONICAL_JSON_OPTIONS
+        )
+
+    def get(self, namespace: str, key: str) -> int | None:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, namespace: str, key: str, count: int) -> None:
+        ttl = settings.list_count_cache_ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[(namespace, key)] = (time.monotonic() + ttl, count)
+
+    def invalidate(self, namespace: str) -> None:
+        with self._lock:
+            for entry in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[entry]
+
+
+count_cache = CountCache()
+
+
+def _cached_count(collection, mongo_filters: dict, cached: bool) -> tuple[str, int | None]:
+    key = CountCache.key(mongo_filters)
+    hit = count_cache.get(collection.full_name, key) if cached else None
+    return key, hit
+
+
+def _estimate_cap(approximate: bool) -> int | None:
+    return max(1, settings.list_count_estimate_cap) if approximate else None
+
+
+def _count_kwargs(cap: int | None) -> dict:
+    return {} if cap is None else {"limit": cap + 1}
+
+
+def _finish_count(
+    collection, key: str, total: int, cap: int | None, cached: bool
+) -> tuple[int, bool]:
+    if cap is not None and total > cap:
+        return cap, True
+    if cached:
+        count_cache.put(collection.full_name, key, total)
+    return total, False
+
+
+def count_total(
+    collection: Collection,
+    mongo_filters: dict,
+    *,
+    cached: bool = False,
+    approximate: bool = False,
+) -> tuple[int, bool]:
+    """``(total, is_estimate)`` for a list query.
+
+    ``cached`` serves and stores the exact count in ``count_cache``.
+    ``approximate`` avoids a full count: an unfiltered query reads the
+    collection's metadata count, and a filtered one counts at most
+    ``list_count_estimate_cap`` rows, reporting the cap as an estimate when
+    more match.
+    """
+    key, hit = _cached_count(collection, mongo_filters, cached)
+    if hit is not None:
+        return hit, False
+    if approximate and not mongo_filters:
+        return collection.estimated_document_count(), True
+    cap = _estimate_cap(approximate)
+    with profile_query(collection, "count", filter=mongo_filters) as span:
+        total = collection.count_documents(mongo_filters, **_count_kwargs(cap))
+        span.returned = total
+    return _finish_count(collection, key, total, cap, cached)
+
+
+async def count_total_async(
+    collection,
+    mongo_filters: dict,
+    *,
+    cached: bool = False,
+    approximate: bool = False,
+) -> tuple[int, bool]:
+    """``count_total`` over an async (Motor) collection."""
+    key, hit = _cached_count(collection, mongo_filters, cached)
+    if hit is not None:
+        return hit, False
+    if approximate and not mongo_filters:
+        return await collection.estimated_document_count(), True
+    cap = _estimate_cap(approximate)
+    with profile_query(collection, "count", filter=mongo_filters) as span:
+        total = await collection.count_documents(mongo_filters, **_count_kwargs(cap))
+        span.returned = total
+    return _finish_count(collection, key, total, cap, cached)
+
+
+class _PageQuery:
+    """The find behind one page: filter, sort, skip and (one-extra) limit."""
+
+    def __init__(
+        self,
+        mongo_filters: dict,
+        *,
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_order: str,
+        sortable_fields: Iterable[str],
+        cursor: str | None,
+    ):
+        if sort_by not in set(sortable_fields):
+            sort_by = "createdAt"
+        direction = 1 if sort_order == "asc" else -1
+        self.sort_by, self.sort_order = sort_by, sort_order
+        self.page: int | None = page
+        self.page_size = page_size
+        self.query, self.skip = mongo_filters, (page - 1) * page_size
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_by, sort_order)
+            keyset = keyset_clause(sort_by, direction, value, last_id)
+            self.query, self.skip, self.page = {"$and": [mongo_filters, keyset]}, 0, None
+        self.sort = [(sort_by, direction), ("_id", direction)]
+        # One extra row tells us whether there's a next page without a count.
+        self.limit = page_size + 1
+
+    def profile(self, collection):
+        return profile_query(
+            collection,
+            "find",
+            filter=self.query,
+            sort=self.sort,
+            skip=self.skip,
+            limit=self.limit,
+        )
+
+    def payload(
+        self,
+        docs: list[dict],
+        serializer: Callable[[dict], dict],
+        total: tuple[int | None, bool],
+    ) -> dict:
+        next_cursor = None
+        if len(docs) > self.page_size:
+            docs = docs[: self.page_size]
+            last = docs[-1]
+            next_cursor = encode_cursor(
+                self.sort_by, self.sort_order, last.get(self.sort_by), last["_id"]
+            )
+        return {
+            "items": [serializer(doc) for doc in docs],
+            "meta": page_meta(self.page, self.page_size, total[0], next_cursor, total[1]),
+        }
+
+
 def paginate(
     collection: Collection,
     mongo_filters: dict,
@@ -110,31 +372,78 @@ def paginate(
     sort_order: str,
     serializer: Callable[[dict], dict],
     sortable_fields: Iterable[str],
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
+    cache_total: bool = False,
 ) -> dict:
-    """Run a paginated, sorted query and return the standard list payload."""
-    if sort_by not in set(sortable_fields):
-        sort_by = "createdAt"
-    sort_direction = 1 if sort_order == "asc" else -1
-    skip = (page - 1) * page_size
-
-    cursor = (
-        collection.find(mongo_filters)
-        .sort(sort_by, sort_direction)
-        .skip(skip)
-        .limit(page_size)
+    """Run a paginated, sorted query and return the standard list payload.
+
+    Pages are addressed by number (``skip``) unless ``cursor`` — a previous
+    page's ``meta.nextCursor`` — is given, in which case the page starts right
+    after that row with a range query on ``(sort_by, _id)``, so deep pages cost
+    the same as the first. ``meta.nextCursor`` is None on the last page.
+    ``include_total=False`` skips the ``count_documents`` (infinite scroll);
+    ``totalItems``/``totalPages`` are then None. ``approximate_total`` and
+    ``cache_total`` select how the total is counted (see ``count_total``);
+    ``meta.totalIsEstimate`` says whether it is exact.
+    """
+    plan = _PageQuery(
+        mongo_filters,
+        page=page,
+        page_size=page_size,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        sortable_fields=sortable_fields,
+        cursor=cursor,
     )
+    with plan.profile(collection) as span:
+        docs = list(
+            collection.find(plan.query).sort(plan.sort).skip(plan.skip).limit(plan.limit)
+        )
+        span.returned = len(docs)
 
-    items = [serializer(doc) for doc in cursor]
+    total: tuple[int | None, bool] = (None, False)
+    if include_total:
+        total = count_total(
+            collection, mongo_filters, cached=cache_total, approximate=approximate_total
+        )
+    return plan.payload(docs, serializer, total)
 
-    total_items = collection.count_documents(mongo_filters)
-    total_pages = (total_items + page_size - 1) // page_size
 
-    return {
-        "items": items,
-        "meta": {
-            "page": page,
-            "pageSize": page_size,
-            "totalItems": total_items,
-            "totalPages": total_pages,
-        },
-    }
+async def paginate_async(
+    collection,
+    mongo_filters: dict,
+    *,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    serializer: Callable[[dict], dict],
+    sortable_fields: Iterable[str],
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
+    cache_total: bool = False,
+) -> dict:
+    """``paginate`` over an async (Motor) collection; same payload."""
+    plan = _PageQuery(
+        mongo_filters,
+        page=page,
+        page_size=page_size,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        sortable_fields=sortable_fields,
+        cursor=cursor,
+    )
+    with plan.profile(collection) as span:
+        found = collection.find(plan.query).sort(plan.sort).skip(plan.skip).limit(plan.limit)
+        docs = await found.to_list(length=None)
+        span.returned = len(docs)
+
+    total: tuple[int | None, bool] = (None, False)
+    if include_total:
+        total = await count_total_async(
+            collection, mongo_filters, cached=cache_total, approximate=approximate_total
+        )
+    return plan.payload(docs, serializer, total)
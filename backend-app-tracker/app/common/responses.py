@@ -1,5 +1,10 @@
 from typing import Any, Optional, Dict
 
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
 
 def success(data: Optional[Any] = None) -> Dict[str, Any]:
     """
@@ -24,3 +29,34 @@ def failure(code: str, message: str) -> Dict[str, Any]:
             "message": message,
         },
     }
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    # Anything else orjson doesn't know (Pydantic models, Decimal, bytes, …)
+    # gets FastAPI's usual encoding.
+    return jsonable_encoder(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson in one pass.
+
+    Datetimes come out exactly as FastAPI's encoder writes them (ISO 8601,
+    with the offset only when the value is timezone-aware) and ObjectIds as
+    their hex string, so the body matches the default path byte-for-byte
+    once parsed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
+
+
+def fast_success(data: Optional[Any] = None) -> FastJSONResponse:
+    """
+    ``success(data)`` rendered by ``FastJSONResponse``. Returning a response
+    skips FastAPI's ``jsonable_encoder`` walk over the payload, so use it for
+    large list payloads that are already plain dicts in the response shape
+    (e.g. serialized Mongo documents), not for Pydantic models.
+    """
+    return FastJSONResponse(success(data))
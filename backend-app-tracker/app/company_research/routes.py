@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query
 
-from app.database import get_db
+from app.database import get_read_db
 from app.common.auth import get_current_user
 from app.common.responses import success
 from app.company_research import service
@@ -16,7 +16,7 @@ def list_companies(
     current_user_id: str = Depends(get_current_user),
 ):
     """Companies present in discovered postings, with open-role counts."""
-    db = get_db()
+    db = get_read_db()
     result = service.list_companies(db, q=q, limit=limit)
     return success(data=CompanyList(**result).model_dump())
 
@@ -27,6 +27,6 @@ def get_snapshot(
     current_user_id: str = Depends(get_current_user),
 ):
     """A research snapshot for a company, derived from its public postings."""
-    db = get_db()
+    db = get_read_db()
     result = service.snapshot(db, company)
     return success(data=CompanySnapshot(**result).model_dump())
@@ -4,8 +4,8 @@ A snapshot is assembled entirely from the ``discovered_jobs`` we already
 ingest (FEAT-22) — no scraping, no external news/Glassdoor APIs, no generative
 AI. It surfaces what we can legitimately infer from a company's own postings:
 how many roles are open, where, on which ATS platforms, the seniority mix, the
-salary range, and tech-stack clues pulled from the job text via the matching
-engine's skill taxonomy (FEAT-21).
+salary range, and tech-stack clues — the canonical skills the matching
+engine's taxonomy (FEAT-21) found in each posting at ingest.
 """
 
 from __future__ import annotations
@@ -14,7 +14,8 @@ import re
 from collections import Counter
 from datetime import datetime
 
-from app.matching.keywords import extract_skills
+from app.discovery import facets
+from app.discovery.enrich import posting_skills
 
 # Cap how many postings we scan per company so the aggregation stays bounded.
 SNAPSHOT_SCAN_CAP = 500
@@ -32,14 +33,14 @@ def _facets(values: list[str | None]) -> list[dict]:
 
 
 def list_companies(db, q: str | None = None, limit: int = 50) -> dict:
-    """Distinct companies present in discovered postings, with role counts."""
-    rows = db.discovered_jobs.aggregate(
-        [{"$group": {"_id": "$company", "count": {"$sum": 1}}}]
-    )
+    """Distinct companies present in discovered postings, with role counts.
+
+    Read from the company rows of the maintained ``discovery_facets`` counts.
+    """
     companies = [
-        {"name": str(r["_id"]), "openRoles": int(r.get("count", 0) or 0)}
-        for r in rows
-        if r.get("_id")
+        {"name": str(r["value"]), "openRoles": int(r.get("count", 0) or 0)}
+        for r in facets.read(db, "company")
+        if r.get("value")
     ]
     if q and q.strip():
         needle = q.strip().casefold()
@@ -79,7 +80,7 @@ def snapshot(db, company: str) -> dict:
     salary_maxs: list[int] = []
     posted: list[datetime] = []
     for doc in docs:
-        for skill in extract_skills(doc.get("description") or ""):
+        for skill in posting_skills(doc):
             skill_counts[skill] += 1
         if doc.get("salaryMin") is not None:
             salary_mins.append(doc["salaryMin"])
@@ -13,12 +13,33 @@ _WEAK_SECRETS = {
 }
 _MIN_SECRET_LENGTH = 16
 
+# Wire compressors the Mongo driver can negotiate (zstd needs the ``zstandard``
+# package and snappy ``python-snappy``; zlib is built in).
+_MONGODB_COMPRESSORS = {"zstd", "snappy", "zlib"}
+
 
 class Settings(BaseSettings):
     # MongoDB
     mongodb_uri: str
     mongodb_db_name: str = "jobtracker"
 
+    # MongoDB client tuning. The sync and async clients each keep their own
+    # pool with these options, per process — size them for the worker count
+    # (see README "Sizing the Mongo pool"). Unset keeps the driver default or
+    # the value given in MONGODB_URI; a set value overrides the URI's.
+    mongodb_max_pool_size: int | None = None
+    mongodb_min_pool_size: int | None = None
+    mongodb_max_idle_time_ms: int | None = None
+    mongodb_server_selection_timeout_ms: int | None = None
+    mongodb_connect_timeout_ms: int | None = None
+    mongodb_socket_timeout_ms: int | None = None
+    # Comma-separated, in order of preference, e.g. "zstd,snappy,zlib".
+    mongodb_compressors: str | None = None
+    # Serve the read-heavy routes (Discover feed and facets, company research,
+    # analytics) from a secondary when one is available. Those reads may then
+    # lag a just-made write by the replication delay.
+    mongodb_secondary_reads: bool = False
+
     # JWT
     jwt_secret: str
     jwt_algorithm: str = "HS256"
@@ -40,11 +61,32 @@ class Settings(BaseSettings):
             )
         return value
 
+    @field_validator("mongodb_compressors")
+    @classmethod
+    def _validate_mongodb_compressors(cls, value: str | None) -> str | None:
+        if not value or not value.strip():
+            return None
+        names = [name.strip().lower() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(names) - _MONGODB_COMPRESSORS)
+        if unknown:
+            raise ValueError(
+                f"unknown compressor(s) {', '.join(unknown)}; "
+                f"use any of {', '.join(sorted(_MONGODB_COMPRESSORS))}"
+            )
+        return ",".join(names)
+
     # CORS — comma-separated list of allowed origins for the desktop client.
     # Defaults to the Vite dev server on both loopback spellings (localhost and
     # 127.0.0.1); tighten/extend per environment.
     cors_allow_origins: str = "http://localhost:5173,http://127.0.0.1:5173"
 
+    # Authenticated requests confirm the user still exists (and their token
+    # generation) at most once per this many seconds per process; 0 checks
+    # Mongo on every request. Bounds how long another replica's account
+    # deletion takes to reach this one.
+    auth_user_cache_ttl_seconds: float = 30
+    auth_user_cache_max_entries: int = 10000
+
     # Rate limit applied to authentication endpoints (login/register).
     auth_rate_limit: str = "5/minute"
 
@@ -73,6 +115,77 @@ class Settings(BaseSettings):
     notifier_max_attempts: int = 3
     notifier_retry_backoff_seconds: float = 0.5
 
+    # List totals. The shared discovered-postings feed caches its total per
+    # normalized filter for this many seconds (0 disables; ingest clears it).
+    # ``approxTotal=true`` list requests count at most ``cap`` matching rows and
+    # report anything beyond as an estimate.
+    list_count_cache_ttl_seconds: float = 30
+    list_count_estimate_cap: int = 10000
+
+    # Job-posting analysis cache (matching). Each process keeps the analysis of
+    # up to ``max_entries`` posting texts, least recently used evicted first
+    # (0 disables). With ``mongo`` on, analyses are also shared through the
+    # ``job_analysis_cache`` collection and expire after ``ttl_days``.
+    matching_job_cache_max_entries: int = 2048
+    matching_job_cache_mongo: bool = False
+    matching_job_cache_mongo_ttl_days: int = 30
+
+    # Optional process pool for ``/api/match/score-batch``. 0 scores in the
+    # request thread; N > 0 fans chunks of this many postings out to N worker
+    # processes. Results are identical either way.
+    matching_batch_workers: int = 0
+    matching_batch_chunk_size: int = 25
+
+    # Best-match feed ranking (``sortBy=matchScore``). A user's ranking is
+    # kept current after each background board refresh while they've used it
+    # within this many days; after that it's dropped with its stored scores.
+    matching_rank_active_days: int = 14
+
+    # Query profiling. Every profiled Mongo call feeds the per-endpoint latency
+    # histograms; one slower than ``slow_query_ms`` is logged, and this fraction
+    # of calls is re-run through ``explain`` off the request path to sample its
+    # plan. ``GET /metrics`` is disabled unless METRICS_TOKEN is set, and then
+    # requires it in the ``X-Metrics-Token`` header.
+    slow_query_ms: float = 200
+    query_plan_sample_rate: float = 0.01
+    metrics_token: str | None = None
+
+    # Discovery ingest writes postings to Mongo in unordered ``bulk_write``
+    # batches of this many upserts, so a large board costs a handful of round
+    # trips instead of one per posting.
+    discovery_ingest_batch_size: int = 500
+
+    # Optional process pool for the CPU-bound ingest stage (normalize + enrich).
+    # 0 keeps it in-process; N > 0 fans chunks of this many raw postings out to
+    # N worker processes. Output is identical either way.
+    discovery_enrich_workers: int = 0
+    discovery_enrich_chunk_size: int = 100
+
+    # Multi-board ingest fetches boards concurrently over one pooled async HTTP
+    # client: at most this many connections overall, and at most this many
+    # in-flight requests to any single ATS host.
+    discovery_http_max_connections: int = 32
+    discovery_fetch_concurrency_per_host: int = 4
+
+    # Background refresh of tracked boards (every board ever ingested plus the
+    # curated directory). Each pass claims up to ``batch_size`` due boards; a
+    # board is refreshed every ``interval`` seconds (jittered), backs off
+    # exponentially from ``backoff`` up to ``max_backoff`` seconds while its ATS
+    # fetch keeps failing, and is leased for ``lease`` seconds while a replica
+    # refreshes it.
+    discovery_refresh_enabled: bool = True
+    discovery_refresh_poll_seconds: int = 60
+    discovery_refresh_interval_seconds: int = 3600
+    discovery_refresh_batch_size: int = 50
+    discovery_refresh_lease_seconds: int = 900
+    discovery_refresh_backoff_seconds: int = 300
+    discovery_refresh_max_backoff_seconds: int = 86400
+
+    # The refresh loop recomputes the pre-aggregated facet counts from scratch
+    # at most this often, repairing any drift in the incremental counts
+    # (``discovery.facets``). 0 disables the periodic rebuild.
+    discovery_facets_rebuild_seconds: int = 21600
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,16 +1,54 @@
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import MongoClient, ReadPreference
 from pymongo.database import Database
 
 from app.config import settings
+from app.metrics.pool import pool_monitor
 
 _client: MongoClient | None = None
 _db: Database | None = None
 
+# Async (Motor) handle for the ``async def`` hot paths, so a slow query waits on
+# the event loop instead of holding one of the threadpool's workers. Same
+# server and database as the sync client.
+_async_client: AsyncIOMotorClient | None = None
+_async_db: AsyncIOMotorDatabase | None = None
+
+
+# Client option → the setting that tunes it (see ``Settings``).
+_CLIENT_OPTIONS = {
+    "maxPoolSize": "mongodb_max_pool_size",
+    "minPoolSize": "mongodb_min_pool_size",
+    "maxIdleTimeMS": "mongodb_max_idle_time_ms",
+    "serverSelectionTimeoutMS": "mongodb_server_selection_timeout_ms",
+    "connectTimeoutMS": "mongodb_connect_timeout_ms",
+    "socketTimeoutMS": "mongodb_socket_timeout_ms",
+    "compressors": "mongodb_compressors",
+}
+
+
+def client_options(name: str) -> dict:
+    """Keyword options for the ``name`` ("sync"/"async") Mongo client: the
+    configured pool, timeout and compression settings plus its pool monitor."""
+    options = {
+        option: getattr(settings, field)
+        for option, field in _CLIENT_OPTIONS.items()
+        if getattr(settings, field) is not None
+    }
+    options["event_listeners"] = [pool_monitor(name)]
+    return options
+
+
+def _for_reads(db):
+    if settings.mongodb_secondary_reads:
+        return db.with_options(read_preference=ReadPreference.SECONDARY_PREFERRED)
+    return db
+
 
 def get_client() -> MongoClient:
     global _client
     if _client is None:
-        _client = MongoClient(settings.mongodb_uri)
+        _client = MongoClient(settings.mongodb_uri, **client_options("sync"))
     return _client
 
 
@@ -22,6 +60,32 @@ def get_db() -> Database:
     return _db
 
 
+def get_read_db() -> Database:
+    """``get_db`` for read-only, read-heavy routes that tolerate replication
+    lag: secondary-preferred when MONGODB_SECONDARY_READS is set. Never write
+    through it."""
+    return _for_reads(get_db())
+
+
+def get_async_client() -> AsyncIOMotorClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncIOMotorClient(settings.mongodb_uri, **client_options("async"))
+    return _async_client
+
+
+def get_async_db() -> AsyncIOMotorDatabase:
+    global _async_db
+    if _async_db is None:
+        _async_db = get_async_client()[settings.mongodb_db_name]
+    return _async_db
+
+
+def get_async_read_db() -> AsyncIOMotorDatabase:
+    """``get_read_db`` for the async routes."""
+    return _for_reads(get_async_db())
+
+
 def ensure_indexes(db: Database) -> None:
     """Create the indexes documented in MONGO_SCHEMA.md.
 
@@ -49,7 +113,51 @@ def ensure_indexes(db: Database) -> None:
     )
     db.discovered_jobs.create_index([("postedAt", -1)])
     db.discovered_jobs.create_index("company")
-    db.discovered_jobs.create_index("employmentType")
+    # Compound indexes for the common Discover shapes (equality filter, then
+    # the default postedAt sort — see ``discovery.queryplan.QUERY_SHAPES``,
+    # which reports at startup any shape still answered by a collection scan).
+    # The employmentType one also serves plain employmentType lookups.
+    for field in ("employmentType", "workArrangement", "experienceLevel", "source"):
+        db.discovered_jobs.create_index([(field, 1), ("postedAt", -1)])
+    db.discovered_jobs.create_index([("sponsorshipAvailable", 1), ("postedAt", -1)])
+    # Duplicate collapsing groups by dedupeKey in postedAt order.
+    db.discovered_jobs.create_index([("dedupeKey", 1), ("postedAt", -1)])
+    # Range filters / sorts: salary floor + salary sort, quality floor.
+    db.discovered_jobs.create_index([("salaryMax", -1)])
+    db.discovered_jobs.create_index([("qualityScore", -1), ("postedAt", -1)])
+    # Job-alert match counts: criteria plus "ingested since the last run".
+    db.discovered_jobs.create_index([("ingestedAt", -1)])
+    # Token index for text search (``qMode=text``): multikey, serves both exact
+    # words and anchored prefixes.
+    db.discovered_jobs.create_index("searchTokens")
+    # Best-match ranking refreshes read the postings written since their
+    # watermark.
+    db.discovered_jobs.create_index("updatedAt")
+
+    # Tracked boards for the background refresh — one row per board; the
+    # refresh worker scans for due ones.
+    db.tracked_boards.create_index([("source", 1), ("boardToken", 1)], unique=True)
+    db.tracked_boards.create_index("nextRefreshAt")
+
+    # Conditional-GET validators + compressed last body per board URL.
+    db.board_http_cache.create_index("url", unique=True)
+
+    # Best-match feed ranking: one row per (user, résumé) ranking, and its
+    # scores keyed "<userId>:<resumeId>:<postingId>" (``_id``). The feed reads
+    # a ranking's scores best first; the same index clears them by owner.
+    db.match_rankings.create_index([("userId", 1), ("resumeId", 1)], unique=True)
+    db.match_rankings.create_index("lastUsedAt")
+    db.match_scores.create_index(
+        [("userId", 1), ("resumeId", 1), ("score", -1), ("postingId", -1)]
+    )
+
+    # Shared job-posting analysis keyed by text hash (``_id``); TTL purges
+    # entries once expired.
+    db.job_analysis_cache.create_index("expiresAt", expireAfterSeconds=0)
+
+    # Pre-aggregated facet counts (location, company, ...) kept by ingest; one
+    # row per (field, exact value).
+    db.discovery_facets.create_index([("field", 1), ("value", 1)], unique=True)
 
     # Per-user company preferences (FEAT-22) — one document per user.
     db.user_preferences.create_index("userId", unique=True)
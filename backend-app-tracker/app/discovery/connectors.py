@@ -9,26 +9,61 @@ auth, no HTML scraping):
 * Recruitee  — ``{token}.recruitee.com/api/offers/``
 
 A connector takes a company's *board token* (the slug in its careers URL) and
-returns a list of normalized posting dicts. Network access goes through the
-module-level ``_get_json`` so tests can substitute fixtures.
+yields normalized posting dicts. Network access goes through the module-level
+``_open_board`` so tests can substitute fixtures.
+
+Bodies are streamed, never buffered whole: the ``_MAX_BYTES`` cap is enforced
+while reading, and ``jsonstream.iter_items`` decodes the postings array one
+element at a time, so each posting flows through normalize → enrich → bulk
+upsert as it is read and peak memory doesn't grow with the board. The async
+path downloads on the event loop and hands chunks to the parsing worker
+thread through a small bounded queue, so the same holds there.
+
+Downloads are conditional when a ``BoardHttpCache`` is supplied (see
+``discovery.httpcache``): the last validators are sent back and a ``304``
+raises ``NotModified`` instead of re-parsing an unchanged board. The new
+validators and body copy are only recorded here; the caller commits them
+(``BoardStream.commit``) once the postings are stored.
+
+Each source is described by its board URL, where the postings array sits in
+the body, and a per-posting normalizer (``_BOARD_API``). ``open_source`` (and
+``open_source_async``, which shares one pooled ``httpx.AsyncClient`` across
+boards) yield *raw* postings; normalizing them (``to_posting``) is CPU work the
+ingest pipeline may hand to a process pool (see ``discovery.pipeline``).
+``iter_source`` / ``fetch_source`` normalize inline.
 """
 
 from __future__ import annotations
 
+import asyncio
 import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from urllib.parse import urlparse
 
 import httpx
 
 from app.matching.extract import html_to_text
+from app.discovery.httpcache import (
+    BoardHttpCache,
+    BodyRecorder,
+    conditional_headers,
+    iter_cached_body,
+)
+from app.discovery.jsonstream import iter_items
 from app.discovery.normalize import (
     normalize_employment_type,
     normalize_location,
     parse_salary,
 )
+from app.metrics.registry import span
 
 _TIMEOUT_SECONDS = 10.0
 _MAX_BYTES = 5 * 1024 * 1024
+_CHUNK_BYTES = 64 * 1024
+# Chunks an async download may run ahead of its consumer (see _pump_body).
+_QUEUED_CHUNKS = 4
 _USER_AGENT = "CareerLogBot/1.0 (+job-discovery)"
 
 # Board tokens appear in URLs; restrict to a safe slug charset so a token can't
@@ -40,32 +75,196 @@ class ConnectorError(Exception):
     """Raised when a board can't be fetched or parsed."""
 
 
+class NotModified(Exception):
+    """The ATS answered ``304``: the board is unchanged since it was cached.
+
+    Carries the cache entry so a caller that needs the postings anyway can
+    replay them from the stored body (``body()``).
+    """
+
+    def __init__(self, entry: dict):
+        super().__init__("Board not modified since the last fetch")
+        self.entry = entry
+
+    def body(self) -> Iterator[bytes]:
+        return iter_cached_body(self.entry)
+
+
 def valid_token(token: str) -> bool:
     return bool(_TOKEN_RE.match(token or ""))
 
 
-def _get_json(url: str):
-    """Fetch and parse JSON from a known ATS host. Monkeypatched in tests."""
-    try:
-        with httpx.Client(
-            timeout=_TIMEOUT_SECONDS,
-            follow_redirects=True,
-            headers={"User-Agent": _USER_AGENT, "Accept": "application/json"},
-        ) as client:
-            resp = client.get(url)
-    except httpx.HTTPError as exc:
-        raise ConnectorError("Could not reach the ATS") from exc
+_HEADERS = {"User-Agent": _USER_AGENT, "Accept": "application/json"}
+
 
+def _check_response(resp: httpx.Response, entry: dict | None) -> None:
+    """Raise for a response whose body shouldn't be read (before reading it)."""
+    if resp.status_code == 304 and entry is not None:
+        raise NotModified(entry)
     if resp.status_code == 404:
         raise ConnectorError("Unknown company board for this source")
     if resp.status_code >= 400:
         raise ConnectorError(f"ATS returned HTTP {resp.status_code}")
-    if len(resp.content) > _MAX_BYTES:
+    declared = resp.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > _MAX_BYTES:
         raise ConnectorError("ATS response too large")
+
+
+def _capped(chunks: Iterable[bytes], recorder: BodyRecorder | None) -> Iterator[bytes]:
+    """Pass body chunks through, failing as soon as ``_MAX_BYTES`` is crossed.
+
+    The cache copy is recorded as the chunks go by and marked complete once
+    the body has been read to the end.
+    """
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        if total > _MAX_BYTES:
+            raise ConnectorError("ATS response too large")
+        if recorder is not None:
+            recorder.feed(chunk)
+        yield chunk
+    if recorder is not None:
+        recorder.complete = True
+
+
+def _client() -> httpx.Client:
+    return httpx.Client(
+        timeout=_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        headers=_HEADERS,
+    )
+
+
+def _stream_body(
+    client: httpx.Client, resp: httpx.Response, recorder: BodyRecorder | None
+) -> Iterator[bytes]:
     try:
-        return resp.json()
-    except ValueError as exc:
-        raise ConnectorError("ATS returned invalid JSON") from exc
+        yield from _capped(resp.iter_bytes(_CHUNK_BYTES), recorder)
+    except httpx.HTTPError as exc:
+        raise ConnectorError("Could not reach the ATS") from exc
+    finally:
+        resp.close()
+        client.close()
+
+
+def _open_board(
+    url: str, cache: BoardHttpCache | None = None
+) -> tuple[Iterator[bytes], BodyRecorder | None]:
+    """Start downloading a board; returns its body as a stream of byte chunks,
+    with the recorder of its cache copy (None without a ``cache``).
+
+    The request is sent and its status checked eagerly, so an unknown board
+    raises here rather than mid-ingest; the body is then read lazily as the
+    caller consumes it. With a ``cache`` the request is conditional: a ``304``
+    raises ``NotModified``. Monkeypatched in tests.
+    """
+    entry = cache.lookup(url) if cache is not None else None
+    client = _client()
+    try:
+        request = client.build_request("GET", url, headers=conditional_headers(entry))
+        # Times the request and response head; the body streams lazily.
+        with span("http", "discovery.open_board"):
+            resp = client.send(request, stream=True)
+    except httpx.HTTPError as exc:
+        client.close()
+        raise ConnectorError("Could not reach the ATS") from exc
+    try:
+        _check_response(resp, entry)
+    except Exception:
+        resp.close()
+        client.close()
+        raise
+    recorder = cache.recorder(url, resp) if cache is not None else None
+    return _stream_body(client, resp, recorder), recorder
+
+
+def async_client(max_connections: int = 20) -> httpx.AsyncClient:
+    """One pooled client for a concurrent multi-board fetch.
+
+    Connections are kept alive and reused across boards on the same ATS host,
+    so refreshing many boards doesn't pay a TCP/TLS handshake per board.
+    """
+    return httpx.AsyncClient(
+        timeout=_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        headers=_HEADERS,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
+async def _read_board_async(
+    client: httpx.AsyncClient, url: str, cache: BoardHttpCache | None = None
+) -> tuple[Iterator[bytes], BodyRecorder | None, asyncio.Task]:
+    """Async ``_open_board`` over a shared client (cache I/O runs off-loop).
+
+    The status is checked eagerly, as in ``_open_board``; the body is then
+    downloaded on the event loop by a background task, under the same cap,
+    into a small bounded queue. Returns the chunk iterator (for the worker
+    thread that decodes and upserts the postings), the cache recorder and the
+    download task, which stalls whenever the consumer falls behind.
+    """
+    entry = await asyncio.to_thread(cache.lookup, url) if cache is not None else None
+    try:
+        request = client.build_request("GET", url, headers=conditional_headers(entry))
+        # Times the request and response head; the body streams in the task.
+        with span("http", "discovery.read_board"):
+            resp = await client.send(request, stream=True)
+    except httpx.HTTPError as exc:
+        raise ConnectorError("Could not reach the ATS") from exc
+    try:
+        _check_response(resp, entry)
+    except Exception:
+        await resp.aclose()
+        raise
+    recorder = cache.recorder(url, resp) if cache is not None else None
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUED_CHUNKS)
+    download = asyncio.create_task(_pump_body(resp, recorder, queue))
+    return _queued_chunks(queue, asyncio.get_running_loop()), recorder, download
+
+
+async def _pump_body(
+    resp: httpx.Response, recorder: BodyRecorder | None, queue: asyncio.Queue
+) -> None:
+    """Download ``resp``'s body into ``queue``, ending with ``None`` on success
+    or with the exception that stopped it (for ``_queued_chunks`` to raise)."""
+    total = 0
+    try:
+        async for chunk in resp.aiter_bytes(_CHUNK_BYTES):
+            total += len(chunk)
+            if total > _MAX_BYTES:
+                raise ConnectorError("ATS response too large")
+            if recorder is not None:
+                recorder.feed(chunk)
+            await queue.put(chunk)
+        if recorder is not None:
+            recorder.complete = True
+        end: Exception | None = None
+    except httpx.HTTPError as exc:
+        end = ConnectorError("Could not reach the ATS")
+        end.__cause__ = exc
+    except Exception as exc:
+        end = exc
+    finally:
+        await resp.aclose()
+    await queue.put(end)
+
+
+def _queued_chunks(
+    queue: asyncio.Queue, loop: asyncio.AbstractEventLoop
+) -> Iterator[bytes]:
+    """Body chunks from ``_pump_body``; blocks a worker thread (never the
+    event loop) until each one arrives."""
+    while True:
+        item = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+        if item is None:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
 
 
 def _parse_iso(value) -> datetime | None:
@@ -91,36 +290,31 @@ def _parse_epoch_ms(value) -> datetime | None:
 # Greenhouse
 # --------------------------------------------------------------------------- #
 
-def fetch_greenhouse(token: str, company: str | None = None) -> list[dict]:
-    url = f"https://boards-api.greenhouse.io/v1/boards/{token}/jobs?content=true"
-    data = _get_json(url)
-    jobs = data.get("jobs", []) if isinstance(data, dict) else []
-    company_name = company or token
-    out: list[dict] = []
-    for job in jobs:
-        content_html = job.get("content") or ""
-        # Greenhouse double-encodes HTML entities in `content`.
-        description, _ = html_to_text(_unescape_basic(content_html))
-        location = normalize_location((job.get("location") or {}).get("name"))
-        sal_min, sal_max = parse_salary(description)
-        out.append(
-            {
-                "source": "greenhouse",
-                "sourceId": str(job.get("id")),
-                "company": company_name,
-                "title": (job.get("title") or "").strip(),
-                "location": location,
-                # Greenhouse exposes no structured commitment field; the enrich
-                # step infers it from title/description (defaulting to full-time).
-                "employmentType": None,
-                "url": job.get("absolute_url"),
-                "description": description,
-                "salaryMin": sal_min,
-                "salaryMax": sal_max,
-                "postedAt": _parse_iso(job.get("updated_at")),
-            }
-        )
-    return out
+def _greenhouse_url(token: str) -> str:
+    return f"https://boards-api.greenhouse.io/v1/boards/{token}/jobs?content=true"
+
+
+def _greenhouse_posting(job: dict, company_name: str) -> dict:
+    content_html = job.get("content") or ""
+    # Greenhouse double-encodes HTML entities in `content`.
+    description, _ = html_to_text(_unescape_basic(content_html))
+    location = normalize_location((job.get("location") or {}).get("name"))
+    sal_min, sal_max = parse_salary(description)
+    return {
+        "source": "greenhouse",
+        "sourceId": str(job.get("id")),
+        "company": company_name,
+        "title": (job.get("title") or "").strip(),
+        "location": location,
+        # Greenhouse exposes no structured commitment field; the enrich
+        # step infers it from title/description (defaulting to full-time).
+        "employmentType": None,
+        "url": job.get("absolute_url"),
+        "description": description,
+        "salaryMin": sal_min,
+        "salaryMax": sal_max,
+        "postedAt": _parse_iso(job.get("updated_at")),
+    }
 
 
 def _unescape_basic(s: str) -> str:
@@ -133,34 +327,27 @@ def _unescape_basic(s: str) -> str:
 # Lever
 # --------------------------------------------------------------------------- #
 
-def fetch_lever(token: str, company: str | None = None) -> list[dict]:
-    url = f"https://api.lever.co/v0/postings/{token}?mode=json"
-    data = _get_json(url)
-    postings = data if isinstance(data, list) else []
-    company_name = company or token
-    out: list[dict] = []
-    for post in postings:
-        categories = post.get("categories") or {}
-        description = (post.get("descriptionPlain") or "").strip()
-        sal_min, sal_max = parse_salary(description)
-        out.append(
-            {
-                "source": "lever",
-                "sourceId": str(post.get("id")),
-                "company": company_name,
-                "title": (post.get("text") or "").strip(),
-                "location": normalize_location(categories.get("location")),
-                "employmentType": normalize_employment_type(
-                    categories.get("commitment")
-                ),
-                "url": post.get("hostedUrl"),
-                "description": description,
-                "salaryMin": sal_min,
-                "salaryMax": sal_max,
-                "postedAt": _parse_epoch_ms(post.get("createdAt")),
-            }
-        )
-    return out
+def _lever_url(token: str) -> str:
+    return f"https://api.lever.co/v0/postings/{token}?mode=json"
+
+
+def _lever_posting(post: dict, company_name: str) -> dict:
+    categories = post.get("categories") or {}
+    description = (post.get("descriptionPlain") or "").strip()
+    sal_min, sal_max = parse_salary(description)
+    return {
+        "source": "lever",
+        "sourceId": str(post.get("id")),
+        "company": company_name,
+        "title": (post.get("text") or "").strip(),
+        "location": normalize_location(categories.get("location")),
+        "employmentType": normalize_employment_type(categories.get("commitment")),
+        "url": post.get("hostedUrl"),
+        "description": description,
+        "salaryMin": sal_min,
+        "salaryMax": sal_max,
+        "postedAt": _parse_epoch_ms(post.get("createdAt")),
+    }
 
 
 # --------------------------------------------------------------------------- #
@@ -181,102 +368,266 @@ def _with_remote(location: str | None) -> str | None:
     return f"{location} (Remote)"
 
 
-def fetch_ashby(token: str, company: str | None = None) -> list[dict]:
-    url = (
+def _ashby_url(token: str) -> str:
+    return (
         "https://api.ashbyhq.com/posting-api/job-board/"
         f"{token}?includeCompensation=true"
     )
-    data = _get_json(url)
-    jobs = data.get("jobs", []) if isinstance(data, dict) else []
-    company_name = company or (data.get("name") if isinstance(data, dict) else None) or token
-    out: list[dict] = []
-    for job in jobs:
-        description = (job.get("descriptionPlain") or "").strip()
-        if not description and job.get("descriptionHtml"):
-            description, _ = html_to_text(job["descriptionHtml"])
-        location = normalize_location(job.get("location"))
-        if job.get("isRemote"):
-            location = _with_remote(location)
-        sal_min, sal_max = parse_salary(description)
-        out.append(
-            {
-                "source": "ashby",
-                "sourceId": str(job.get("id")),
-                "company": company_name,
-                "title": (job.get("title") or "").strip(),
-                "location": location,
-                "employmentType": normalize_employment_type(
-                    job.get("employmentType")
-                ),
-                "url": job.get("jobUrl") or job.get("applyUrl"),
-                "description": description,
-                "salaryMin": sal_min,
-                "salaryMax": sal_max,
-                "postedAt": _parse_iso(job.get("publishedAt")),
-            }
-        )
-    return out
+
+
+def _ashby_posting(job: dict, company_name: str) -> dict:
+    description = (job.get("descriptionPlain") or "").strip()
+    if not description and job.get("descriptionHtml"):
+        description, _ = html_to_text(job["descriptionHtml"])
+    location = normalize_location(job.get("location"))
+    if job.get("isRemote"):
+        location = _with_remote(location)
+    sal_min, sal_max = parse_salary(description)
+    return {
+        "source": "ashby",
+        "sourceId": str(job.get("id")),
+        "company": company_name,
+        "title": (job.get("title") or "").strip(),
+        "location": location,
+        "employmentType": normalize_employment_type(job.get("employmentType")),
+        "url": job.get("jobUrl") or job.get("applyUrl"),
+        "description": description,
+        "salaryMin": sal_min,
+        "salaryMax": sal_max,
+        "postedAt": _parse_iso(job.get("publishedAt")),
+    }
 
 
 # --------------------------------------------------------------------------- #
 # Recruitee
 # --------------------------------------------------------------------------- #
 
-def fetch_recruitee(token: str, company: str | None = None) -> list[dict]:
-    url = f"https://{token}.recruitee.com/api/offers/"
-    data = _get_json(url)
-    offers = data.get("offers", []) if isinstance(data, dict) else []
-    company_name = company or token
-    out: list[dict] = []
-    for offer in offers:
-        html = " ".join(
-            part
-            for part in (offer.get("description"), offer.get("requirements"))
-            if part
-        )
-        description, _ = html_to_text(html)
-        location = normalize_location(offer.get("location"))
-        if offer.get("remote"):
-            location = _with_remote(location)
-        sal_min, sal_max = parse_salary(description)
-        out.append(
-            {
-                "source": "recruitee",
-                "sourceId": str(offer.get("id")),
-                "company": company_name,
-                "title": (offer.get("title") or "").strip(),
-                "location": location,
-                "employmentType": normalize_employment_type(
-                    offer.get("employment_type_code")
-                ),
-                "url": offer.get("careers_url") or offer.get("careers_apply_url"),
-                "description": description,
-                "salaryMin": sal_min,
-                "salaryMax": sal_max,
-                "postedAt": _parse_iso(
-                    offer.get("published_at") or offer.get("created_at")
-                ),
-            }
-        )
-    return out
-
-
-# source name -> connector callable
-CONNECTORS = {
-    "greenhouse": fetch_greenhouse,
-    "lever": fetch_lever,
-    "ashby": fetch_ashby,
-    "recruitee": fetch_recruitee,
+def _recruitee_url(token: str) -> str:
+    return f"https://{token}.recruitee.com/api/offers/"
+
+
+def _recruitee_posting(offer: dict, company_name: str) -> dict:
+    html = " ".join(
+        part for part in (offer.get("description"), offer.get("requirements")) if part
+    )
+    description, _ = html_to_text(html)
+    location = normalize_location(offer.get("location"))
+    if offer.get("remote"):
+        location = _with_remote(location)
+    sal_min, sal_max = parse_salary(description)
+    return {
+        "source": "recruitee",
+        "sourceId": str(offer.get("id")),
+        "company": company_name,
+        "title": (offer.get("title") or "").strip(),
+        "location": location,
+        "employmentType": normalize_employment_type(offer.get("employment_type_code")),
+        "url": offer.get("careers_url") or offer.get("careers_apply_url"),
+        "description": description,
+        "salaryMin": sal_min,
+        "salaryMax": sal_max,
+        "postedAt": _parse_iso(offer.get("published_at") or offer.get("created_at")),
+    }
+
+
+@dataclass(frozen=True)
+class _BoardApi:
+    """How to fetch one ATS's board and turn its body into postings."""
+
+    url: Callable[[str], str]
+    # Top-level member holding the postings array (None: the body is the array).
+    items_key: str | None
+    to_posting: Callable[[dict, str], dict]
+    # Top-level member naming the board, used when no display name is given.
+    name_key: str | None = None
+    # Member of a raw posting holding its ATS id (the normalized ``sourceId``).
+    id_key: str = "id"
+
+
+_BOARD_API = {
+    "greenhouse": _BoardApi(_greenhouse_url, "jobs", _greenhouse_posting),
+    "lever": _BoardApi(_lever_url, None, _lever_posting),
+    "ashby": _BoardApi(_ashby_url, "jobs", _ashby_posting, name_key="name"),
+    "recruitee": _BoardApi(_recruitee_url, "offers", _recruitee_posting),
 }
 
-SUPPORTED_SOURCES = tuple(CONNECTORS)
+SUPPORTED_SOURCES = tuple(_BOARD_API)
 
 
-def fetch_source(source: str, token: str, company: str | None = None) -> list[dict]:
-    """Dispatch to the connector for ``source``; validates the board token."""
-    connector = CONNECTORS.get(source)
-    if connector is None:
+def _check_board(source: str, token: str) -> None:
+    if source not in _BOARD_API:
         raise ConnectorError(f"Unsupported source: {source}")
     if not valid_token(token):
         raise ConnectorError("Invalid company board token")
-    return connector(token, company)
+
+
+def to_posting(source: str, item: dict, company_name: str) -> dict:
+    """Normalize one raw posting from ``source``'s board."""
+    return _BOARD_API[source].to_posting(item, company_name)
+
+
+def source_id(source: str, item: dict) -> str:
+    """The ``sourceId`` a raw posting from ``source`` normalizes to."""
+    return str(item.get(_BOARD_API[source].id_key))
+
+
+class BoardStream:
+    """One fetched board: its raw ``board_items`` plus the pending cache copy.
+
+    Iterating yields ``(raw posting, company name)`` pairs. ``commit`` stores
+    the download's validators and body (see ``httpcache.BodyRecorder``); call
+    it only once the postings are written, so a board whose body failed to
+    parse or to store is downloaded in full next time rather than answering
+    ``304`` for postings that were never stored.
+    """
+
+    def __init__(
+        self,
+        items: Iterator[tuple[dict, str]],
+        recorder: BodyRecorder | None = None,
+        download: asyncio.Task | None = None,
+    ):
+        self._items = items
+        self._recorder = recorder
+        self._download = download
+
+    def __iter__(self) -> Iterator[tuple[dict, str]]:
+        return self._items
+
+    def commit(self) -> None:
+        if self._recorder is not None:
+            self._recorder.save()
+
+    async def aclose(self) -> None:
+        """Stop an async download the consumer gave up on (see
+        ``open_source_async``); a finished one is left as is."""
+        if self._download is None or self._download.done():
+            return
+        self._download.cancel()
+        try:
+            await self._download
+        except asyncio.CancelledError:
+            pass
+
+
+def board_items(
+    source: str, token: str, company: str | None, chunks: Iterable[bytes]
+) -> Iterator[tuple[dict, str]]:
+    """``(raw posting, company name)`` pairs from a board body, one at a time.
+
+    Without a display ``company``, a board named in its body (Ashby's
+    ``name``) is named from it. The name usually precedes the postings array;
+    when it hasn't by the first posting, postings are held back until the body
+    has been read, since it may follow the array. The body is drained to the
+    end even after the postings array closes, so the streamed download
+    completes (and its cache copy can be committed).
+    """
+    api = _BOARD_API[source]
+    chunks = iter(chunks)
+    meta: dict = {}
+    held: list[dict] = []
+    try:
+        for item in iter_items(chunks, api.items_key, meta if api.name_key else None):
+            if not isinstance(item, dict):
+                continue
+            name = company or (meta.get(api.name_key) if api.name_key else None)
+            if name is None and api.name_key:
+                held.append(item)
+                continue
+            yield item, name or token
+        for _ in chunks:
+            pass
+    except ValueError as exc:
+        raise ConnectorError("ATS returned invalid JSON") from exc
+    name = meta.get(api.name_key) if api.name_key else None
+    for item in held:
+        yield item, name or token
+
+
+def open_source(
+    source: str,
+    token: str,
+    company: str | None = None,
+    *,
+    cache: BoardHttpCache | None = None,
+    force: bool = False,
+) -> BoardStream:
+    """Stream the board for ``source`` as raw ``board_items``.
+
+    Validates the board token and sends the request before returning, so an
+    unknown board or a ``304`` (``NotModified``, unless ``force``, in which case
+    the cached body is replayed) raises here; the body is then decoded lazily
+    as the caller consumes it.
+    """
+    _check_board(source, token)
+    try:
+        chunks, recorder = _open_board(_BOARD_API[source].url(token), cache)
+    except NotModified as exc:
+        if not force:
+            raise
+        chunks, recorder = exc.body(), None
+    return BoardStream(board_items(source, token, company, chunks), recorder)
+
+
+def _normalized(source: str, board: BoardStream) -> Iterator[dict]:
+    for item, name in board:
+        yield to_posting(source, item, name)
+    board.commit()
+
+
+def iter_source(
+    source: str,
+    token: str,
+    company: str | None = None,
+    *,
+    cache: BoardHttpCache | None = None,
+    force: bool = False,
+) -> Iterator[dict]:
+    """``open_source``, normalized inline posting by posting. With a ``cache``,
+    the download's copy is committed once every posting has been read."""
+    return _normalized(source, open_source(source, token, company, cache=cache, force=force))
+
+
+def fetch_source(
+    source: str,
+    token: str,
+    company: str | None = None,
+    *,
+    cache: BoardHttpCache | None = None,
+    force: bool = False,
+) -> list[dict]:
+    """``iter_source``, collected into a list."""
+    return list(iter_source(source, token, company, cache=cache, force=force))
+
+
+def board_host(source: str, token: str) -> str:
+    """The ATS host a board is fetched from (the unit of per-host throttling)."""
+    _check_board(source, token)
+    return urlparse(_BOARD_API[source].url(token)).hostname or source
+
+
+async def open_source_async(
+    client: httpx.AsyncClient,
+    source: str,
+    token: str,
+    company: str | None = None,
+    *,
+    cache: BoardHttpCache | None = None,
+    force: bool = False,
+) -> BoardStream:
+    """``open_source`` over a shared async client.
+
+    The body downloads on the event loop while the returned postings are
+    decoded from it, so consume them (and commit the cache copy) in a worker
+    thread, as ``service`` does while upserting, then ``await aclose()`` in
+    case the consumer stopped before the body's end.
+    """
+    _check_board(source, token)
+    url = _BOARD_API[source].url(token)
+    try:
+        chunks, recorder, download = await _read_board_async(client, url, cache)
+    except NotModified as exc:
+        if not force:
+            raise
+        chunks, recorder, download = exc.body(), None, None
+    return BoardStream(board_items(source, token, company, chunks), recorder, download)
@@ -7,6 +7,16 @@ Computed once at ingest and stored so listing/filtering is cheap:
   underpaid, spammy title) plus a 0–100 `qualityScore`.
 * **Dedupe** — a `dedupeKey` (company + title + location) so the same role posted
   to several boards collapses into one clean listing.
+* **Search** — `searchTokens` / `titleTokens`, the prebuilt token index behind
+  text search (see `app.discovery.search`).
+* **Match signals** — what the matching engine finds in the posting: its
+  `conceptIds`, `roleFamilies`, canonical `skills` and `sectionTerms`, stamped
+  with the `analyzerVersion` that produced them. Best-match ranking prefilters
+  on them (see `app.matching.rankings`) and company research / interview prep
+  read `skills` instead of re-extracting them. When the taxonomy changes,
+  `python -m app.discovery.reanalyze` re-derives them for stored postings.
+* **Fingerprint** — a `contentHash` of the normalized fields so a re-ingest can
+  skip postings that haven't changed at the ATS.
 
 Every function is pure and unit-testable; the heuristics are intentionally
 conservative so a flag means something.
@@ -14,9 +24,14 @@ conservative so a flag means something.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 
 from app.discovery.normalize import infer_employment_type
+from app.discovery.search import search_tokens
+from app.matching.analyze import ANALYZER_VERSION, analyze_job
+from app.matching.keywords import extract_skills
 
 # Annual salary below this looks like a data error or a genuinely underpaid
 # full-time role; flagged for the user to scrutinise.
@@ -224,6 +239,77 @@ def dedupe_key(company: str | None, title: str | None, location: str | None) ->
     return "|".join(parts)
 
 
+# --------------------------- fingerprint -----------------------------------
+
+# The normalized (connector-produced) fields a posting's fingerprint covers.
+# Everything stored is either one of these or derived from them by ``enrich``.
+FINGERPRINT_FIELDS = (
+    "source",
+    "sourceId",
+    "company",
+    "title",
+    "location",
+    "employmentType",
+    "url",
+    "description",
+    "salaryMin",
+    "salaryMax",
+    "postedAt",
+)
+# Bump when ``enrich`` changes so the next ingest re-derives every posting
+# instead of skipping the ones whose source content is unchanged.
+FINGERPRINT_VERSION = 4
+
+
+def content_hash(posting: dict) -> str:
+    """Stable hash of a posting's normalized content (plus the enrich version)."""
+    payload = {field: posting.get(field) for field in FINGERPRINT_FIELDS}
+    payload["_v"] = FINGERPRINT_VERSION
+    blob = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def match_text(posting: dict) -> str:
+    """The text a posting is matched on: its title, then its description."""
+    return f"{posting.get('title') or ''}\n{posting.get('description') or ''}".strip()
+
+
+def _section(term) -> str:
+    if term.required:
+        return "required"
+    if term.preferred:
+        return "preferred"
+    return "other"
+
+
+def match_signals(posting: dict) -> dict:
+    """The matching engine's view of the posting, computed from its text once.
+
+    ``sectionTerms`` buckets every analyzed term key (concept id or keyphrase)
+    by the section it was found in, heaviest first. ``skills`` are the
+    canonical skills of the description alone, as readers always extracted.
+    """
+    job = analyze_job(match_text(posting))
+    sections: dict[str, list[str]] = {"required": [], "preferred": [], "other": []}
+    for term in sorted(job.terms, key=lambda t: (-t.weight, t.key)):
+        sections[_section(term)].append(term.key)
+    return {
+        "conceptIds": sorted({t.key for t in job.terms if t.is_concept}),
+        "roleFamilies": job.role_families,
+        "skills": extract_skills(posting.get("description") or ""),
+        "sectionTerms": sections,
+        "analyzerVersion": ANALYZER_VERSION,
+    }
+
+
+def posting_skills(posting: dict) -> list[str]:
+    """The posting's canonical skills: stored ones while they're current,
+    otherwise extracted from its description."""
+    if posting.get("analyzerVersion") == ANALYZER_VERSION and "skills" in posting:
+        return posting["skills"]
+    return extract_skills(posting.get("description") or "")
+
+
 def enrich(posting: dict) -> dict:
     """Compute all derived fields for a normalized posting."""
     flags = quality_flags(posting)
@@ -240,4 +326,6 @@ def enrich(posting: dict) -> dict:
         "dedupeKey": dedupe_key(
             posting.get("company"), posting.get("title"), posting.get("location")
         ),
+        **search_tokens(posting),
+        **match_signals(posting),
     }
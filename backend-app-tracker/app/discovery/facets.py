@@ -0,0 +1,112 @@
+"""Pre-aggregated facet counts for discovered postings (``discovery_facets``).
+
+The location picker (FEAT-30) and the company-research directory used to run
+an unbounded ``$group`` over every discovered posting on each request. Instead,
+ingest keeps one row per ``(field, exact value)`` with the number of postings
+carrying it, updated incrementally as postings are inserted or change, so a
+facet read is an indexed scan of that field's few hundred rows.
+
+Rows keep the exact stored spelling; readers that merge case/whitespace
+variants (``service.location_facets``) do so over these rows. A posting with
+no value for a field is counted under ``value: None``.
+
+Ingests of one board are serialized by its ``tracked_boards`` lease and only
+count the writes Mongo confirmed, but a posting whose earlier write state is
+unknown isn't counted at all. ``rebuild`` recomputes every row from
+``discovered_jobs`` in one pass: at startup when the collection is empty (a
+first deploy, or after it's been dropped) and periodically from the board
+refresh loop (``DISCOVERY_FACETS_REBUILD_SECONDS``), so any drift is repaired.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+# Posting fields with maintained facet counts.
+FACET_FIELDS = (
+    "location",
+    "company",
+    "source",
+    "employmentType",
+    "experienceLevel",
+    "workArrangement",
+)
+
+
+def facet_values(doc: dict) -> dict:
+    """The faceted fields of a posting (missing/blank → None)."""
+    return {field: doc.get(field) or None for field in FACET_FIELDS}
+
+
+def count_change(deltas: Counter, old: dict | None, new: dict | None) -> None:
+    """Accumulate the facet deltas of a posting going from ``old`` to ``new``.
+
+    Either side may be None (insert / removal) or a raw posting; values that
+    didn't change cost nothing.
+    """
+    for field in FACET_FIELDS:
+        before = (old.get(field) or None) if old is not None else None
+        after = (new.get(field) or None) if new is not None else None
+        if old is not None and new is not None and before == after:
+            continue
+        if old is not None:
+            deltas[(field, before)] -= 1
+        if new is not None:
+            deltas[(field, after)] += 1
+
+
+def apply_deltas(db: Database, deltas: Counter) -> None:
+    """Apply accumulated deltas in one unordered bulk write; drop empty rows."""
+    ops = [
+        UpdateOne(
+            {"field": field, "value": value}, {"$inc": {"count": delta}}, upsert=True
+        )
+        for (field, value), delta in deltas.items()
+        if delta
+    ]
+    if not ops:
+        return
+    db.discovery_facets.bulk_write(ops, ordered=False)
+    if any(delta < 0 for delta in deltas.values()):
+        db.discovery_facets.delete_many({"count": {"$lte": 0}})
+
+
+def rebuild(db: Database) -> None:
+    """Recompute every facet row from ``discovered_jobs``.
+
+    Counts are overwritten in place and stale rows removed afterwards, so
+    readers never see the facets empty while it runs.
+    """
+    for field in FACET_FIELDS:
+        counts: Counter = Counter()
+        for row in db.discovered_jobs.aggregate(
+            [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+        ):
+            counts[row["_id"] or None] += int(row.get("count", 0) or 0)
+        ops = [
+            UpdateOne({"field": field, "value": value}, {"$set": {"count": count}}, upsert=True)
+            for value, count in counts.items()
+        ]
+        if ops:
+            db.discovery_facets.bulk_write(ops, ordered=False)
+        db.discovery_facets.delete_many({"field": field, "value": {"$nin": list(counts)}})
+    db.discovery_facets.delete_many({"field": {"$nin": list(FACET_FIELDS)}})
+
+
+def ensure_built(db: Database) -> None:
+    """Backfill the facet rows if they've never been built."""
+    if db.discovery_facets.estimated_document_count() == 0 and db.discovered_jobs.find_one(
+        {}, {"_id": 1}
+    ):
+        rebuild(db)
+
+
+def read(db: Database, field: str) -> Iterable[dict]:
+    """``{value, count}`` rows for one faceted field (value may be None)."""
+    return db.discovery_facets.find(
+        {"field": field, "count": {"$gt": 0}}, {"_id": 0, "value": 1, "count": 1}
+    )
@@ -0,0 +1,134 @@
+"""Conditional-GET cache for ATS board downloads (``board_http_cache``).
+
+A board endpoint returns the whole board (up to ``connectors._MAX_BYTES``) on
+every request, even when nothing has changed since the last ingest. For each
+board URL we keep the response validators (``ETag`` / ``Last-Modified``) and a
+zlib-compressed copy of the last body; the next fetch sends them back as
+``If-None-Match`` / ``If-Modified-Since``. An ATS that honours them answers
+``304 Not Modified`` with an empty body, and the connector reports the board as
+unchanged (``connectors.NotModified``) without normalizing anything.
+
+The stored body lets a caller that wants the postings anyway (a forced
+re-ingest) rebuild them from the cached copy after a 304, so even a forced
+refresh of an unchanged board is a header-only round trip.
+
+Bodies are streamed, so the copy is compressed chunk by chunk as it is read
+(``BodyRecorder``) and replayed the same way (``iter_cached_body``). A copy is
+only committed once the ingest has stored the postings it carries.
+
+The cache is keyed by URL and takes the collection explicitly, so the
+connectors stay free of database wiring; boards whose ATS sends no validators
+are simply not cached. Entries are stamped with ``enrich.FINGERPRINT_VERSION``
+and ignored once it changes, so bumping it re-derives every board even where
+the ATS would have answered ``304``.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import httpx
+from bson import Binary
+from pymongo.collection import Collection
+
+from app.discovery.enrich import FINGERPRINT_VERSION
+
+_COMPRESS_LEVEL = 6
+_REPLAY_CHUNK_BYTES = 64 * 1024
+
+
+class BoardHttpCache:
+    """Validators and the last compressed body per board URL."""
+
+    def __init__(self, collection: Collection):
+        self._collection = collection
+
+    def lookup(self, url: str) -> dict | None:
+        entry = self._collection.find_one({"url": url})
+        if entry is None or entry.get("version") != FINGERPRINT_VERSION:
+            return None
+        return entry
+
+    def recorder(self, url: str, resp: httpx.Response) -> BodyRecorder:
+        """Start recording a successful response's body as it streams in."""
+        return BodyRecorder(self._collection, url, resp.headers)
+
+
+class BodyRecorder:
+    """Compresses a streamed body chunk by chunk; ``save`` stores it.
+
+    The connector marks the body ``complete`` once it has been read to the
+    end, and ``save`` does nothing before that, so a download cut short (too
+    large, dropped connection) never replaces a good copy. The ingest calls
+    ``save`` only after the board's postings are written: validators stored
+    for a body that failed to parse or to upsert would answer every later
+    fetch with a ``304`` for postings that were never stored.
+    """
+
+    def __init__(self, collection: Collection, url: str, headers: httpx.Headers):
+        self._collection = collection
+        self._url = url
+        self._etag = headers.get("etag")
+        self._last_modified = headers.get("last-modified")
+        self._cacheable = bool(self._etag or self._last_modified)
+        self._zip = zlib.compressobj(_COMPRESS_LEVEL)
+        self._parts: list[bytes] = []
+        self._size = 0
+        self.complete = False
+
+    def feed(self, chunk: bytes) -> None:
+        if self._cacheable:
+            self._size += len(chunk)
+            self._parts.append(self._zip.compress(chunk))
+
+    def save(self) -> None:
+        """Store the body, or forget the URL if it can't be revalidated (the
+        ATS sent no validators). A no-op for a body not read to the end."""
+        if not self.complete:
+            return
+        if not self._cacheable:
+            self._collection.delete_one({"url": self._url})
+            return
+        self._parts.append(self._zip.flush())
+        self._collection.update_one(
+            {"url": self._url},
+            {
+                "$set": {
+                    "etag": self._etag,
+                    "lastModified": self._last_modified,
+                    "body": Binary(b"".join(self._parts)),
+                    "size": self._size,
+                    "fetchedAt": datetime.now(tz=timezone.utc),
+                    "version": FINGERPRINT_VERSION,
+                }
+            },
+            upsert=True,
+        )
+
+
+def conditional_headers(entry: dict | None) -> dict[str, str]:
+    """``If-None-Match`` / ``If-Modified-Since`` for a cached entry."""
+    if not entry:
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("lastModified"):
+        headers["If-Modified-Since"] = entry["lastModified"]
+    return headers
+
+
+def iter_cached_body(entry: dict) -> Iterator[bytes]:
+    """Replay the body stored with ``entry`` as decompressed chunks."""
+    unzip = zlib.decompressobj()
+    data = bytes(entry["body"])
+    while data:
+        chunk = unzip.decompress(data, _REPLAY_CHUNK_BYTES)
+        if chunk:
+            yield chunk
+        data = unzip.unconsumed_tail
+    tail = unzip.flush()
+    if tail:
+        yield tail
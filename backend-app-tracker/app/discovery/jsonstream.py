@@ -0,0 +1,152 @@
+"""Incremental JSON reader for ATS board bodies.
+
+A board response is one JSON document whose bulk is a single array of
+postings — top-level for Lever, under ``"jobs"`` for Greenhouse/Ashby, under
+``"offers"`` for Recruitee. ``iter_items`` walks the body as byte chunks
+arrive and yields that array's elements one at a time, so neither the full
+body text nor the full object tree is ever held in memory; only the element
+being decoded (plus one read-ahead chunk) is.
+
+Each element is decoded with the stdlib ``json`` decoder, so values come out
+exactly as ``json.loads`` would produce them. Malformed JSON raises
+``ValueError`` (``json.JSONDecodeError``).
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+
+_DECODER = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+# Drop consumed text from the buffer once this much has been read past.
+_COMPACT_AT = 64 * 1024
+
+
+def _number_may_continue(obj, buf: str, end: int) -> bool:
+    if isinstance(obj, bool) or not isinstance(obj, (int, float)):
+        return False
+    return end == len(buf) or buf[end] in _NUMBER_CHARS
+
+
+class _Reader:
+    """Pull-based cursor over a chunked UTF-8 JSON body."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk's text; False once the body is exhausted."""
+        while not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                text = self._utf8.decode(b"", final=True)
+            else:
+                text = self._utf8.decode(chunk)
+            if text:
+                if self.pos > _COMPACT_AT:
+                    self.buf = self.buf[self.pos :]
+                    self.pos = 0
+                self.buf += text
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of body), not consumed."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by a chunk boundary decodes as its prefix ("1." as
+            # 1); only accept it once a non-number character follows (or EOF).
+            if not _number_may_continue(obj, self.buf, end) or not self._fill():
+                self.pos = end
+                return obj
+
+
+def _array(reader: _Reader) -> Iterator:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def _member_array(reader: _Reader, key: str, meta: dict | None) -> Iterator:
+    """Within a top-level object, find member ``key`` and stream its array,
+    then read the object's remaining members through to its closing brace."""
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    found = False
+    while True:
+        name = reader.value()
+        if not isinstance(name, str):
+            raise json.JSONDecodeError("Expected a member name", reader.buf, reader.pos)
+        reader.expect(":")
+        if name == key and not found and reader.peek() == "[":
+            found = True
+            yield from _array(reader)
+        else:
+            value = reader.value()
+            if meta is not None and not isinstance(value, (dict, list)):
+                meta[name] = value
+        if reader.expect(",}") == "}":
+            return
+
+
+def iter_items(
+    chunks: Iterable[bytes], key: str | None = None, meta: dict | None = None
+) -> Iterator:
+    """Yield the elements of the body's postings array one at a time.
+
+    ``key`` names the top-level object member holding the array (``None`` when
+    the body is the array itself). A well-formed body of the wrong shape
+    yields nothing, like ``data.get(key, [])`` on a non-dict would. When ``meta`` is given,
+    the object's top-level scalar members (e.g. Ashby's board ``name``) are
+    recorded in it — those before the array by the time its first element is
+    yielded, those after it once the iterator is exhausted. An object body is
+    read to its closing brace, so one cut short after the array still fails.
+    """
+    reader = _Reader(chunks)
+    first = reader.peek()
+    if not first:
+        raise json.JSONDecodeError("Empty body", reader.buf, reader.pos)
+    if key is None and first == "[":
+        yield from _array(reader)
+    elif key is not None and first == "{":
+        yield from _member_array(reader, key, meta)
+    else:
+        reader.value()  # wrong shape: still reject a malformed body
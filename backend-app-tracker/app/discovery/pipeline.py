@@ -0,0 +1,191 @@
+"""CPU stage of ingest: raw ATS postings → upsert-ready documents.
+
+Normalizing a posting (``html_to_text``, ``parse_salary``) and enriching it
+(``enrich.enrich``) is pure-Python regex work. Done inline it pins one core and
+blocks the ingest thread for the whole board. This module isolates that work
+as a pure function over a *chunk* of raw postings (``process_chunk``) so it can
+run either in-process (the default) or on an optional process pool sized by
+``DISCOVERY_ENRICH_WORKERS``. Both the ingest route and the background refresh
+go through ``process_items``, and both modes run the same functions on the same
+inputs, so the documents they produce are identical — and come back in board
+order, so batches and counts are too.
+
+A posting whose content hash matches the stored copy is reported as
+``SKIPPED`` before enrichment, exactly as the serial path always did.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+
+from app.config import settings
+from app.discovery.connectors import source_id, to_posting
+from app.discovery.enrich import content_hash, enrich
+
+# Marker for a posting whose content hash is unchanged since the last ingest.
+SKIPPED = "skipped"
+
+# Stored description size cap (characters).
+_DESCRIPTION_CAP = 5000
+
+
+def prepare_posting(posting: dict, token: str, now: datetime) -> dict | None:
+    """Bound a normalized posting for storage, or None if it's unusable."""
+    if not posting.get("sourceId") or not posting.get("title"):
+        return None
+    # ATS posting ids are unique per board, not globally, so the dedupe key
+    # includes the board token.
+    posting["boardToken"] = token
+    # Bound stored/served description size.
+    posting["description"] = (posting.get("description") or "")[:_DESCRIPTION_CAP]
+    posting["updatedAt"] = now
+    return posting
+
+
+def process_item(
+    source: str,
+    item: dict,
+    company_name: str,
+    token: str,
+    now: datetime,
+    known: dict[str, str],
+) -> dict | str | None:
+    """Normalize, fingerprint and enrich one raw posting.
+
+    Returns the document to upsert, ``SKIPPED`` when its content hash matches
+    ``known`` (sourceId → stored hash), or None when it's unusable.
+    """
+    doc = prepare_posting(to_posting(source, item, company_name), token, now)
+    if doc is None:
+        return None
+    doc["contentHash"] = content_hash(doc)
+    if known.get(doc["sourceId"]) == doc["contentHash"]:
+        return SKIPPED
+    # Derived eligibility/quality/dedupe signals (computed once at ingest).
+    doc.update(enrich(doc))
+    return doc
+
+
+def process_chunk(
+    source: str,
+    token: str,
+    now: datetime,
+    chunk: list[tuple[dict, str]],
+    known: dict[str, str],
+) -> list[dict | str | None]:
+    """``process_item`` over a chunk of ``(raw posting, company name)`` pairs.
+
+    Module-level and argument-only so it can be shipped to a pool worker.
+    """
+    return [
+        process_item(source, item, name, token, now, known) for item, name in chunk
+    ]
+
+
+def _known_for(
+    source: str, chunk: list[tuple[dict, str]], known: dict[str, str]
+) -> dict[str, str]:
+    """The entries of ``known`` for the postings in ``chunk``."""
+    ids = (source_id(source, item) for item, _ in chunk)
+    return {sid: known[sid] for sid in ids if sid in known}
+
+
+class EnrichExecutor:
+    """A process pool that runs ``process_chunk`` in parallel, order-preserving.
+
+    At most ``2 × workers`` chunks are in flight, so a large board streams
+    through the pool instead of being materialized up front. Each chunk is
+    shipped with only the stored hashes of its own postings, not the board's
+    whole ``known`` map. Workers are
+    spawned (not forked) so they never inherit the server's threads or open
+    sockets.
+    """
+
+    def __init__(self, workers: int, chunk_size: int = 100):
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def process(
+        self,
+        source: str,
+        token: str,
+        now: datetime,
+        items: Iterable[tuple[dict, str]],
+        known: dict[str, str],
+    ) -> Iterator[dict | str | None]:
+        items = iter(items)
+        in_flight: deque[Future] = deque()
+        while True:
+            while len(in_flight) < 2 * self.workers:
+                chunk = list(islice(items, self.chunk_size))
+                if not chunk:
+                    break
+                hashes = _known_for(source, chunk, known)
+                in_flight.append(
+                    self._pool.submit(process_chunk, source, token, now, chunk, hashes)
+                )
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def process_items(
+    source: str,
+    token: str,
+    now: datetime,
+    items: Iterable[tuple[dict, str]],
+    known: dict[str, str],
+    executor: EnrichExecutor | None = None,
+) -> Iterator[dict | str | None]:
+    """Run the CPU stage over a board's raw postings, lazily and in order.
+
+    Serial (in the calling thread) when ``executor`` is None; otherwise chunks
+    are fanned out to the pool.
+    """
+    if executor is not None:
+        return executor.process(source, token, now, items, known)
+    return (
+        process_item(source, item, name, token, now, known) for item, name in items
+    )
+
+
+_executor: EnrichExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> EnrichExecutor | None:
+    """The shared enrichment pool, or None when ``DISCOVERY_ENRICH_WORKERS`` is 0.
+
+    Created on first use so processes that never ingest never spawn workers.
+    """
+    global _executor
+    if settings.discovery_enrich_workers <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = EnrichExecutor(
+                settings.discovery_enrich_workers, settings.discovery_enrich_chunk_size
+            )
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the shared pool (app shutdown)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
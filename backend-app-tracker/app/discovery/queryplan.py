@@ -0,0 +1,106 @@
+"""Startup report of Discover query shapes that still need a collection scan.
+
+``database.ensure_indexes`` creates compound indexes for the common
+filter-plus-sort shapes of the Discover feed and the job-alert match counts.
+``QUERY_SHAPES`` lists those shapes as filter criteria, turned into Mongo
+filters by the same ``criteria_query`` the feed and saved alerts use, so they
+can't drift from the real queries. At startup each is run through ``explain``
+(query planner only — nothing is executed) and any whose winning plan contains
+a ``COLLSCAN`` is logged, so a missing index shows up in the logs instead of as
+a slow page.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from pymongo.errors import PyMongoError
+
+from app.discovery.service import TEXT_SEARCH, criteria_query
+from app.metrics.queries import plan_stages
+
+logger = logging.getLogger("careerlog.discovery")
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """A named, representative query: discovery criteria (camelCase, as in
+    ``CRITERIA_FIELDS``) plus any raw clauses, its sort, and whether it's a
+    count."""
+
+    name: str
+    criteria: dict = field(default_factory=dict)
+    sort: tuple[str, int] | None = ("postedAt", -1)
+    count: bool = False
+    extra: dict = field(default_factory=dict)
+
+    def query(self) -> dict:
+        return {**criteria_query(self.criteria), **self.extra}
+
+
+_SINCE = {"ingestedAt": {"$gt": datetime(2000, 1, 1, tzinfo=timezone.utc)}}
+
+QUERY_SHAPES = (
+    QueryShape("feed"),
+    QueryShape("feed:workArrangement", {"workArrangement": "remote"}),
+    QueryShape("feed:experienceLevel", {"experienceLevel": "senior"}),
+    QueryShape("feed:employmentType", {"employmentType": "full-time"}),
+    QueryShape("feed:source", {"source": "greenhouse"}),
+    QueryShape("feed:sponsorship", {"sponsorshipAvailable": True}),
+    QueryShape("feed:minQuality", {"minQuality": 80}),
+    QueryShape("feed:maxAgeDays", {"maxAgeDays": 7}),
+    QueryShape("feed:salaryMin", {"salaryMin": 100000}, sort=("salaryMax", -1)),
+    QueryShape("feed:text", {"q": "python", "qMode": TEXT_SEARCH}),
+    QueryShape("feed:preferredCompanies", extra={"company": {"$in": ["Acme"]}}),
+    QueryShape("alerts:new", sort=None, count=True, extra=_SINCE),
+    QueryShape(
+        "alerts:new:workArrangement",
+        {"workArrangement": "remote"},
+        sort=None,
+        count=True,
+        extra=_SINCE,
+    ),
+)
+
+
+def _explain(db, shape: QueryShape) -> dict:
+    coll = db.discovered_jobs.name
+    if shape.count:
+        command = {"count": coll, "query": shape.query()}
+    else:
+        command = {"find": coll, "filter": shape.query(), "limit": 25}
+        if shape.sort:
+            command["sort"] = {shape.sort[0]: shape.sort[1], "_id": shape.sort[1]}
+    result = db.command("explain", command, verbosity="queryPlanner")
+    return result.get("queryPlanner", {}).get("winningPlan", {})
+
+
+def collection_scans(db, shapes=QUERY_SHAPES) -> list[str] | None:
+    """Names of the shapes whose winning plan scans the collection, or None
+    when the server can't explain queries."""
+    scans = []
+    for shape in shapes:
+        try:
+            plan = _explain(db, shape)
+        except (PyMongoError, NotImplementedError, TypeError):
+            return None
+        if "COLLSCAN" in plan_stages(plan):
+            scans.append(shape.name)
+    return scans
+
+
+def log_collection_scans(db) -> None:
+    """Log the query shapes that would fall back to a collection scan."""
+    scans = collection_scans(db)
+    if scans is None:
+        logger.info("Query-plan report skipped: explain unavailable")
+    elif scans:
+        logger.warning(
+            "Discover query shapes answered by a collection scan: %s", ", ".join(scans)
+        )
+    else:
+        logger.info(
+            "Query-plan report: all %d Discover shapes use an index", len(QUERY_SHAPES)
+        )
@@ -0,0 +1,79 @@
+"""Backfill: re-derive stored postings' match signals after an analyzer change.
+
+Ingest stamps each posting's match signals (``enrich.match_signals``) with
+``analyze.ANALYZER_VERSION``, which changes whenever the analysis code, the
+concept taxonomy or the stopwords do. Re-ingest only re-enriches postings
+whose source content changed, so after such a change the rest keep signals
+from the old analyzer — readers fall back to extracting skills themselves and
+best-match ranking scores them unfiltered until they're re-analyzed. This
+rewrites them in batches from the stored title and description:
+
+    python -m app.discovery.reanalyze [--batch-size 500] [--limit N]
+
+Only the match-signal fields are written; ``updatedAt`` and ``contentHash``
+are left alone since the posting itself didn't change. Re-running is cheap:
+postings already at the current version are never read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from pymongo import UpdateOne
+
+from app.database import get_db
+from app.discovery.enrich import match_signals
+from app.matching.analyze import ANALYZER_VERSION
+
+logger = logging.getLogger("careerlog.discovery")
+
+_FIELDS = {"title": 1, "description": 1}
+
+
+def stale_query() -> dict:
+    """Postings whose match signals predate the current analyzer."""
+    return {"analyzerVersion": {"$ne": ANALYZER_VERSION}}
+
+
+def backfill(db, batch_size: int = 500, limit: int | None = None) -> dict:
+    """Re-derive match signals for stale postings; returns how many were
+    read and how many were updated."""
+    cursor = db.discovered_jobs.find(stale_query(), _FIELDS).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+    counts = {"scanned": 0, "updated": 0}
+    ops: list[UpdateOne] = []
+
+    def flush() -> None:
+        if ops:
+            counts["updated"] += db.discovered_jobs.bulk_write(ops, ordered=False).modified_count
+            ops.clear()
+
+    for doc in cursor:
+        counts["scanned"] += 1
+        ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": match_signals(doc)}))
+        if len(ops) >= batch_size:
+            flush()
+    flush()
+    logger.info(
+        "reanalyze: %d postings scanned, %d updated (analyzer %s)",
+        counts["scanned"],
+        counts["updated"],
+        ANALYZER_VERSION,
+    )
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    backfill(get_db(), max(1, args.batch_size), args.limit)
+
+
+if __name__ == "__main__":
+    main()
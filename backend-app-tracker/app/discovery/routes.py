@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Literal
 
-from app.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+
+from app.database import get_async_db, get_async_read_db, get_db, get_read_db
 from app.common.auth import get_current_user
-from app.common.responses import success
+from app.common.responses import fast_success, success
 from app.common.errors import raise_error
 from app.discovery import boards, service
 from app.discovery.connectors import SUPPORTED_SOURCES
 from app.discovery.schemas import (
+    BatchIngestRequest,
+    BatchIngestResponse,
     CompanyDirectory,
+    FilterFacets,
     IngestRequest,
     IngestResponse,
     LocationFacets,
@@ -15,6 +21,7 @@ from app.discovery.schemas import (
     ResolveTokenResponse,
     SupportedSources,
 )
+from app.matching import rankings
 from app.preferences import service as preferences_service
 
 router = APIRouter()
@@ -67,11 +74,18 @@ def list_locations(
     current_user_id: str = Depends(get_current_user),
 ):
     """Distinct locations present in postings, for the guided filter (FEAT-30)."""
-    db = get_db()
+    db = get_read_db()
     result = service.location_facets(db, q=q, limit=limit)
     return success(data=LocationFacets(**result).model_dump())
 
 
+@router.get("/facets")
+def list_facets(current_user_id: str = Depends(get_current_user)):
+    """Option counts for the source/type/level/arrangement filters."""
+    db = get_read_db()
+    return success(data=FilterFacets(**service.filter_facets(db)).model_dump())
+
+
 @router.post("/ingest")
 def ingest(
     payload: IngestRequest,
@@ -80,19 +94,45 @@ def ingest(
     """Fetch a company's public board and upsert its postings."""
     db = get_db()
     result = service.ingest(
-        db, payload.source, payload.boardToken, payload.companyName
+        db, payload.source, payload.boardToken, payload.companyName, force=payload.force
     )
     return success(data=IngestResponse(**result).model_dump())
 
 
+@router.post("/ingest/batch")
+def ingest_batch(
+    payload: BatchIngestRequest,
+    current_user_id: str = Depends(get_current_user),
+):
+    """Fetch many public boards concurrently and upsert their postings.
+
+    Boards are downloaded in parallel (throttled per ATS host); a board that
+    fails to fetch is reported in its own result instead of failing the call.
+    """
+    db = get_db()
+    boards = [
+        service.BoardRef(
+            source=b.source, token=b.boardToken, company=b.companyName, force=b.force
+        )
+        for b in payload.boards
+    ]
+    result = service.ingest_boards(db, boards)
+    return success(data=BatchIngestResponse(**result).model_dump())
+
+
 @router.get("/jobs")
-def list_jobs(
+async def list_jobs(
+    background: BackgroundTasks,
     page: int = Query(1, ge=1),
     pageSize: int = Query(25, ge=1, le=100),
     sortBy: str = Query("postedAt"),
     sortOrder: str = Query("desc"),
     collapse: bool = Query(True),
+    cursor: str | None = Query(None, max_length=1024),
+    includeTotal: bool = Query(True),
+    approxTotal: bool = Query(False),
     q: str | None = Query(None),
+    qMode: Literal["substring", "text"] = Query("substring"),
     company: str | None = Query(None),
     location: str | None = Query(None),
     workArrangement: str | None = Query(None),
@@ -113,20 +153,37 @@ def list_jobs(
 
     Duplicates across boards/sources are merged into one listing by default
     (``collapse=true``); pass ``collapse=false`` for the raw per-posting rows.
+    Pass a page's ``meta.nextCursor`` as ``cursor`` to fetch the next one by
+    keyset instead of by page number. ``qMode=text`` searches ``q`` as words
+    (the last one a prefix) across title/company/location/description via the
+    token index; ``sortBy=relevance`` then ranks the best matches first.
+    ``sortBy=matchScore`` ranks by fit against the caller's default résumé,
+    best first, from scores kept current in the background.
     With ``applyPreferences=true`` the caller's hidden companies / job types are
     excluded (and ``preferredOnly=true`` restricts to their preferred employers).
     """
-    db = get_db()
+    db = get_async_read_db()
+    match_prefix = None
+    if sortBy == rankings.MATCH_SCORE:
+        match_prefix = await run_in_threadpool(
+            rankings.prepare_feed,
+            get_db(),
+            current_user_id,
+            first_page=cursor is None,
+            background=background,
+        )
+        db = get_async_db()  # read the scores just written from the primary
 
     preferred = hidden = hidden_types = None
     if applyPreferences or preferredOnly:
-        prefs = preferences_service.get_preferences(db, current_user_id)
+        prefs = await preferences_service.get_preferences_async(db, current_user_id)
         preferred = prefs["preferredCompanies"]
         hidden = prefs["hiddenCompanies"]
         hidden_types = prefs["hiddenEmploymentTypes"]
 
     filters = service.DiscoveryFilters(
         q=q,
+        q_mode=qMode,
         company=company,
         location=location,
         work_arrangement=workArrangement,
@@ -144,7 +201,7 @@ def list_jobs(
         hidden_employment_types=hidden_types,
         preferred_only=preferredOnly,
     )
-    result = service.list_jobs(
+    result = await service.list_jobs_async(
         db,
         filters,
         page=page,
@@ -152,5 +209,9 @@ def list_jobs(
         sort_by=sortBy,
         sort_order=sortOrder,
         collapse=collapse,
+        cursor=cursor,
+        include_total=includeTotal,
+        approximate_total=approxTotal,
+        match_prefix=match_prefix,
     )
-    return success(data=result)
+    return fast_success(result)
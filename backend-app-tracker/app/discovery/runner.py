@@ -0,0 +1,96 @@
+"""Background refresh of tracked discovery boards.
+
+Runs alongside the alert scheduler (``alerts.runner``): every poll it refreshes
+the tracked boards that are due (see ``discovery.tracking``), so
+``discovered_jobs`` stays current and job alerts have new postings to report
+without anyone hitting ``POST /api/discovery/ingest``. Started/stopped from the
+FastAPI lifespan; one pass is ``service.refresh_due_boards_async`` so it can be
+tested without the loop. Every pass is followed by a catch-up of the recently
+used best-match rankings (``matching.rankings``): new rankings are built and
+postings written since (by the refresh or a manual ingest) are scored, off
+the feed request path. Every
+``discovery_facets_rebuild_seconds`` the facet counts are also recomputed
+(``discovery.facets.rebuild``).
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from app.config import settings
+from app.database import get_db
+from app.discovery import facets
+from app.discovery.service import refresh_due_boards_async
+from app.discovery.tracking import seed_known_boards
+from app.matching.rankings import refresh_active as refresh_active_rankings
+
+logger = logging.getLogger("careerlog.discovery")
+
+
+async def _rebuild_facets_if_due(last: float | None) -> float | None:
+    """Rebuild the facet counts when the period has elapsed; returns when the
+    last rebuild ran."""
+    period = settings.discovery_facets_rebuild_seconds
+    if period <= 0 or (last is not None and time.monotonic() - last < period):
+        return last
+    try:
+        await asyncio.to_thread(facets.rebuild, get_db())
+    except Exception:
+        logger.exception("Facet rebuild failed")
+    return time.monotonic()
+
+
+async def _run_loop() -> None:
+    logger.info(
+        "Board refresh started (every %ss, %s boards/pass)",
+        settings.discovery_refresh_poll_seconds,
+        settings.discovery_refresh_batch_size,
+    )
+    try:
+        await asyncio.to_thread(
+            seed_known_boards, get_db(), datetime.now(tz=timezone.utc)
+        )
+    except Exception:
+        logger.exception("Seeding tracked boards failed")
+    # Startup already built the facets if they were missing.
+    facets_rebuilt_at = time.monotonic()
+    while True:
+        try:
+            result = await refresh_due_boards_async(
+                get_db(), datetime.now(tz=timezone.utc)
+            )
+            await asyncio.to_thread(
+                refresh_active_rankings, get_db(), datetime.now(tz=timezone.utc)
+            )
+            if result["refreshed"] or result["notModified"] or result["failed"]:
+                logger.info(
+                    "Refreshed %s board(s), %s unchanged, %s failed",
+                    result["refreshed"],
+                    result["notModified"],
+                    result["failed"],
+                )
+        except Exception:
+            logger.exception("Board refresh run failed")
+        facets_rebuilt_at = await _rebuild_facets_if_due(facets_rebuilt_at)
+        await asyncio.sleep(settings.discovery_refresh_poll_seconds)
+
+
+def start(app) -> None:
+    """Start the refresh task and stash it on app state (if enabled)."""
+    if not settings.discovery_refresh_enabled:
+        logger.info("Board refresh disabled (DISCOVERY_REFRESH_ENABLED=false)")
+        app.state.board_refresh_task = None
+        return
+    app.state.board_refresh_task = asyncio.create_task(_run_loop())
+
+
+async def stop(app) -> None:
+    task = getattr(app.state, "board_refresh_task", None)
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -15,14 +15,59 @@ class IngestRequest(BaseModel):
     companyName: Optional[str] = Field(
         default=None, max_length=200, description="Display name (defaults to the slug)"
     )
+    force: bool = Field(
+        default=False,
+        description="Re-process the board even if the ATS reports it unchanged",
+    )
+
+
+class IngestBatch(BaseModel):
+    """Counts for one ``bulk_write`` batch of upserts."""
+
+    inserted: int
+    updated: int
+    unchanged: int
 
 
 class IngestResponse(BaseModel):
     source: str
     company: str
+    notModified: bool = False  # ATS answered 304 — nothing was parsed or written
     fetched: int
     inserted: int
     updated: int
+    unchanged: int = 0
+    skipped: int = 0  # content hash unchanged since the last ingest — not rewritten
+    batches: list[IngestBatch] = []
+
+
+class BatchIngestRequest(BaseModel):
+    """Ingest many boards in one call; they are fetched concurrently."""
+
+    boards: list[IngestRequest] = Field(min_length=1, max_length=500)
+
+
+class BoardIngestResult(BaseModel):
+    source: str
+    boardToken: str
+    company: str
+    status: str  # ok | not_modified | failed
+    error: Optional[str] = None
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+
+class BatchIngestResponse(BaseModel):
+    boards: list[BoardIngestResult]
+    succeeded: int
+    notModified: int = 0
+    failed: int
+    inserted: int
+    updated: int
+    skipped: int
 
 
 class SupportedSources(BaseModel):
@@ -60,3 +105,17 @@ class LocationFacet(BaseModel):
 class LocationFacets(BaseModel):
     locations: list[LocationFacet]
     noLocationCount: int
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class FilterFacets(BaseModel):
+    """Option counts for the fixed-vocabulary feed filters."""
+
+    source: list[FacetCount]
+    employmentType: list[FacetCount]
+    experienceLevel: list[FacetCount]
+    workArrangement: list[FacetCount]
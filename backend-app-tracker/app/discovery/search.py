@@ -0,0 +1,115 @@
+"""Token search over discovered postings (``qMode=text``).
+
+The default ``q`` filter is a case-insensitive substring ``$regex`` on the
+title, which no index can serve. For text search each posting instead carries
+a prebuilt token index, derived at ingest by ``enrich``:
+
+* ``searchTokens`` — the distinct words of its title, company, location and
+  (the first ``_DESCRIPTION_TOKEN_CAP`` distinct words of) its description;
+* ``titleTokens`` — the distinct words of its title alone, for ranking.
+
+Both are multikey-indexable arrays, so a search is an index lookup: every
+complete query word must be a token, and the last word — still being typed —
+only has to prefix one (an anchored ``$regex``, which uses the index too).
+Results can be ranked by ``relevance``: a title hit weighs
+``_TITLE_WEIGHT`` times a hit anywhere else.
+
+Words are case- and accent-folded; tech spellings like ``c++``, ``c#`` and
+``node.js`` stay whole.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_TOKEN_RE = re.compile(r"[0-9a-z][0-9a-z+#]*(?:\.[0-9a-z+#]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our the to we with you "
+    "your will this that".split()
+)
+_DESCRIPTION_TOKEN_CAP = 300
+_TITLE_WEIGHT = 3
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Distinct search words of ``text``, in order of first appearance."""
+    if not text:
+        return []
+    return [t for t in dict.fromkeys(_TOKEN_RE.findall(_fold(text))) if _indexed(t)]
+
+
+def _indexed(token: str) -> bool:
+    return token not in _STOPWORDS and (len(token) > 1 or token in "cr")
+
+
+def search_tokens(posting: dict) -> dict:
+    """The token-index fields for a normalized posting (see module docstring)."""
+    title = tokenize(posting.get("title"))
+    tokens = dict.fromkeys(title)
+    for field in ("company", "location"):
+        tokens.update(dict.fromkeys(tokenize(posting.get(field))))
+    tokens.update(
+        dict.fromkeys(tokenize(posting.get("description"))[:_DESCRIPTION_TOKEN_CAP])
+    )
+    return {"searchTokens": list(tokens), "titleTokens": title}
+
+
+def parse_query(q: str) -> tuple[list[str], str | None]:
+    """``(complete words, prefix)`` of a search box value.
+
+    The last word is a prefix unless the query ends in whitespace (the user
+    has finished typing it).
+    """
+    words = _TOKEN_RE.findall(_fold(q))
+    prefix = None
+    if words and not q[-1:].isspace():
+        prefix = words.pop()
+    terms = [w for w in dict.fromkeys(words) if _indexed(w)]
+    return terms, prefix
+
+
+def text_clause(q: str) -> dict:
+    """Filter for postings matching every word of ``q``; one that matches
+    nothing when ``q`` has no searchable words (only stopwords/punctuation)."""
+    terms, prefix = parse_query(q)
+    clauses: list[dict] = [{"searchTokens": {"$all": terms}}] if terms else []
+    if prefix:
+        clauses.append({"searchTokens": {"$regex": "^" + re.escape(prefix)}})
+    if not clauses:
+        return {"searchTokens": {"$in": []}}
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def _hits(field: str, pattern: str) -> dict:
+    return {
+        "$size": {
+            "$filter": {
+                "input": {"$ifNull": [f"${field}", []]},
+                "as": "token",
+                "cond": {"$regexMatch": {"input": "$$token", "regex": pattern}},
+            }
+        }
+    }
+
+
+def relevance_expression(q: str) -> dict:
+    """Aggregation expression scoring a posting against ``q``."""
+    terms, prefix = parse_query(q)
+    options = [f"{re.escape(t)}$" for t in terms]
+    if prefix:
+        options.append(re.escape(prefix))
+    if not options:
+        return {"$literal": 0}
+    pattern = "^(?:" + "|".join(options) + ")"
+    return {
+        "$add": [
+            {"$multiply": [_TITLE_WEIGHT, _hits("titleTokens", pattern)]},
+            _hits("searchTokens", pattern),
+        ]
+    }
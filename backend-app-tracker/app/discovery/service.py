@@ -7,24 +7,65 @@ duplicating them. Listing is global (postings are public) but auth-gated.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
 from fastapi import status
+from pymongo import UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 
 from app.common.errors import raise_error
-from app.common.query import paginate
-from app.discovery.connectors import ConnectorError, SUPPORTED_SOURCES, fetch_source
-from app.discovery.enrich import enrich
+from app.common.query import (
+    CountCache,
+    count_cache,
+    decode_cursor,
+    encode_cursor,
+    keyset_clause,
+    page_meta,
+    paginate,
+    paginate_async,
+)
+from app.config import settings
+from app.discovery import facets, search
+from app.discovery.connectors import (
+    BoardStream,
+    ConnectorError,
+    NotModified,
+    SUPPORTED_SOURCES,
+    async_client,
+    board_host,
+    open_source,
+    open_source_async,
+)
+from app.discovery.httpcache import BoardHttpCache
+from app.discovery.pipeline import SKIPPED, get_executor, process_items
+from app.discovery.tracking import (
+    claim_due_boards,
+    lease_board,
+    record_refresh,
+    release_board,
+    track_board,
+)
+from app.matching import rankings
+from app.metrics.queries import profile_query
+
+logger = logging.getLogger("careerlog.discovery")
 
 # Fields a client may sort discovered jobs by.
 SORTABLE_FIELDS = ("postedAt", "ingestedAt", "company", "title", "salaryMax")
 
-# When collapsing duplicates we group in Python, so cap how many matching rows we
-# scan to keep the query bounded.
-COLLAPSE_SCAN_CAP = 2000
+# ``q`` modes: a case-insensitive substring of the title (the default), or a
+# token search over title/company/location/description (see ``search``).
+SUBSTRING_SEARCH = "substring"
+TEXT_SEARCH = "text"
+# Extra sort for text searches: best match first.
+RELEVANCE = "relevance"
 
 # Sentinel a client can pass as the location filter to match postings that have
 # no location listed (FEAT-30: guided location filter).
@@ -45,6 +86,7 @@ class DiscoveryFilters:
     """
 
     q: str | None = None
+    q_mode: str = SUBSTRING_SEARCH
     company: str | None = None
     location: str | None = None
     work_arrangement: str | None = None
@@ -69,8 +111,219 @@ def _serialize(doc: dict) -> dict:
     return doc
 
 
-def ingest(db, source: str, token: str, company: str | None) -> dict:
-    """Fetch a board and upsert its postings. Returns counts."""
+def _board_state(jobs: Collection, source: str, token: str) -> dict[str, dict]:
+    """sourceId -> stored ``contentHash`` and faceted fields for one board, in a
+    single query."""
+    projection = {"_id": 0, "sourceId": 1, "contentHash": 1}
+    projection.update({field: 1 for field in facets.FACET_FIELDS})
+    cursor = jobs.find({"source": source, "boardToken": token}, projection)
+    return {doc.pop("sourceId"): doc for doc in cursor}
+
+
+def _flush_batch(jobs: Collection, ops: list[UpdateOne]) -> tuple[dict, set[int]]:
+    """Write one unordered batch of upserts; returns its per-batch counts and
+    the indexes of the ops that inserted."""
+    result = jobs.bulk_write(ops, ordered=False)
+    counts = {
+        "inserted": result.upserted_count,
+        "updated": result.modified_count,
+        "unchanged": result.matched_count - result.modified_count,
+    }
+    return counts, set(result.upserted_ids or {})
+
+
+def _move_facets(
+    jobs: Collection,
+    changes: list[tuple[str, dict | None, dict]],
+    upserted: set[int],
+    failed: set[int],
+    stored: dict[str, dict] | None,
+) -> None:
+    """Apply the facet deltas of a batch's writes that landed; ``stored``
+    follows them.
+
+    ``changes`` holds ``(sourceId, stored values, new values)`` per op. An op
+    that inserted moves a posting from nothing to its new values, even if the
+    board's snapshot had it; one that matched a posting the snapshot didn't
+    have is left to ``facets.rebuild``, since its old values are unknown.
+    """
+    if stored is None:
+        return
+    deltas: Counter = Counter()
+    for index, (source_id, old, new) in enumerate(changes):
+        if index in failed:
+            continue
+        if index in upserted:
+            old = None
+        elif old is None:
+            continue
+        facets.count_change(deltas, old, new)
+        stored[source_id] = new
+    facets.apply_deltas(jobs.database, deltas)
+
+
+def _write_batch(
+    jobs: Collection,
+    ops: list[UpdateOne],
+    changes: list[tuple[str, dict | None, dict]],
+    stored: dict[str, dict] | None,
+) -> dict:
+    """Flush one batch, then move the facet counts of the writes it confirms."""
+    try:
+        counts, upserted = _flush_batch(jobs, ops)
+    except BulkWriteError as exc:
+        # Count the writes that did land, then fail the ingest as before.
+        details = exc.details or {}
+        _move_facets(
+            jobs,
+            changes,
+            {row["index"] for row in details.get("upserted", [])},
+            {err["index"] for err in details.get("writeErrors", [])},
+            stored,
+        )
+        count_cache.invalidate(jobs.full_name)
+        raise
+    _move_facets(jobs, changes, upserted, set(), stored)
+    if counts["inserted"] or counts["updated"]:
+        count_cache.invalidate(jobs.full_name)
+    return counts
+
+
+def upsert_postings(
+    jobs: Collection,
+    docs: Iterable[dict | str | None],
+    *,
+    token: str,
+    now: datetime,
+    batch_size: int,
+    stored: dict[str, dict] | None = None,
+) -> dict:
+    """Upsert one board's processed postings in unordered ``bulk_write`` batches.
+
+    ``docs`` is the output of ``pipeline.process_items``: an enriched document,
+    ``SKIPPED`` (content hash unchanged — no write), or None (unusable). Each
+    document is keyed by ``(source, boardToken, sourceId)``; ``ingestedAt`` is
+    only written on insert. Documents are consumed lazily and flushed every
+    ``batch_size`` upserts, so a 2,000-role board is a few round trips rather
+    than 2,000. A posting repeated within one batch keeps its last version, as
+    sequential upserts would have. Returns totals plus per-batch counts.
+
+    When ``stored`` (the board's ``_board_state``) is given, the facet counts
+    in ``discovery_facets`` are moved from each posting's stored values to its
+    new ones after every batch — for the writes the bulk result confirms only,
+    so a partly failed batch counts just what landed; ``stored`` is kept
+    current as it goes.
+    """
+    totals = {
+        "fetched": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+        "batches": [],
+    }
+    pending: dict[tuple, UpdateOne] = {}
+    changes: dict[tuple, tuple[str, dict | None, dict]] = {}
+
+    def flush() -> None:
+        if not pending:
+            return
+        ops, batch = list(pending.values()), [changes.get(key) for key in pending]
+        pending.clear()
+        changes.clear()
+        counts = _write_batch(jobs, ops, batch, stored)
+        totals["batches"].append(counts)
+        for key, value in counts.items():
+            totals[key] += value
+
+    for doc in docs:
+        totals["fetched"] += 1
+        if doc == SKIPPED:  # by value: pool results arrive unpickled
+            totals["skipped"] += 1
+            continue
+        if doc is None:
+            continue
+        key = (doc["source"], token, doc["sourceId"])
+        if stored is not None:
+            changes[key] = (key[2], stored.get(key[2]), facets.facet_values(doc))
+        pending[key] = UpdateOne(
+            {"source": key[0], "boardToken": token, "sourceId": key[2]},
+            {"$set": doc, "$setOnInsert": {"ingestedAt": now}},
+            upsert=True,
+        )
+        if len(pending) >= batch_size:
+            flush()
+    flush()
+    return totals
+
+
+@dataclass
+class BoardRef:
+    """One company board to ingest: ATS source, board token, display name.
+
+    ``force`` re-processes the board even when the ATS reports it unchanged.
+    """
+
+    source: str
+    token: str
+    company: str | None = None
+    force: bool = False
+
+
+def _store_board(db, board: BoardRef, items: BoardStream, now: datetime) -> dict:
+    """Process and bulk-upsert a fetched board; keep it in the refresh registry.
+
+    The board's stored content hashes are loaded in one query up front so the
+    CPU stage (in-process, or on the enrichment pool when configured) can skip
+    unchanged postings before enriching them; the same rows carry the faceted
+    fields the upsert needs to keep ``discovery_facets`` in step. The board's
+    HTTP cache copy is committed last, once every posting is written: if
+    parsing or the upsert fails, the next fetch downloads the board again.
+    """
+    stored = _board_state(db.discovered_jobs, board.source, board.token)
+    known = {sid: doc.get("contentHash") for sid, doc in stored.items()}
+    docs = process_items(board.source, board.token, now, items, known, get_executor())
+    counts = upsert_postings(
+        db.discovered_jobs,
+        docs,
+        token=board.token,
+        now=now,
+        batch_size=max(1, settings.discovery_ingest_batch_size),
+        stored=stored,
+    )
+    track_board(db, board.source, board.token, board.company, now)
+    items.commit()
+    return counts
+
+
+def _not_modified_counts() -> dict:
+    return {
+        "notModified": True,
+        "fetched": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+        "batches": [],
+    }
+
+
+def ingest(
+    db, source: str, token: str, company: str | None, *, force: bool = False
+) -> dict:
+    """Fetch a board and upsert its postings. Returns counts.
+
+    The download is conditional: if the ATS answers ``304`` the board is
+    reported as ``notModified`` and nothing is parsed or written, unless
+    ``force`` asks for it to be rebuilt from the cached body. Otherwise the
+    body streams straight into the batched upsert, posting by posting; a body
+    that turns out oversized or malformed part-way fails the ingest, leaving
+    the batches already written (they're idempotent upserts).
+
+    The board is leased for the duration (``tracking.lease_board``), so it
+    never overlaps another ingest or a background refresh of the same board;
+    ``INGEST_IN_PROGRESS`` (409) while one is running.
+    """
     if source not in SUPPORTED_SOURCES:
         raise_error(
             code="UNSUPPORTED_SOURCE",
@@ -79,50 +332,218 @@ def ingest(db, source: str, token: str, company: str | None) -> dict:
             http_status=status.HTTP_400_BAD_REQUEST,
         )
 
+    now = datetime.now(tz=timezone.utc)
+    try:
+        board_host(source, token)  # reject a bad token before tracking it
+    except ConnectorError as exc:
+        raise_error(
+            code="DISCOVERY_FETCH_FAILED",
+            message=str(exc),
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
+    lease = lease_board(db, source, token, company, now)
+    if lease is None:
+        raise_error(
+            code="INGEST_IN_PROGRESS",
+            message="This board is being ingested already; try again shortly",
+            http_status=status.HTTP_409_CONFLICT,
+        )
+    succeeded = False
+    try:
+        result = _ingest_leased(db, source, token, company, force, now)
+        succeeded = True
+    finally:
+        release_board(db, lease, succeeded)
+    return result
+
+
+def _ingest_leased(
+    db, source: str, token: str, company: str | None, force: bool, now: datetime
+) -> dict:
     try:
-        postings = fetch_source(source, token, company)
+        items = open_source(
+            source, token, company, cache=BoardHttpCache(db.board_http_cache), force=force
+        )
+        counts = _store_board(db, BoardRef(source, token, company), items, now)
+    except NotModified:
+        track_board(db, source, token, company, now)
+        return {"source": source, "company": company or token, **_not_modified_counts()}
     except ConnectorError as exc:
         raise_error(
             code="DISCOVERY_FETCH_FAILED",
             message=str(exc),
             http_status=status.HTTP_400_BAD_REQUEST,
         )
+    return {"source": source, "company": company or token, **counts}
+
+
+def _release(db, lease: dict | None, outcome: dict) -> None:
+    if lease is None:
+        return
+    try:
+        release_board(db, lease, outcome["status"] != "failed")
+    except Exception:
+        logger.exception("Releasing board %s failed", lease.get("boardToken"))
+
+
+async def _ingest_board_async(
+    db, client, cache: BoardHttpCache, board: BoardRef, gates, now: datetime, leased: bool
+) -> dict:
+    """Fetch one board under its host's concurrency gate, then bulk-upsert it.
 
-    jobs: Collection = db.discovered_jobs
+    Any failure — a dead board, a board another ingest is busy with, or an
+    error storing it (e.g. a ``PyMongoError``) — is reported on the board's
+    result rather than raised, so one board doesn't sink the rest of the
+    batch. An unchanged board (``304``) is reported as ``not_modified`` and
+    not written at all. Unless the caller already ``leased`` the boards (the
+    refresh worker's claims), each is leased for its ingest.
+    """
+    result = {
+        "source": board.source,
+        "boardToken": board.token,
+        "company": board.company or board.token,
+    }
+    lease = None
+    try:
+        if not leased:
+            board_host(board.source, board.token)  # reject a bad token before tracking it
+            lease = await asyncio.to_thread(
+                lease_board, db, board.source, board.token, board.company, now
+            )
+            if lease is None:
+                return {**result, "status": "failed", "error": "Board is being ingested already"}
+        outcome = await _fetch_and_store(db, client, cache, board, gates, now)
+    except ConnectorError as exc:
+        outcome = {"status": "failed", "error": str(exc)}
+    except Exception as exc:
+        logger.exception("Ingesting %s board %s failed", board.source, board.token)
+        outcome = {"status": "failed", "error": f"Ingest failed ({type(exc).__name__})"}
+    await asyncio.to_thread(_release, db, lease, outcome)
+    return {**result, **outcome}
+
+
+async def _fetch_and_store(
+    db, client, cache: BoardHttpCache, board: BoardRef, gates, now: datetime
+) -> dict:
+    # The host gate is held until the body has been read: the download streams
+    # while the postings are stored.
+    async with gates[board_host(board.source, board.token)]:
+        try:
+            items = await open_source_async(
+                client,
+                board.source,
+                board.token,
+                board.company,
+                cache=cache,
+                force=board.force,
+            )
+        except NotModified:
+            await asyncio.to_thread(
+                track_board, db, board.source, board.token, board.company, now
+            )
+            return {"status": "not_modified"}
+        except ConnectorError as exc:
+            return {"status": "failed", "error": str(exc)}
+
+        # Parsing and pymongo are blocking; keep the event loop free for the
+        # other fetches (and this board's download). The postings are decoded
+        # as the upsert consumes them.
+        try:
+            counts = await asyncio.to_thread(_store_board, db, board, items, now)
+        except ConnectorError as exc:
+            return {"status": "failed", "error": str(exc)}
+        finally:
+            await items.aclose()
+    return {"status": "ok", **counts}
+
+
+async def ingest_boards_async(
+    db, boards: list[BoardRef], *, client=None, leased: bool = False
+) -> dict:
+    """Ingest many boards concurrently over one pooled ``httpx.AsyncClient``.
+
+    Requests to the same ATS host are capped at
+    ``discovery_fetch_concurrency_per_host``; each board's postings go through
+    the same bulk-upsert path as a single ingest as soon as they arrive;
+    boards the ATS reports unchanged are skipped entirely.
+    Callable from the scheduler's event loop; ``ingest_boards`` wraps it for
+    sync callers. ``client`` may be supplied (e.g. with a mock transport).
+    ``leased`` means the caller already holds every board's lease.
+    """
+    per_host = max(1, settings.discovery_fetch_concurrency_per_host)
+    gates: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(per_host)
+    )
     now = datetime.now(tz=timezone.utc)
-    inserted = 0
-    updated = 0
-    for posting in postings:
-        if not posting.get("sourceId") or not posting.get("title"):
-            continue
-        # ATS posting ids are unique per board, not globally, so the dedupe key
-        # includes the board token.
-        posting["boardToken"] = token
-        # Bound stored/served description size.
-        posting["description"] = (posting.get("description") or "")[:5000]
-        # Derived eligibility/quality/dedupe signals (computed once at ingest).
-        posting.update(enrich(posting))
-        posting["updatedAt"] = now
-        result = jobs.update_one(
-            {
-                "source": posting["source"],
-                "boardToken": token,
-                "sourceId": posting["sourceId"],
-            },
-            {"$set": posting, "$setOnInsert": {"ingestedAt": now}},
-            upsert=True,
+    cache = BoardHttpCache(db.board_http_cache)
+    owns_client = client is None
+    if owns_client:
+        client = async_client(max(1, settings.discovery_http_max_connections))
+    try:
+        results = await asyncio.gather(
+            *(_ingest_board_async(db, client, cache, b, gates, now, leased) for b in boards)
         )
-        if result.upserted_id is not None:
-            inserted += 1
-        elif result.modified_count:
-            updated += 1
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    ok = [r for r in results if r["status"] == "ok"]
+    not_modified = sum(1 for r in results if r["status"] == "not_modified")
+    return {
+        "boards": results,
+        "succeeded": len(ok),
+        "notModified": not_modified,
+        "failed": len(results) - len(ok) - not_modified,
+        "inserted": sum(r["inserted"] for r in ok),
+        "updated": sum(r["updated"] for r in ok),
+        "skipped": sum(r["skipped"] for r in ok),
+    }
+
+
+def ingest_boards(db, boards: list[BoardRef]) -> dict:
+    """Blocking entry point for ``ingest_boards_async`` (sync routes, scripts)."""
+    return asyncio.run(ingest_boards_async(db, boards))
+
+
+async def refresh_due_boards_async(db, now: datetime) -> dict:
+    """Refresh every tracked board that is due (one scheduler pass).
 
+    Due boards are claimed first (see ``tracking.claim_due_boards``) so replicas
+    never refresh the same board concurrently, then fetched together through
+    ``ingest_boards_async``. Each board's claim is released with its next
+    refresh time — an interval out on success, backed off on failure. Claims
+    are released even if the pass itself fails, rather than left to lapse.
+    """
+    claimed = await asyncio.to_thread(
+        claim_due_boards, db, now, settings.discovery_refresh_batch_size
+    )
+    if not claimed:
+        return {"refreshed": 0, "notModified": 0, "failed": 0}
+    boards = [BoardRef(b["source"], b["boardToken"], b.get("company")) for b in claimed]
+    try:
+        result = await ingest_boards_async(db, boards, leased=True)
+    except Exception as exc:
+        logger.exception("Board refresh pass failed")
+        failed = {"status": "failed", "error": f"Refresh failed ({type(exc).__name__})"}
+        result = {
+            "boards": [failed] * len(claimed),
+            "succeeded": 0,
+            "notModified": 0,
+            "failed": len(claimed),
+        }
+
+    def release() -> None:
+        for doc, outcome in zip(claimed, result["boards"], strict=True):
+            try:
+                record_refresh(db, doc, now, outcome.get("error"))
+            except Exception:
+                logger.exception("Releasing board %s failed", doc["boardToken"])
+
+    await asyncio.to_thread(release)
     return {
-        "source": source,
-        "company": company or token,
-        "fetched": len(postings),
-        "inserted": inserted,
-        "updated": updated,
+        "refreshed": result["succeeded"],
+        "notModified": result["notModified"],
+        "failed": result["failed"],
     }
 
 
@@ -144,15 +565,14 @@ def location_facets(db, *, q: str | None = None, limit: int = 50) -> dict:
     canonical option (the most-seen spelling wins), results are ranked by how
     many postings use them, and the count of postings with no location is
     reported separately so the picker can offer a "No location listed" choice.
-    """
-    rows = db.discovered_jobs.aggregate(
-        [{"$group": {"_id": "$location", "count": {"$sum": 1}}}]
-    )
 
+    Counts come from the maintained ``discovery_facets`` rows (one per exact
+    spelling), so this never scans the postings themselves.
+    """
     no_location = 0
     merged: dict[str, dict] = {}
-    for row in rows:
-        raw = row.get("_id")
+    for row in facets.read(db, "location"):
+        raw = row.get("value")
         count = int(row.get("count", 0) or 0)
         if raw is None or not str(raw).strip():
             no_location += count
@@ -180,6 +600,25 @@ def location_facets(db, *, q: str | None = None, limit: int = 50) -> dict:
     return {"locations": options, "noLocationCount": no_location}
 
 
+# Low-cardinality filters whose options ``filter_facets`` reports.
+FILTER_FACET_FIELDS = ("source", "employmentType", "experienceLevel", "workArrangement")
+
+
+def filter_facets(db) -> dict:
+    """Option counts for the fixed-vocabulary filters (source, type, level,
+    arrangement), most-used first; postings without a value are left out."""
+    result = {}
+    for field in FILTER_FACET_FIELDS:
+        options = [
+            {"value": str(row["value"]), "count": int(row.get("count", 0) or 0)}
+            for row in facets.read(db, field)
+            if row.get("value")
+        ]
+        options.sort(key=lambda o: (-o["count"], o["value"]))
+        result[field] = options
+    return result
+
+
 # String filters that map to an exact match on a field (skipped when blank).
 _STR_EQUALITY_FILTERS = {
     "work_arrangement": "workArrangement",
@@ -237,17 +676,32 @@ def _range_clauses(f: DiscoveryFilters) -> dict:
         # A posting qualifies if the top of its range meets the floor.
         clauses["salaryMax"] = {"$gte": f.salary_min}
     if f.max_age_days is not None:
-        cutoff = datetime.now(tz=timezone.utc) - timedelta(days=f.max_age_days)
+        # Whole minutes, so repeated requests build the same filter (and
+        # share a cached total).
+        now = datetime.now(tz=timezone.utc).replace(second=0, microsecond=0)
+        cutoff = now - timedelta(days=f.max_age_days)
         clauses["postedAt"] = {"$gte": cutoff}
     if f.min_quality is not None:
         clauses["qualityScore"] = {"$gte": f.min_quality}
     return clauses
 
 
+def _text_search(f: DiscoveryFilters) -> dict | None:
+    """The token-index clause for a ``qMode=text`` query, or None in substring
+    mode. A text query with nothing searchable in ``q`` matches nothing — it
+    never falls back to the title substring."""
+    if f.q and f.q_mode == TEXT_SEARCH:
+        return search.text_clause(f.q)
+    return None
+
+
 def _build_query(f: DiscoveryFilters) -> dict:
     """Build a safe Mongo filter — every operator is server-constructed."""
     query: dict = {}
-    if f.q:
+    text = _text_search(f)
+    if text is not None:
+        query.update(text)
+    elif f.q:
         query["title"] = _escape_regex(f.q)
     query.update(_location_clause(f.location))
 
@@ -277,6 +731,7 @@ def _build_query(f: DiscoveryFilters) -> dict:
 # exact same filtering as the live Discover query.
 CRITERIA_FIELDS = {
     "q": "q",
+    "qMode": "q_mode",
     "company": "company",
     "location": "location",
     "workArrangement": "work_arrangement",
@@ -307,35 +762,419 @@ def criteria_query(criteria: dict) -> dict:
     return _build_query(DiscoveryFilters(**kwargs))
 
 
-def _collapse(docs: list[dict], page: int, page_size: int) -> tuple[list[dict], int]:
-    """Merge duplicate postings (same ``dedupeKey``) into one listing.
+# Fields a collapsed group keeps per posting it folds in.
+_SOURCE_REF = {"source": "$source", "boardToken": "$boardToken", "url": "$url"}
+_SOURCE_FIELDS = {"source": 1, "boardToken": 1, "url": 1, "dedupeKey": 1}
+
+
+def _feed_pipeline(
+    query: dict,
+    sort_by: str,
+    direction: int,
+    window: list[dict],
+    include_total: bool,
+    *,
+    collapse: bool = True,
+    rank: list[dict] | None = None,
+) -> list[dict]:
+    """Aggregation that orders the feed (merging duplicate postings — same
+    ``dedupeKey`` — when ``collapse``) and returns one window of listings plus
+    the listing total when asked.
 
-    ``docs`` must already be in the desired sort order; the first row seen for a
-    key becomes the representative and the rest are folded in as extra sources.
+    Rows are sorted first, so each group's ``$first`` row is its representative
+    — the one the feed would have shown first. Only the handful of fields the
+    grouping needs are projected (never the description), and the page is cut
+    server-side, so the cost per request doesn't grow with the match count.
+    ``rank``, when given, is the stages computing ``sort_by`` before sorting
+    (relevance, best match). ``window`` is the stages selecting the page from the ordered
+    listings.
     """
-    groups: dict[str, dict] = {}
-    order: list[str] = []
-    for doc in docs:
-        key = doc.get("dedupeKey") or doc["id"]
-        ref = {
-            "source": doc.get("source"),
-            "boardToken": doc.get("boardToken"),
-            "url": doc.get("url"),
-        }
-        if key not in groups:
-            doc["duplicateCount"] = 1
-            doc["sources"] = [ref]
-            groups[key] = doc
-            order.append(key)
+    facet = {"groups": window}
+    if include_total:
+        facet["total"] = [{"$count": "count"}]
+    stages: list[dict] = [{"$match": query}]
+    if rank is not None:
+        stages += rank
+    stages += [
+        {"$sort": {sort_by: direction, "_id": direction}},
+        {
+            "$project": {
+                sort_by: 1,
+                "dedupeKey": 1,
+                "source": 1,
+                "boardToken": 1,
+                "url": 1,
+            }
+        },
+    ]
+    if not collapse:
+        stages.append({"$project": {"rep": "$_id", "sortKey": f"${sort_by}"}})
+        return stages + [{"$facet": facet}]
+    return stages + [
+        {
+            "$group": {
+                "_id": {"$ifNull": ["$dedupeKey", "$_id"]},
+                "rep": {"$first": "$_id"},
+                "sortKey": {"$first": f"${sort_by}"},
+                "duplicateCount": {"$sum": 1},
+                "sources": {"$push": _SOURCE_REF},
+            }
+        },
+        # $group doesn't preserve order; restore the representatives' order.
+        {"$sort": {"sortKey": direction, "rep": direction}},
+        {"$facet": facet},
+    ]
+
+
+class _FeedPage:
+    """One page of feed listings (see ``_feed_pipeline``): the aggregation that
+    windows them, and the standard list payload built from its result.
+
+    Listings are windowed by number, or — with ``cursor`` — by a keyset on the
+    representative's ``(sort key, _id)``, which is what they are ordered by.
+    The page's representatives are then fetched in one query (``reps_query``),
+    so only ``page_size`` postings ever leave the database. The total is served
+    from ``count_cache`` when fresh, and only counted otherwise.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        query: dict,
+        *,
+        sort_by: str,
+        sort_order: str,
+        page: int | None,
+        page_size: int,
+        cursor: str | None,
+        include_total: bool,
+        collapse: bool = True,
+        rank: list[dict] | None = None,
+    ):
+        direction = 1 if sort_order == "asc" else -1
+        self.namespace = namespace
+        self.sort_by, self.sort_order = sort_by, sort_order
+        self.page, self.page_size = page, page_size
+        self.collapse, self.ranked = collapse, rank is not None
+        self.count_key = ("collapse:" if collapse else "raw:") + CountCache.key(query)
+        self.total = count_cache.get(namespace, self.count_key) if include_total else None
+        self.count_listings = include_total and self.total is None
+        self.next_cursor: str | None = None
+
+        window: list[dict] = [{"$skip": (page - 1) * page_size}]
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_by, sort_order)
+            keyset = keyset_clause("sortKey", direction, value, last_id, id_field="rep")
+            window, self.page = [{"$match": keyset}], None
+        window.append({"$limit": page_size + 1})
+        self.pipeline = _feed_pipeline(
+            query,
+            sort_by,
+            direction,
+            window,
+            self.count_listings,
+            collapse=collapse,
+            rank=rank,
+        )
+
+    def groups(self, result: dict | None) -> list[dict]:
+        """The page's listings from the aggregation's single result document
+        (also records the total and the next cursor)."""
+        result = result or {"groups": [], "total": []}
+        groups = result["groups"]
+        if self.count_listings:
+            self.total = result["total"][0]["count"] if result["total"] else 0
+            count_cache.put(self.namespace, self.count_key, self.total)
+        if len(groups) > self.page_size:
+            groups = groups[: self.page_size]
+            last = groups[-1]
+            self.next_cursor = encode_cursor(
+                self.sort_by, self.sort_order, last.get("sortKey"), last["rep"]
+            )
+        return groups
+
+    @staticmethod
+    def reps_query(groups: list[dict]) -> dict:
+        return {"_id": {"$in": [g["rep"] for g in groups]}}
+
+    def payload(self, groups: list[dict], reps: list[dict]) -> dict:
+        """The full postings for the page's listings, in window order."""
+        items = _listing_items(
+            groups, reps, self.collapse, self.sort_by if self.ranked else None
+        )
+        meta = page_meta(self.page, self.page_size, self.total, self.next_cursor)
+        return {"items": items, "meta": meta}
+
+
+def _listing_items(
+    groups: list[dict], reps: list[dict], collapse: bool, rank_field: str | None
+) -> list[dict]:
+    """Serialized representatives of a page's listings, in window order, with
+    their duplicates (``collapse``) and rank (``rank_field``)."""
+    by_id = {doc["_id"]: doc for doc in reps}
+    items = []
+    for group in groups:
+        doc = by_id.get(group["rep"])
+        if doc is None:  # removed between the two queries
+            continue
+        doc = _serialize(doc)
+        if collapse:
+            doc["duplicateCount"] = group["duplicateCount"]
+            doc["sources"] = group["sources"]
+        if rank_field:
+            rank = group["sortKey"]
+            doc[rank_field] = None if rank == rankings.UNSCORED else rank
+        items.append(doc)
+    return items
+
+
+def _aggregated_page(db, query: dict, **options) -> dict:
+    """One page of feed listings in the standard list payload (``_FeedPage``)."""
+    jobs = db.discovered_jobs
+    feed = _FeedPage(jobs.full_name, query, **options)
+    with profile_query(jobs, "aggregate", pipeline=feed.pipeline) as span:
+        groups = feed.groups(next(jobs.aggregate(feed.pipeline, allowDiskUse=True), None))
+        span.returned = len(groups)
+    reps_query = feed.reps_query(groups)
+    with profile_query(jobs, "find", filter=reps_query) as span:
+        reps = list(jobs.find(reps_query))
+        span.returned = len(reps)
+    return feed.payload(groups, reps)
+
+
+async def _aggregated_page_async(db, query: dict, **options) -> dict:
+    """``_aggregated_page`` over the async (Motor) database."""
+    jobs = db.discovered_jobs
+    feed = _FeedPage(jobs.full_name, query, **options)
+    with profile_query(jobs, "aggregate", pipeline=feed.pipeline) as span:
+        results = await jobs.aggregate(feed.pipeline, allowDiskUse=True).to_list(length=1)
+        groups = feed.groups(results[0] if results else None)
+        span.returned = len(groups)
+    reps_query = feed.reps_query(groups)
+    with profile_query(jobs, "find", filter=reps_query) as span:
+        reps = await jobs.find(reps_query).to_list(length=None)
+        span.returned = len(reps)
+    return feed.payload(groups, reps)
+
+
+class _RankedPage:
+    """One page of the best-match feed (``sortBy=matchScore``), best first.
+
+    Listings come in two runs. The scored ones are read from the ranking's
+    ``match_scores`` rows in score order (``rankings.scored_stages``), so the
+    feed never joins every posting to its score. Once they run out come the
+    postings the ranking never scored, through ``_feed_pipeline`` with the
+    per-row score lookup (``rankings.feed_stages``) — only a page reaching
+    past the last scored listing pays for it. Then just the page's postings
+    (and, collapsed, its scored listings' duplicates) are fetched. The total
+    is the plain feed's, shared with it through ``count_cache``.
+
+    ``steps`` yields each query to run as ``(collection, op, spec, take)``;
+    the caller runs it (sync or async) and hands the documents to ``take``.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        query: dict,
+        prefix: str,
+        *,
+        page: int,
+        page_size: int,
+        cursor: str | None,
+        include_total: bool,
+        collapse: bool = True,
+        **_sort,
+    ):
+        self.namespace = namespace
+        self.query, self.prefix, self.collapse = query, prefix, collapse
+        self.page, self.page_size = page, page_size
+        self.skip, self.after = (page - 1) * page_size, None
+        if cursor:
+            # Ranked best first whatever the requested order.
+            self.after = decode_cursor(cursor, rankings.MATCH_SCORE, "desc")
+            self.page = None
+        self.count_key = ("collapse:" if collapse else "raw:") + CountCache.key(query)
+        self.total = count_cache.get(namespace, self.count_key) if include_total else None
+        self.count_listings = include_total and self.total is None
+        self.groups: list[dict] = []
+        self.scored_count: int | None = None
+        self.sources: dict = {}
+        self.singles: set = set()
+        self.reps: list[dict] = []
+        self.next_cursor: str | None = None
+
+    def _window(self, skip: int, limit: int) -> list[dict]:
+        if self.after is None:
+            return [{"$skip": skip}, {"$limit": limit}]
+        value, last_id = self.after
+        keyset = keyset_clause("sortKey", -1, value, last_id, id_field="rep")
+        return [{"$match": keyset}, {"$limit": limit}]
+
+    def scored_pipeline(self) -> list[dict]:
+        stages = rankings.scored_stages(self.prefix, self.query)
+        if self.collapse:
+            stages += [
+                {
+                    "$group": {
+                        "_id": {"$ifNull": ["$dedupeKey", "$postingId"]},
+                        "rep": {"$first": "$postingId"},
+                        "sortKey": {"$first": "$score"},
+                        "dedupeKey": {"$first": "$dedupeKey"},
+                    }
+                },
+                {"$sort": {"sortKey": -1, "rep": -1}},
+            ]
+        else:
+            stages.append({"$project": {"rep": "$postingId", "sortKey": "$score"}})
+        facet = {"groups": self._window(self.skip, self.page_size + 1)}
+        if self.after is None:
+            facet["scored"] = [{"$count": "count"}]
+        return stages + [{"$facet": facet}]
+
+    def take_scored(self, docs: list[dict]) -> None:
+        result = docs[0] if docs else {"groups": [], "scored": []}
+        self.groups = result["groups"]
+        if "scored" in result:
+            self.scored_count = result["scored"][0]["count"] if result["scored"] else 0
+
+    def unscored_pipeline(self) -> list[dict]:
+        if self.scored_count == 0:
+            # Nothing matching is scored: no need to look scores up.
+            rank = [{"$addFields": {rankings.MATCH_SCORE: rankings.UNSCORED}}]
         else:
-            rep = groups[key]
-            rep["duplicateCount"] += 1
-            rep["sources"].append(ref)
+            rank = rankings.feed_stages(self.prefix)
+        skip = 0
+        if self.after is None:
+            skip = max(0, self.skip - (self.scored_count or 0))
+        elif self.after[0] != rankings.UNSCORED:
+            self.after = None  # the cursor was in the scored run: from the top
+        limit = self.page_size + 1 - len(self.groups)
+        window = [{"$match": {"sortKey": rankings.UNSCORED}}, *self._window(skip, limit)]
+        return _feed_pipeline(
+            self.query,
+            rankings.MATCH_SCORE,
+            -1,
+            window,
+            False,
+            collapse=self.collapse,
+            rank=rank,
+        )
+
+    def take_unscored(self, docs: list[dict]) -> None:
+        self.groups += docs[0]["groups"] if docs else []
+
+    def total_pipeline(self) -> list[dict]:
+        stages: list[dict] = [{"$match": self.query}]
+        if self.collapse:
+            stages.append({"$group": {"_id": {"$ifNull": ["$dedupeKey", "$_id"]}}})
+        return stages + [{"$count": "count"}]
+
+    def take_total(self, docs: list[dict]) -> None:
+        self.total = docs[0]["count"] if docs else 0
+        count_cache.put(self.namespace, self.count_key, self.total)
 
-    grouped = [groups[k] for k in order]
-    total = len(grouped)
-    start = (page - 1) * page_size
-    return grouped[start : start + page_size], total
+    def sources_query(self) -> dict:
+        """Postings grouped into the page's scored listings (collapse)."""
+        scored = [g for g in self.groups if "sources" not in g]
+        keys = [g["dedupeKey"] for g in scored if g.get("dedupeKey")]
+        self.singles = {g["rep"] for g in scored if not g.get("dedupeKey")}
+        same_key = {"dedupeKey": {"$in": keys}}
+        if self.query:
+            same_key = {"$and": [self.query, same_key]}
+        return {"$or": [same_key, {"_id": {"$in": list(self.singles)}}]}
+
+    def take_sources(self, docs: list[dict]) -> None:
+        for doc in docs:
+            key = doc["_id"] if doc["_id"] in self.singles else doc.get("dedupeKey")
+            self.sources.setdefault(key, []).append(doc)
+
+    def take_reps(self, docs: list[dict]) -> None:
+        self.reps = docs
+
+    def steps(self):
+        """The page's queries, in order; each depends on the ones before."""
+        in_unscored_run = self.after is not None and self.after[0] == rankings.UNSCORED
+        if not in_unscored_run:
+            scored = {"pipeline": self.scored_pipeline()}
+            yield "match_scores", "aggregate", scored, self.take_scored
+        if len(self.groups) <= self.page_size:
+            unscored = {"pipeline": self.unscored_pipeline()}
+            yield "discovered_jobs", "aggregate", unscored, self.take_unscored
+        if self.count_listings:
+            total = {"pipeline": self.total_pipeline()}
+            yield "discovered_jobs", "aggregate", total, self.take_total
+        if len(self.groups) > self.page_size:
+            self.groups = self.groups[: self.page_size]
+            last = self.groups[-1]
+            self.next_cursor = encode_cursor(
+                rankings.MATCH_SCORE, "desc", last.get("sortKey"), last["rep"]
+            )
+        if self.collapse and any("sources" not in g for g in self.groups):
+            spec = {"filter": self.sources_query(), "projection": dict(_SOURCE_FIELDS)}
+            yield "discovered_jobs", "find", spec, self.take_sources
+        reps = {"filter": _FeedPage.reps_query(self.groups)}
+        yield "discovered_jobs", "find", reps, self.take_reps
+
+    def payload(self) -> dict:
+        for group in self.groups:
+            if self.collapse and "sources" not in group:
+                dups = self.sources.get(group.get("dedupeKey") or group["rep"], [])
+                dups.sort(key=lambda doc: doc["_id"] != group["rep"])  # rep first
+                group["duplicateCount"] = max(1, len(dups))
+                group["sources"] = [
+                    {field: doc.get(field) for field in _SOURCE_REF} for doc in dups
+                ]
+        items = _listing_items(self.groups, self.reps, self.collapse, rankings.MATCH_SCORE)
+        meta = page_meta(self.page, self.page_size, self.total, self.next_cursor)
+        return {"items": items, "meta": meta}
+
+
+def _ranked_page(db, query: dict, prefix: str, **options) -> dict:
+    """One page of the best-match feed in the standard list payload
+    (``_RankedPage``)."""
+    feed = _RankedPage(db.discovered_jobs.full_name, query, prefix, **options)
+    for name, op, spec, take in feed.steps():
+        collection = db[name]
+        with profile_query(collection, op, **spec) as span:
+            if op == "aggregate":
+                docs = list(collection.aggregate(spec["pipeline"], allowDiskUse=True))
+            else:
+                docs = list(collection.find(spec["filter"], spec.get("projection")))
+            span.returned = len(docs)
+        take(docs)
+    return feed.payload()
+
+
+async def _ranked_page_async(db, query: dict, prefix: str, **options) -> dict:
+    """``_ranked_page`` over the async (Motor) database."""
+    feed = _RankedPage(db.discovered_jobs.full_name, query, prefix, **options)
+    for name, op, spec, take in feed.steps():
+        collection = db[name]
+        with profile_query(collection, op, **spec) as span:
+            if op == "aggregate":
+                found = collection.aggregate(spec["pipeline"], allowDiskUse=True)
+            else:
+                found = collection.find(spec["filter"], spec.get("projection"))
+            docs = await found.to_list(length=None)
+            span.returned = len(docs)
+        take(docs)
+    return feed.payload()
+
+
+def _feed_plan(
+    filters: DiscoveryFilters, sort_by: str, match_prefix: str | None
+) -> tuple[dict, str, list[dict] | None]:
+    """``(query, sort_by, rank)`` for one feed request (see ``list_jobs``)."""
+    query = _build_query(filters)
+    rank = None
+    if sort_by == RELEVANCE and _text_search(filters):
+        rank = [{"$addFields": {sort_by: search.relevance_expression(filters.q)}}]
+    elif sort_by == rankings.MATCH_SCORE and match_prefix:
+        pass  # ranked from the stored scores (``_RankedPage``)
+    elif sort_by not in set(SORTABLE_FIELDS):
+        sort_by = "postedAt"
+    return query, sort_by, rank
 
 
 def list_jobs(
@@ -347,39 +1186,79 @@ def list_jobs(
     sort_by: str,
     sort_order: str,
     collapse: bool = True,
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
+    match_prefix: str | None = None,
 ) -> dict:
-    query = _build_query(filters)
-    if sort_by not in set(SORTABLE_FIELDS):
-        sort_by = "postedAt"
-
-    if not collapse:
+    """One page of the feed. Totals are cached per filter (see
+    ``count_cache``; ingest clears them). ``approximate_total`` applies to
+    raw rows only — the collapsed total counts groups, which has no cheap
+    estimate. ``sort_by="relevance"`` ranks a text search (``qMode=text``)
+    and falls back to ``postedAt`` for any other query; ``sort_by="matchScore"``
+    ranks best first (whatever ``sort_order``) by the precomputed scores under
+    ``match_prefix`` (``_RankedPage``; see ``matching.rankings``)."""
+    query, sort_by, rank = _feed_plan(filters, sort_by, match_prefix)
+    options = dict(
+        sort_by=sort_by,
+        sort_order=sort_order,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+    )
+    if sort_by == rankings.MATCH_SCORE and match_prefix:
+        return _ranked_page(db, query, match_prefix, collapse=collapse, **options)
+    if not collapse and rank is None:
         return paginate(
             db.discovered_jobs,
             query,
-            page=page,
-            page_size=page_size,
-            sort_by=sort_by,
-            sort_order=sort_order,
             serializer=_serialize,
             sortable_fields=SORTABLE_FIELDS,
+            approximate_total=approximate_total,
+            cache_total=True,
+            **options,
         )
 
-    # Collapse duplicates across boards/sources into one clean listing.
-    sort_direction = 1 if sort_order == "asc" else -1
-    cursor = (
-        db.discovered_jobs.find(query)
-        .sort(sort_by, sort_direction)
-        .limit(COLLAPSE_SCAN_CAP)
+    # Collapse duplicates across boards/sources into one clean listing (and/or
+    # rank by relevance or best match, which needs the aggregation too).
+    return _aggregated_page(db, query, collapse=collapse, rank=rank, **options)
+
+
+async def list_jobs_async(
+    db,
+    filters: DiscoveryFilters,
+    *,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    collapse: bool = True,
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
+    match_prefix: str | None = None,
+) -> dict:
+    """``list_jobs`` over the async (Motor) database."""
+    query, sort_by, rank = _feed_plan(filters, sort_by, match_prefix)
+    options = dict(
+        sort_by=sort_by,
+        sort_order=sort_order,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
-    docs = [_serialize(doc) for doc in cursor]
-    items, total = _collapse(docs, page, page_size)
-    total_pages = (total + page_size - 1) // page_size
-    return {
-        "items": items,
-        "meta": {
-            "page": page,
-            "pageSize": page_size,
-            "totalItems": total,
-            "totalPages": total_pages,
-        },
-    }
+    if sort_by == rankings.MATCH_SCORE and match_prefix:
+        return await _ranked_page_async(db, query, match_prefix, collapse=collapse, **options)
+    if not collapse and rank is None:
+        return await paginate_async(
+            db.discovered_jobs,
+            query,
+            serializer=_serialize,
+            sortable_fields=SORTABLE_FIELDS,
+            approximate_total=approximate_total,
+            cache_total=True,
+            **options,
+        )
+    return await _aggregated_page_async(db, query, collapse=collapse, rank=rank, **options)
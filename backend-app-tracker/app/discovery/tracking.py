@@ -0,0 +1,185 @@
+"""Registry of tracked boards for the background refresh (scheduled ingest).
+
+Postings used to be refreshed only when a user hit ``POST /discovery/ingest``,
+so ``discovered_jobs`` went stale and job alerts found nothing new. Every board
+that has ever been ingested — plus the curated ``boards.KNOWN_COMPANIES`` — is
+recorded in a ``tracked_boards`` collection with its own refresh interval and
+``nextRefreshAt``. The refresh worker (``discovery.runner``) picks up due boards
+each pass.
+
+* **Staggering** — a newly tracked board's first refresh lands at a random
+  point within its interval, and every reschedule adds jitter, so hundreds of
+  boards don't all come due on the same tick.
+* **Backoff** — a board that fails to fetch (``ConnectorError``) is retried
+  after an exponentially growing delay, capped, instead of on every pass.
+* **Claiming** — like ``alerts.service._claim_alert``, a due board is claimed
+  with a single ``findAndModify`` that stamps a lease (``claimedUntil``), so
+  with several API replicas exactly one of them refreshes it. A crashed worker's
+  lease simply expires. On-demand ingests take the same lease
+  (``lease_board``), so no two ingests of one board ever overlap — their
+  facet-count deltas are computed against the board's stored state.
+
+All timestamps are stored as naive UTC, as MongoDB returns them.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from app.config import settings
+from app.discovery.boards import KNOWN_COMPANIES
+
+# Reschedules land within ±this share of the interval.
+_JITTER_SHARE = 0.1
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    """Normalize to naive UTC — MongoDB stores datetimes without tzinfo."""
+    if dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _jittered(seconds: float) -> timedelta:
+    spread = seconds * _JITTER_SHARE
+    return timedelta(seconds=max(1.0, seconds + random.uniform(-spread, spread)))
+
+
+def backoff_seconds(failures: int) -> float:
+    """Retry delay after ``failures`` consecutive fetch failures (>= 1)."""
+    base = max(1, settings.discovery_refresh_backoff_seconds)
+    cap = max(base, settings.discovery_refresh_max_backoff_seconds)
+    return float(min(cap, base * 2 ** max(0, failures - 1)))
+
+
+def track_board(
+    db: Database, source: str, token: str, company: str | None, now: datetime
+) -> bool:
+    """Register a board for background refresh (no-op if already tracked).
+
+    Its first scheduled refresh is a random point within one interval, so a
+    burst of new boards spreads out. A supplied display name is kept current.
+    Returns whether the board was newly tracked.
+    """
+    now = _to_naive_utc(now)
+    interval = max(60, settings.discovery_refresh_interval_seconds)
+    update: dict = {
+        "$setOnInsert": {
+            "intervalSeconds": interval,
+            "nextRefreshAt": now + timedelta(seconds=random.uniform(0, interval)),
+            "lastRefreshedAt": None,
+            "failures": 0,
+            "lastError": None,
+            "claimedUntil": None,
+            "createdAt": now,
+        }
+    }
+    if company:
+        update["$set"] = {"company": company}
+    else:
+        update["$setOnInsert"]["company"] = token
+    result = db.tracked_boards.update_one(
+        {"source": source, "boardToken": token}, update, upsert=True
+    )
+    return result.upserted_id is not None
+
+
+def seed_known_boards(db: Database, now: datetime) -> None:
+    """Track the curated directory so the Discover feed has fresh content."""
+    for entry in KNOWN_COMPANIES:
+        track_board(db, entry["source"], entry["boardToken"], entry["name"], now)
+
+
+def _lease(collection: Collection, query: dict, now: datetime) -> dict | None:
+    """Atomically stamp a lease on the unleased board matching ``query``."""
+    lease = timedelta(seconds=max(60, settings.discovery_refresh_lease_seconds))
+    return collection.find_one_and_update(
+        {**query, "$or": [{"claimedUntil": None}, {"claimedUntil": {"$lte": now}}]},
+        {"$set": {"claimedUntil": now + lease}},
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+def _claim_board(collection: Collection, board: dict, now: datetime) -> dict | None:
+    """Atomically lease a due board for refresh; None if another worker has it."""
+    return _lease(collection, {"_id": board["_id"], "nextRefreshAt": {"$lte": now}}, now)
+
+
+def lease_board(
+    db: Database, source: str, token: str, company: str | None, now: datetime
+) -> dict | None:
+    """Lease a board for an on-demand ingest; None while another ingest (or
+    the refresh worker) holds it.
+
+    The board is tracked first so a brand-new board is serialized too; the
+    returned lease remembers whether it was, so ``release_board`` can forget
+    a board whose very first ingest failed.
+    """
+    now = _to_naive_utc(now)
+    created = track_board(db, source, token, company, now)
+    lease = _lease(db.tracked_boards, {"source": source, "boardToken": token}, now)
+    if lease is not None:
+        lease["newlyTracked"] = created
+    return lease
+
+
+def release_board(db: Database, lease: dict, succeeded: bool) -> None:
+    """Drop an on-demand ingest's lease (its refresh schedule is unchanged)."""
+    if not succeeded and lease.get("newlyTracked"):
+        db.tracked_boards.delete_one({"_id": lease["_id"]})
+        return
+    db.tracked_boards.update_one({"_id": lease["_id"]}, {"$set": {"claimedUntil": None}})
+
+
+def claim_due_boards(db: Database, now: datetime, limit: int) -> list[dict]:
+    """Claim up to ``limit`` due boards, most overdue first."""
+    now = _to_naive_utc(now)
+    due = (
+        db.tracked_boards.find(
+            {
+                "nextRefreshAt": {"$lte": now},
+                "$or": [{"claimedUntil": None}, {"claimedUntil": {"$lte": now}}],
+            }
+        )
+        .sort("nextRefreshAt", 1)
+        .limit(max(1, limit))
+    )
+    claimed = []
+    for board in due:
+        won = _claim_board(db.tracked_boards, board, now)
+        if won is not None:
+            claimed.append(won)
+    return claimed
+
+
+def record_refresh(
+    db: Database, board: dict, now: datetime, error: str | None = None
+) -> None:
+    """Release a board's claim and schedule its next refresh.
+
+    Success resets the failure streak and reschedules one (jittered) interval
+    out; a failure backs off exponentially and keeps the error for operators.
+    """
+    now = _to_naive_utc(now)
+    if error is None:
+        interval = board.get("intervalSeconds") or settings.discovery_refresh_interval_seconds
+        updates = {
+            "nextRefreshAt": now + _jittered(interval),
+            "lastRefreshedAt": now,
+            "failures": 0,
+            "lastError": None,
+        }
+    else:
+        failures = int(board.get("failures") or 0) + 1
+        updates = {
+            "nextRefreshAt": now + _jittered(backoff_seconds(failures)),
+            "failures": failures,
+            "lastError": error,
+        }
+    updates["claimedUntil"] = None
+    db.tracked_boards.update_one({"_id": board["_id"]}, {"$set": updates})
@@ -198,9 +198,17 @@ def _notes(job_title: str | None, skills: list[str], themes: list[str]) -> str:
     return " ".join(parts)
 
 
-def generate_prep(job_description: str, job_title: str | None = None) -> dict:
-    """Build prep topics, questions, and notes from a job description."""
-    skills = extract_skills(job_description)[:MAX_SKILL_TOPICS]
+def generate_prep(
+    job_description: str, job_title: str | None = None, skills: list[str] | None = None
+) -> dict:
+    """Build prep topics, questions, and notes from a job description.
+
+    ``skills`` may be supplied pre-computed (a discovered posting's stored
+    skills); by default they're extracted from ``job_description``.
+    """
+    if skills is None:
+        skills = extract_skills(job_description)
+    skills = skills[:MAX_SKILL_TOPICS]
     themes = _theme_keywords(job_description, skills)
 
     topics = [{"name": s, "kind": "skill"} for s in skills]
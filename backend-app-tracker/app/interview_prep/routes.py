@@ -1,19 +1,50 @@
-from fastapi import APIRouter, Depends
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, status
 
 from app.common.auth import get_current_user
+from app.common.errors import raise_error
 from app.common.responses import success
+from app.database import get_db
+from app.discovery.enrich import posting_skills
 from app.interview_prep.generator import generate_prep
 from app.interview_prep.schemas import GeneratePrepRequest, PrepResult
 
 router = APIRouter()
 
 
+def _discovered_posting(discovered_job_id: str) -> dict:
+    try:
+        doc = get_db().discovered_jobs.find_one(
+            {"_id": ObjectId(discovered_job_id)},
+            {"title": 1, "description": 1, "skills": 1, "analyzerVersion": 1},
+        )
+    except (InvalidId, TypeError):
+        doc = None
+    if not doc:
+        raise_error(
+            code="RESOURCE_NOT_FOUND",
+            message="Discovered job not found",
+            http_status=status.HTTP_404_NOT_FOUND,
+        )
+    return doc
+
+
 @router.post("/generate")
 def generate(
     payload: GeneratePrepRequest,
     current_user_id: str = Depends(get_current_user),
 ):
-    """Turn a job description into role-specific prep notes, topics, and
-    practice questions (deterministic, no generative AI)."""
-    result = generate_prep(payload.jobDescription, payload.jobTitle)
+    """Turn a job description — pasted, or a discovered posting's — into
+    role-specific prep notes, topics, and practice questions (deterministic,
+    no generative AI)."""
+    if payload.discoveredJobId:
+        doc = _discovered_posting(payload.discoveredJobId)
+        result = generate_prep(
+            doc.get("description") or "",
+            payload.jobTitle or doc.get("title"),
+            skills=posting_skills(doc),
+        )
+    else:
+        result = generate_prep(payload.jobDescription, payload.jobTitle)
     return success(data=PrepResult(**result).model_dump())
@@ -1,12 +1,21 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class GeneratePrepRequest(BaseModel):
-    jobDescription: str = Field(min_length=1, max_length=20000)
+    """Prep for a pasted ``jobDescription`` *or* a ``discoveredJobId``."""
+
+    jobDescription: Optional[str] = Field(default=None, min_length=1, max_length=20000)
+    discoveredJobId: Optional[str] = None
     jobTitle: Optional[str] = Field(default=None, max_length=200)
 
+    @model_validator(mode="after")
+    def _require_one_source(self) -> "GeneratePrepRequest":
+        if bool(self.discoveredJobId) == bool(self.jobDescription):
+            raise ValueError("Provide exactly one of discoveredJobId or jobDescription")
+        return self
+
 
 class PrepTopic(BaseModel):
     name: str
@@ -13,6 +13,7 @@ from pymongo.database import Database
 from app.common.crud import object_id_or_404, owned_delete, owned_update
 from app.common.errors import raise_error
 from app.discovery.service import clean_criteria, criteria_query
+from app.metrics.queries import profile_query
 from app.notifications.notifier import EMAIL, Notifier
 
 logger = logging.getLogger("careerlog.alerts")
@@ -84,7 +85,9 @@ def _count_matches(db: Database, criteria: dict, since: datetime | None) -> int:
     query = criteria_query(criteria)
     if since is not None:
         query = {**query, "ingestedAt": {"$gt": since}}
-    return db.discovered_jobs.count_documents(query)
+    with profile_query(db.discovered_jobs, "count", filter=query) as span:
+        span.returned = db.discovered_jobs.count_documents(query)
+    return span.returned
 
 
 def _notify(
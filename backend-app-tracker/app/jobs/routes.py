@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from gridfs import GridFS
 from bson import ObjectId
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.common.auth import get_current_user
-from app.common.responses import success
+from app.common.responses import fast_success, success
 from app.common.errors import raise_error
 from app.jobs.schemas import (
     CreateJobRequest,
@@ -14,6 +15,7 @@ from app.jobs.schemas import (
     UpdateJobRequest,
 )
 from app.jobs import service
+from app.matching import resume_store
 
 router = APIRouter()
 
@@ -40,12 +42,19 @@ async def create_job(
 
         if resume:
             resume_bytes = service.read_validated_resume(resume)
+            metadata = await run_in_threadpool(
+                resume_store.upload_metadata,
+                current_user_id,
+                resume_bytes,
+                content_type=resume.content_type,
+                filename=resume.filename,
+            )
             resume_id = str(
                 fs.put(
                     resume_bytes,
                     filename=resume.filename,
                     content_type=resume.content_type,
-                    metadata={"userId": current_user_id},
+                    metadata=metadata,
                 )
             )
 
@@ -74,25 +83,30 @@ async def create_job(
 
 
 @router.get("/")
-def get_jobs(
+async def get_jobs(
     page: int = Query(1, ge=1),
     pageSize: int = Query(25, ge=1, le=200),
     sortBy: str = Query("createdAt"),
     sortOrder: str = Query("asc"),
     filters: str | None = Query(None),
+    cursor: str | None = Query(None, max_length=1024),
+    includeTotal: bool = Query(True),
+    approxTotal: bool = Query(False),
     current_user_id: str = Depends(get_current_user),
 ):
-    db = get_db()
-    result = service.list_jobs(
-        db.jobs,
+    result = await service.list_jobs_async(
+        get_async_db().jobs,
         current_user_id,
         page=page,
         page_size=pageSize,
         sort_by=sortBy,
         sort_order=sortOrder,
         filters=filters,
+        cursor=cursor,
+        include_total=includeTotal,
+        approximate_total=approxTotal,
     )
-    return success(data=result)
+    return fast_success(result)
 
 
 @router.put("/{id}")
@@ -101,8 +115,7 @@ async def update_job(
     request: Request,
     current_user_id: str = Depends(get_current_user),
 ):
-    db = get_db()
-    fs = GridFS(db)
+    jobs = get_async_db().jobs
 
     content_type = request.headers.get("content-type", "")
     # ───────────────
@@ -112,7 +125,7 @@ async def update_job(
         form = await request.form()
         update_fields: dict = {}
 
-        existing = db.jobs.find_one(
+        existing = await jobs.find_one(
             {"_id": ObjectId(id), "userId": current_user_id}
         )
 
@@ -130,17 +143,26 @@ async def update_job(
 
             resume_bytes = service.read_validated_resume(resume)
 
+            # GridFS stays on the sync driver, off the event loop.
+            fs = GridFS(get_db())
             if existing_resume and service.is_valid_object_id(existing_resume):
-                fs.delete(ObjectId(existing_resume))
-
-            update_fields["resume"] = str(
-                fs.put(
-                    resume_bytes,
-                    filename=resume.filename,
-                    content_type=resume.content_type,
-                    metadata={"userId": current_user_id},
-                )
+                await run_in_threadpool(fs.delete, ObjectId(existing_resume))
+
+            metadata = await run_in_threadpool(
+                resume_store.upload_metadata,
+                current_user_id,
+                resume_bytes,
+                content_type=resume.content_type,
+                filename=resume.filename,
+            )
+            file_id = await run_in_threadpool(
+                fs.put,
+                resume_bytes,
+                filename=resume.filename,
+                content_type=resume.content_type,
+                metadata=metadata,
             )
+            update_fields["resume"] = str(file_id)
 
         for key in (
             "jobId",
@@ -160,14 +182,14 @@ async def update_job(
                 )
 
         payload = UpdateJobRequest(**update_fields)
-        result = service.update_job(db.jobs, id, current_user_id, payload)
+        result = await service.update_job_async(jobs, id, current_user_id, payload)
         return success(data=result)
 
     # ───────────────
     # JSON update
     # ───────────────
     payload = UpdateJobRequest(**await request.json())
-    result = service.update_job(db.jobs, id, current_user_id, payload)
+    result = await service.update_job_async(jobs, id, current_user_id, payload)
     return success(data=result)
 
 
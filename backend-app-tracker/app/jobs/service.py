@@ -7,7 +7,8 @@ from pymongo.collection import Collection
 from gridfs import GridFS
 
 from app.common.errors import raise_error
-from app.common.query import parse_filters, paginate
+from app.common.query import paginate, paginate_async, parse_filters
+from app.matching import resume_store
 from fastapi import status
 
 logger = logging.getLogger("careerlog.jobs")
@@ -91,6 +92,19 @@ def create_job(jobs: Collection, payload, user_id: str):
     }
 
 
+def _list_kwargs(user_id: str, filters: str | None, **options) -> dict:
+    """``paginate`` arguments for one page of the user's jobs."""
+    mongo_filters = parse_filters(
+        filters, user_id, JOB_FILTERABLE_FIELDS, JOB_TEXT_FILTER_FIELDS
+    )
+    return {
+        "mongo_filters": mongo_filters,
+        "serializer": _serialize_job,
+        "sortable_fields": JOB_SORTABLE_FIELDS,
+        **options,
+    }
+
+
 def list_jobs(
     jobs: Collection,
     user_id: str,
@@ -100,24 +114,65 @@ def list_jobs(
     sort_by: str,
     sort_order: str,
     filters: str | None,
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
 ):
-    mongo_filters = parse_filters(
-        filters, user_id, JOB_FILTERABLE_FIELDS, JOB_TEXT_FILTER_FIELDS
+    return paginate(
+        jobs,
+        **_list_kwargs(
+            user_id,
+            filters,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+            include_total=include_total,
+            approximate_total=approximate_total,
+        ),
     )
 
-    return paginate(
+
+async def list_jobs_async(
+    jobs,
+    user_id: str,
+    *,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    filters: str | None,
+    cursor: str | None = None,
+    include_total: bool = True,
+    approximate_total: bool = False,
+):
+    """``list_jobs`` over the async (Motor) ``jobs`` collection."""
+    return await paginate_async(
         jobs,
-        mongo_filters,
-        page=page,
-        page_size=page_size,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        serializer=_serialize_job,
-        sortable_fields=JOB_SORTABLE_FIELDS,
+        **_list_kwargs(
+            user_id,
+            filters,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+            include_total=include_total,
+            approximate_total=approximate_total,
+        ),
     )
 
 
-def update_job(jobs: Collection, job_id: str, user_id: str, payload):
+def _job_not_found() -> None:
+    raise_error(
+        code="RESOURCE_NOT_FOUND",
+        message="Job not found",
+        http_status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def _update_fields(payload) -> dict:
     update_fields = {
         k: (str(v) if k == "url" else v)
         for k, v in payload.model_dump().items()
@@ -131,40 +186,55 @@ def update_job(jobs: Collection, job_id: str, user_id: str, payload):
             http_status=status.HTTP_400_BAD_REQUEST,
         )
 
-    now = datetime.now(tz=timezone.utc)
-    update_fields["updatedAt"] = now
+    update_fields["updatedAt"] = datetime.now(tz=timezone.utc)
+    return update_fields
+
 
+def _update_ops(update_fields: dict, existing: dict | None) -> dict:
+    """The update for ``update_fields``; ``existing`` is the job's current
+    status when the update sets one."""
     update_ops: dict = {"$set": update_fields}
 
     # Append to the status timeline only when the status actually changes
     # (FEAT-13). Requires reading the current status first.
     new_status = update_fields.get("status")
     if new_status is not None:
-        existing = jobs.find_one(
-            {"_id": ObjectId(job_id), "userId": user_id}, {"status": 1}
-        )
         if existing is None:
-            raise_error(
-                code="RESOURCE_NOT_FOUND",
-                message="Job not found",
-                http_status=status.HTTP_404_NOT_FOUND,
-            )
+            _job_not_found()
         if existing.get("status") != new_status:
             update_ops["$push"] = {
-                "statusHistory": {"status": new_status, "at": now}
+                "statusHistory": {"status": new_status, "at": update_fields["updatedAt"]}
             }
+    return update_ops
 
-    result = jobs.update_one(
-        {"_id": ObjectId(job_id), "userId": user_id},
-        update_ops,
-    )
+
+def update_job(jobs: Collection, job_id: str, user_id: str, payload):
+    update_fields = _update_fields(payload)
+    selector = {"_id": ObjectId(job_id), "userId": user_id}
+
+    existing = None
+    if "status" in update_fields:
+        existing = jobs.find_one(selector, {"status": 1})
+    result = jobs.update_one(selector, _update_ops(update_fields, existing))
 
     if result.matched_count == 0:
-        raise_error(
-            code="RESOURCE_NOT_FOUND",
-            message="Job not found",
-            http_status=status.HTTP_404_NOT_FOUND,
-        )
+        _job_not_found()
+
+    return {"updatedAt": update_fields["updatedAt"]}
+
+
+async def update_job_async(jobs, job_id: str, user_id: str, payload):
+    """``update_job`` over the async (Motor) ``jobs`` collection."""
+    update_fields = _update_fields(payload)
+    selector = {"_id": ObjectId(job_id), "userId": user_id}
+
+    existing = None
+    if "status" in update_fields:
+        existing = await jobs.find_one(selector, {"status": 1})
+    result = await jobs.update_one(selector, _update_ops(update_fields, existing))
+
+    if result.matched_count == 0:
+        _job_not_found()
 
     return {"updatedAt": update_fields["updatedAt"]}
 
@@ -285,7 +355,9 @@ def add_job_resume(db, job_id: str, user_id: str, upload) -> dict:
         data,
         filename=upload.filename,
         content_type=upload.content_type,
-        metadata={"userId": user_id},
+        metadata=resume_store.upload_metadata(
+            user_id, data, content_type=upload.content_type, filename=upload.filename
+        ),
     )
 
     now = datetime.now(tz=timezone.utc)
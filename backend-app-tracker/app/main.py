@@ -13,6 +13,13 @@ from app.database import get_db, ensure_indexes
 from app.common.responses import failure
 from app.common.ratelimit import limiter
 from app.alerts import runner as alert_runner
+from app.discovery import runner as board_refresh_runner
+from app.discovery import facets as discovery_facets
+from app.discovery import queryplan as discovery_queryplan
+from app.discovery.pipeline import shutdown_executor
+from app.matching.batch import shutdown_scorer
+from app.metrics.queries import shutdown_explainer
+from app.metrics.registry import MetricsMiddleware
 
 from app.auth.routes import router as auth_router
 from app.users.routes import router as users_router
@@ -30,17 +37,27 @@ from app.company_research.routes import router as company_research_router
 from app.interview_prep.routes import router as interview_prep_router
 from app.offers.routes import router as offers_router
 from app.star_stories.routes import router as star_stories_router
+from app.metrics.routes import router as metrics_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Ensure the documented indexes exist before serving traffic.
     ensure_indexes(get_db())
+    # Backfill the facet counts on first start (ingest maintains them after).
+    discovery_facets.ensure_built(get_db())
+    # Log any Discover/alert query shape the indexes above don't cover.
+    discovery_queryplan.log_collection_scans(get_db())
     alert_runner.start(app)
+    board_refresh_runner.start(app)
     try:
         yield
     finally:
+        await board_refresh_runner.stop(app)
         await alert_runner.stop(app)
+        shutdown_executor()
+        shutdown_scorer()
+        shutdown_explainer()
 
 
 app = FastAPI(
@@ -74,9 +91,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"],
+    expose_headers=["Content-Disposition", "Server-Timing"],
 )
 
+# Per-request timing: Server-Timing header + per-route latency histograms, and
+# the matched route for query profiling (see app.metrics).
+app.add_middleware(MetricsMiddleware)
+
 
 def _field_errors(exc) -> list[dict]:
     """Reduce a (Request)ValidationError to a JSON-safe field/message list."""
@@ -141,6 +162,9 @@ def health_check():
     return {"status": "ok"}
 
 
+# Internal metrics (token-gated; see Settings.metrics_token)
+app.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
+
 # API Routers
 app.include_router(auth_router, prefix="/api/auth", tags=["Auth"])
 app.include_router(users_router, prefix="/api/users", tags=["Users"])
@@ -11,6 +11,7 @@ invents a 100% where nothing was extracted.
 
 from __future__ import annotations
 
+import hashlib
 from collections import Counter
 from dataclasses import dataclass
 
@@ -23,12 +24,26 @@ from app.matching.sections import (
     split_sections,
 )
 from app.matching.taxonomy import (
+    CONCEPT_BY_ID,
+    CONCEPTS,
     TIER_ADVANCED,
     TIER_CORE,
     TIER_FOUNDATIONAL,
     Concept,
     detect_concepts,
 )
+from app.metrics.registry import timed
+
+# Stamped on every persisted analysis (résumé uploads, postings) so stale ones
+# are recomputed. Bump the revision when the analysis code changes; edits to
+# the concept taxonomy, skill list or stopwords change the digest on their own.
+_ANALYZER_REVISION = 1
+ANALYZER_VERSION = "%d.%s" % (
+    _ANALYZER_REVISION,
+    hashlib.sha256(
+        repr((CONCEPTS, sorted(keywords.STOPWORDS))).encode("utf-8")
+    ).hexdigest()[:12],
+)
 
 # How much a term's tier scales its weight (a nice-to-have "advanced" concept
 # should not weigh like a core requirement).
@@ -141,6 +156,7 @@ def _select_phrases(section_text: str, concept_hits) -> list[str]:
     return selected
 
 
+@timed("cpu", "matching.analyze_job")
 def analyze_job(text: str) -> JobAnalysis:
     """Extract weighted, bucketed terms + a data-driven role family from a JD."""
     sections = split_sections(text)
@@ -229,6 +245,18 @@ def _role_families(category_weight: Counter[str]) -> list[str]:
     ]
 
 
+def concept_role_families(concept_ids) -> list[str]:
+    """Role families of a bare set of concepts (e.g. a résumé's), each concept
+    weighted by its tier as in ``analyze_job``."""
+    category_weight: Counter[str] = Counter()
+    for cid in concept_ids:
+        concept = CONCEPT_BY_ID.get(cid)
+        if concept is not None:
+            category_weight[concept.category] += _TIER_WEIGHT.get(concept.tier, 1.0)
+    return _role_families(category_weight)
+
+
+@timed("cpu", "matching.analyze_resume")
 def analyze_resume(text: str) -> ResumeAnalysis:
     """Concepts (with evidence) + stemmed n-gram/unigram sets for matching."""
     hits = detect_concepts(text)
@@ -0,0 +1,112 @@
+"""Single-pass multi-alias matcher (Aho–Corasick) for skill/concept detection.
+
+Skill and concept detection used to compile and run one regex per alias over
+the whole text — hundreds of full scans per résumé or posting. This module
+builds one automaton over every alias so a single left-to-right pass finds all
+of them, including overlapping ones ("react" inside "react native", "node"
+inside "node.js"), exactly as the per-alias scans did.
+
+The word-boundary rule is unchanged: an alias only counts when it is not
+flanked by ``[a-z0-9]`` on either side, so ``java`` is not found in
+``javascript`` and ``go`` is not found in ``goal``. Punctuation-bearing aliases
+(``c++``, ``.net``, ``ci/cd``) need no special casing.
+
+Matching is linear in the text length (amortized over failure-link hops). The
+automaton is deterministic and immutable once built; instances are safe to
+share across threads.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+
+def _is_word_char(ch: str) -> bool:
+    return ("a" <= ch <= "z") or ("0" <= ch <= "9")
+
+
+class AliasAutomaton:
+    """Find the first word-bounded occurrence of every alias in one pass."""
+
+    def __init__(self, aliases: Iterable[str]):
+        self.aliases: tuple[str, ...] = tuple(dict.fromkeys(a for a in aliases if a))
+        self._lengths: tuple[int, ...] = tuple(len(a) for a in self.aliases)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        # 1. Trie of all aliases; each terminal state outputs its alias index.
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for idx, alias in enumerate(self.aliases):
+            state = 0
+            for ch in alias:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][ch] = nxt
+                state = nxt
+            outputs[state].append(idx)
+
+        # 2. Breadth-first failure links. Each state also inherits the outputs
+        #    of its failure state, so every alias ending at a position is
+        #    reported there (overlapping matches included).
+        fail = [0] * len(goto)
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if state else 0
+                outputs[nxt].extend(outputs[fail[nxt]])
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(o) for o in outputs]
+
+    def first_positions(self, norm_text: str) -> dict[str, int]:
+        """Alias -> offset of its first word-bounded occurrence in ``norm_text``.
+
+        ``norm_text`` is expected to be already normalized (lowercase, single
+        spaces — see ``keywords.normalize``). Aliases that never occur with a
+        clean boundary are absent from the result.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self._lengths
+        aliases = self.aliases
+        n = len(norm_text)
+        found: dict[str, int] = {}
+        state = 0
+        for end, ch in enumerate(norm_text):
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            hits = out[state]
+            if not hits:
+                continue
+            if end + 1 < n and _is_word_char(norm_text[end + 1]):
+                continue
+            for idx in hits:
+                alias = aliases[idx]
+                if alias in found:
+                    continue
+                start = end + 1 - lengths[idx]
+                if start and _is_word_char(norm_text[start - 1]):
+                    continue
+                found[alias] = start
+        return found
@@ -0,0 +1,118 @@
+"""Score one prepared résumé against many postings (``/api/match/score-batch``).
+
+The résumé is analyzed once by the caller (``scoring.ResumeSignals``); each
+posting then costs only its job side, which ``job_cache`` serves for postings
+already seen. ``score_chunk`` is a pure function over a chunk of job texts so
+it can run either in-process (the default) or on an optional process pool
+sized by ``MATCHING_BATCH_WORKERS`` — same functions, same inputs, so results
+are identical either way and come back in input order.
+
+Each result is compact: the score, its confidence and the top gaps, not the
+full breakdown ``/score`` returns.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import settings
+from app.matching import scoring
+
+
+def score_one(resume_signals: scoring.ResumeSignals, job_text: str, gap_limit: int) -> dict:
+    result = scoring.score_prepared(resume_signals, job_text)
+    return {
+        "score": result.score,
+        "confidence": result.confidence,
+        "topGaps": [m.term for m in result.gaps[:gap_limit]],
+    }
+
+
+def score_chunk(
+    resume_signals: scoring.ResumeSignals, job_texts: list[str], gap_limit: int
+) -> list[dict]:
+    """``score_one`` over a chunk of job texts.
+
+    Module-level and argument-only so it can be shipped to a pool worker.
+    """
+    return [score_one(resume_signals, text, gap_limit) for text in job_texts]
+
+
+class BatchScorer:
+    """A process pool that runs ``score_chunk`` in parallel, order-preserving.
+
+    Workers are spawned (not forked) so they never inherit the server's
+    threads or open sockets; each keeps its own job-analysis cache.
+    """
+
+    def __init__(self, workers: int, chunk_size: int = 25):
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def score(
+        self, resume_signals: scoring.ResumeSignals, job_texts: list[str], gap_limit: int
+    ) -> list[dict]:
+        futures = [
+            self._pool.submit(
+                score_chunk,
+                resume_signals,
+                job_texts[start : start + self.chunk_size],
+                gap_limit,
+            )
+            for start in range(0, len(job_texts), self.chunk_size)
+        ]
+        return [row for future in futures for row in future.result()]
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def score_texts(
+    resume_signals: scoring.ResumeSignals,
+    job_texts: list[str],
+    gap_limit: int,
+    scorer: BatchScorer | None = None,
+) -> list[dict]:
+    """Compact results for every job text, in input order.
+
+    Serial (in the calling thread) when ``scorer`` is None or the batch fits in
+    one chunk; otherwise chunks are fanned out to the pool.
+    """
+    if scorer is None or len(job_texts) <= scorer.chunk_size:
+        return score_chunk(resume_signals, job_texts, gap_limit)
+    return scorer.score(resume_signals, job_texts, gap_limit)
+
+
+_scorer: BatchScorer | None = None
+_scorer_lock = threading.Lock()
+
+
+def get_scorer() -> BatchScorer | None:
+    """The shared scoring pool, or None when ``MATCHING_BATCH_WORKERS`` is 0.
+
+    Created on first use so processes that never batch-score never spawn workers.
+    """
+    global _scorer
+    if settings.matching_batch_workers <= 0:
+        return None
+    with _scorer_lock:
+        if _scorer is None:
+            _scorer = BatchScorer(
+                settings.matching_batch_workers, settings.matching_batch_chunk_size
+            )
+        return _scorer
+
+
+def shutdown_scorer() -> None:
+    """Stop the shared pool (app shutdown)."""
+    global _scorer
+    with _scorer_lock:
+        if _scorer is not None:
+            _scorer.shutdown()
+            _scorer = None
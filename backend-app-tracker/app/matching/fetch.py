@@ -21,6 +21,8 @@ from urllib.parse import urlparse
 
 import httpx
 
+from app.metrics.registry import timed
+
 _MAX_BYTES = 2 * 1024 * 1024  # 2 MB of HTML is plenty for a posting
 _TIMEOUT_SECONDS = 8.0
 _MAX_REDIRECTS = 4
@@ -68,6 +70,7 @@ def _validate_url(url: str) -> str:
     return url
 
 
+@timed("http", "matching.fetch_url")
 def fetch_url(url: str) -> str:
     """Fetch ``url`` and return the response body text (HTML).
 
@@ -0,0 +1,217 @@
+"""Content-addressed cache of job-posting analysis.
+
+Scoring spends most of its time on the job side: ``analyze.analyze_job`` plus
+the keyword signals (``extract_skills`` / ``ranked_keywords``). Those depend
+only on the posting text, and the same text is scored over and over — one user
+tries several résumés against a posting, many users score the same popular
+one. ``job_signals`` memoizes them by the SHA-256 of the text:
+
+* an in-process LRU bounded at ``matching_job_cache_max_entries`` postings
+  (least recently used go first once full), and
+* optionally (``matching_job_cache_mongo``) a shared second tier in the
+  ``job_analysis_cache`` collection, so replicas and restarts reuse each
+  other's work. Entries are stamped with ``analyze.ANALYZER_VERSION`` and
+  ignored once it changes; a TTL index expires them after
+  ``matching_job_cache_mongo_ttl_days``. A Mongo failure only costs the
+  cache — scoring falls back to analyzing the text.
+
+Hits, misses and evictions are counted per process (``cache_stats``, reported
+by ``GET /metrics``). Cached values are shared between callers and must be
+treated as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import PyMongoError
+
+from app.config import settings
+from app.database import get_db
+from app.matching import analyze, keywords
+
+logger = logging.getLogger("careerlog.matching")
+
+
+@dataclass(frozen=True)
+class JobSignals:
+    """Everything scoring needs from a job posting, computed once from its text."""
+
+    analysis: analyze.JobAnalysis
+    skills: list[str]
+    ranked: list[tuple[str, int]]
+
+    def to_doc(self) -> dict:
+        a = self.analysis
+        return {
+            "terms": [
+                {
+                    "key": t.key,
+                    "display": t.display,
+                    "weight": t.weight,
+                    "isConcept": t.is_concept,
+                    "required": t.required,
+                    "preferred": t.preferred,
+                    "category": t.category,
+                    "tier": t.tier,
+                }
+                for t in a.terms
+            ],
+            "roleFamilies": list(a.role_families),
+            "hasSections": a.has_sections,
+            "noiseRate": a.noise_rate,
+            "skills": list(self.skills),
+            "rankedKeywords": [[term, count] for term, count in self.ranked],
+        }
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "JobSignals":
+        return cls(
+            analysis=analyze.JobAnalysis(
+                terms=[
+                    analyze.JobTerm(
+                        key=t["key"],
+                        display=t["display"],
+                        weight=t["weight"],
+                        is_concept=t["isConcept"],
+                        required=t["required"],
+                        preferred=t["preferred"],
+                        category=t["category"],
+                        tier=t["tier"],
+                    )
+                    for t in doc["terms"]
+                ],
+                role_families=list(doc["roleFamilies"]),
+                has_sections=doc["hasSections"],
+                noise_rate=doc["noiseRate"],
+            ),
+            skills=list(doc["skills"]),
+            ranked=[(term, count) for term, count in doc["rankedKeywords"]],
+        )
+
+
+def prepare_job(job_text: str) -> JobSignals:
+    """Run all of the job-side text processing (uncached)."""
+    return JobSignals(
+        analysis=analyze.analyze_job(job_text),
+        skills=keywords.extract_skills(job_text),
+        ranked=keywords.ranked_keywords(job_text),
+    )
+
+
+def content_key(job_text: str) -> str:
+    return hashlib.sha256(job_text.encode("utf-8")).hexdigest()
+
+
+class JobAnalysisCache:
+    """Bounded in-process LRU of ``JobSignals`` by content key, with counters."""
+
+    def __init__(self, max_entries: int = 2048):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, JobSignals] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> JobSignals | None:
+        with self._lock:
+            signals = self._entries.get(key)
+            if signals is None:
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return signals
+
+    def put(self, key: str, signals: JobSignals, *, shared_hit: bool = False) -> None:
+        """Store a value that missed this process; ``shared_hit`` records
+        whether the second tier had it."""
+        with self._lock:
+            if shared_hit:
+                self._shared_hits += 1
+            else:
+                self._misses += 1
+            if self._max_entries <= 0:
+                return
+            self._entries[key] = signals
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "maxEntries": self._max_entries,
+                "hits": self._hits,
+                "sharedHits": self._shared_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._shared_hits = self._misses = self._evictions = 0
+
+
+analysis_cache = JobAnalysisCache(settings.matching_job_cache_max_entries)
+
+
+def _load_shared(key: str) -> JobSignals | None:
+    try:
+        doc = get_db().job_analysis_cache.find_one(
+            {"_id": key, "version": analyze.ANALYZER_VERSION}
+        )
+    except PyMongoError:
+        logger.warning("Job analysis cache lookup failed", exc_info=True)
+        return None
+    return JobSignals.from_doc(doc["signals"]) if doc else None
+
+
+def _save_shared(key: str, signals: JobSignals) -> None:
+    now = datetime.now(tz=timezone.utc)
+    try:
+        get_db().job_analysis_cache.replace_one(
+            {"_id": key},
+            {
+                "version": analyze.ANALYZER_VERSION,
+                "signals": signals.to_doc(),
+                "createdAt": now,
+                "expiresAt": now + timedelta(days=settings.matching_job_cache_mongo_ttl_days),
+            },
+            upsert=True,
+        )
+    except PyMongoError:
+        logger.warning("Job analysis cache write failed", exc_info=True)
+
+
+def job_signals(job_text: str) -> JobSignals:
+    """The (cached) job-side signals for a posting's text."""
+    key = content_key(job_text)
+    signals = analysis_cache.get(key)
+    if signals is not None:
+        return signals
+
+    shared = settings.matching_job_cache_mongo
+    signals = _load_shared(key) if shared else None
+    if signals is not None:
+        analysis_cache.put(key, signals, shared_hit=True)
+        return signals
+
+    signals = prepare_job(job_text)
+    analysis_cache.put(key, signals)
+    if shared:
+        _save_shared(key, signals)
+    return signals
+
+
+def cache_stats() -> dict:
+    return analysis_cache.stats()
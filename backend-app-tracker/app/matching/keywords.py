@@ -22,6 +22,8 @@ import re
 from collections import Counter
 from dataclasses import dataclass
 
+from app.matching.automaton import AliasAutomaton
+
 # ---------------------------------------------------------------------------
 # Skills taxonomy
 #
@@ -229,6 +231,10 @@ for _canonical, _aliases in SKILL_ALIASES.items():
 
 _ALIASES_BY_LENGTH = sorted(_ALIAS_TO_CANONICAL, key=len, reverse=True)
 
+# Every alias in one automaton, built once at import: ``extract_skills`` finds
+# all of them in a single pass instead of one regex scan per alias.
+_SKILL_AUTOMATON = AliasAutomaton(_ALIASES_BY_LENGTH)
+
 
 # Common English + résumé/JD boilerplate stopwords. Kept compact on purpose —
 # the goal is to drop noise, not to be a linguistics-grade list. The second
@@ -349,19 +355,16 @@ def extract_skills(text: str) -> list[str]:
 
     Aliases are matched as whole tokens/phrases (word-boundary aware) so
     ``java`` does not match inside ``javascript`` and ``go`` does not match
-    inside ``goal``.
+    inside ``goal``. All aliases are found in one pass (see ``automaton``).
     """
-    norm = normalize(text)
+    positions = _SKILL_AUTOMATON.first_positions(normalize(text))
     found: dict[str, int] = {}
+    # Longest alias first, as before: a canonical skill is positioned by the
+    # longest of its aliases that matched ("node.js" over "node").
     for alias in _ALIASES_BY_LENGTH:
-        # Word-boundary-ish match: alias must be flanked by non-token chars.
-        # We can't use \b because aliases contain +, #, /, . — build an explicit
-        # boundary that treats those as part of the token.
-        pattern = r"(?<![a-z0-9])" + re.escape(alias) + r"(?![a-z0-9])"
-        m = re.search(pattern, norm)
-        if m:
-            canonical = _ALIAS_TO_CANONICAL[alias]
-            found.setdefault(canonical, m.start())
+        start = positions.get(alias)
+        if start is not None:
+            found.setdefault(_ALIAS_TO_CANONICAL[alias], start)
     return [c for c, _ in sorted(found.items(), key=lambda kv: kv[1])]
 
 
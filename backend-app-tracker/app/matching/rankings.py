@@ -0,0 +1,389 @@
+"""Best-match ranking of the Discover feed against a user's default résumé.
+
+``GET /api/discovery/jobs?sortBy=matchScore`` orders postings by how well the
+caller's default résumé (``defaultResumeId`` in their preferences, else their
+most recent upload) fits them. Scores are precomputed, never computed while
+the feed query runs:
+
+* **Prefilter.** Ingest stores each posting's ``conceptIds`` and
+  ``roleFamilies`` (``discovery.enrich.match_signals``). Only postings that
+  share a concept with the résumé — or an adjacent one — or one of its role
+  families are scored; the rest can't score well and stay unscored. Postings
+  whose signals predate the current analyzer are always scored.
+* **Store.** Each score lives in ``match_scores`` under the key
+  ``"<userId>:<resumeId>:<postingId>"``, with the ``contentHash`` and
+  ``dedupeKey`` of the posting it scored. The feed reads a ranking's scores
+  in score order (``scored_stages``). Per (user, résumé) a ``match_rankings``
+  row records the analyzer version the scores came from and the
+  ``updatedAt`` watermark they cover.
+* **Refresh.** ``refresh`` scores only postings written since the watermark
+  (new, or changed at the ATS) and drops scores of changed postings that no
+  longer pass the prefilter. A new analyzer version or a different résumé
+  starts a ranking from scratch. Refreshing is background work: a feed
+  request only registers the ranking it reads (``prepare_feed``), and each
+  board refresh pass catches up every ranking used in the last
+  ``matching_rank_active_days`` (``refresh_active``) — building the new ones
+  — and prunes older rankings with their scores.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import BackgroundTasks, HTTPException, status
+from pymongo import ReturnDocument, UpdateOne
+
+from app.common.errors import raise_error
+from app.config import settings
+from app.discovery.enrich import match_text
+from app.jobs.service import ALLOWED_RESUME_TYPES
+from app.matching import analyze, batch, resume_store, scoring
+from app.matching.taxonomy import related_ids
+from app.resumes.service import get_resume_file
+
+logger = logging.getLogger("careerlog.matching")
+
+# Feed sort key for best-match ranking; postings without a score sort last.
+MATCH_SCORE = "matchScore"
+UNSCORED = -1
+
+_GAP_LIMIT = 3
+_POSTING_FIELDS = {
+    "title": 1,
+    "description": 1,
+    "conceptIds": 1,
+    "roleFamilies": 1,
+    "updatedAt": 1,
+    "contentHash": 1,
+    "analyzerVersion": 1,
+    "dedupeKey": 1,
+}
+# Longer than any single board ingest takes to write its postings.
+_INGEST_GRACE = timedelta(minutes=15)
+
+
+def key_prefix(user_id: str, resume_id: str) -> str:
+    """The ``match_scores`` key prefix of one (user, résumé) ranking."""
+    return f"{user_id}:{resume_id}:"
+
+
+def scored_stages(prefix: str, query: dict) -> list[dict]:
+    """Aggregation stages over ``match_scores`` listing the ranking's scored
+    postings that match the feed ``query``, best first, as ``{postingId,
+    score, dedupeKey}`` rows.
+
+    The ranking's rows are read in index order (owner, then score); postings
+    are joined only when the feed is filtered, to apply ``query`` to them.
+    """
+    user_id, resume_id = prefix.rstrip(":").split(":")
+    stages: list[dict] = [
+        {"$match": {"userId": user_id, "resumeId": resume_id}},
+        {"$sort": {"score": -1, "postingId": -1}},
+    ]
+    if query:
+        stages += [
+            {
+                "$lookup": {
+                    "from": "discovered_jobs",
+                    "localField": "postingId",
+                    "foreignField": "_id",
+                    "as": "_posting",
+                }
+            },
+            {"$unwind": "$_posting"},
+            {"$addFields": {"_posting._score": "$score"}},
+            {"$replaceRoot": {"newRoot": "$_posting"}},
+            {"$match": query},
+            {"$project": {"postingId": "$_id", "score": "$_score", "dedupeKey": 1}},
+        ]
+    return stages
+
+
+def feed_stages(prefix: str) -> list[dict]:
+    """Aggregation stages adding ``matchScore`` to each feed row (``UNSCORED``
+    when the ranking has no score for it) — a lookup per row, so the feed
+    only uses it past the ranking's scored postings."""
+    return [
+        {"$addFields": {"_matchKey": {"$concat": [prefix, {"$toString": "$_id"}]}}},
+        {
+            "$lookup": {
+                "from": "match_scores",
+                "localField": "_matchKey",
+                "foreignField": "_id",
+                "as": "_match",
+            }
+        },
+        {"$addFields": {MATCH_SCORE: {"$ifNull": [{"$first": "$_match.score"}, UNSCORED]}}},
+    ]
+
+
+@dataclass(frozen=True)
+class Prefilter:
+    """Which postings are worth scoring for one résumé."""
+
+    concept_ids: frozenset[str]  # the résumé's concepts plus adjacent ones
+    role_families: frozenset[str]  # the résumé's families, "General" excluded
+
+    @classmethod
+    def for_resume(cls, signals: scoring.ResumeSignals) -> "Prefilter":
+        concepts = set(signals.analysis.concept_ids)
+        for cid in signals.analysis.concept_ids:
+            concepts |= related_ids(cid)
+        families = set(analyze.concept_role_families(signals.analysis.concept_ids))
+        families.discard("General")
+        return cls(frozenset(concepts), frozenset(families))
+
+    def query(self) -> dict:
+        # Postings not yet analyzed by the current analyzer are scored.
+        clauses: list[dict] = [{"analyzerVersion": {"$ne": analyze.ANALYZER_VERSION}}]
+        if self.concept_ids:
+            clauses.append({"conceptIds": {"$in": sorted(self.concept_ids)}})
+        if self.role_families:
+            clauses.append({"roleFamilies": {"$in": sorted(self.role_families)}})
+        return {"$or": clauses}
+
+    def admits(self, posting: dict) -> bool:
+        if posting.get("analyzerVersion") != analyze.ANALYZER_VERSION:
+            return True
+        return bool(
+            self.concept_ids.intersection(posting["conceptIds"])
+            or self.role_families.intersection(posting.get("roleFamilies") or ())
+        )
+
+
+def default_resume_id(db, user_id: str) -> str | None:
+    """The résumé best-match ranking uses: the preferred one while it still
+    exists, otherwise the user's most recent résumé upload."""
+    prefs = db.user_preferences.find_one({"userId": user_id}, {"defaultResumeId": 1})
+    preferred = (prefs or {}).get("defaultResumeId")
+    if preferred:
+        try:
+            owned = db.fs.files.find_one(
+                {"_id": ObjectId(preferred), "metadata.userId": user_id}, {"_id": 1}
+            )
+        except InvalidId:
+            owned = None
+        if owned:
+            return preferred
+    latest = db.fs.files.find_one(
+        {"metadata.userId": user_id, "contentType": {"$in": sorted(ALLOWED_RESUME_TYPES)}},
+        {"_id": 1},
+        sort=[("uploadDate", -1)],
+    )
+    return str(latest["_id"]) if latest else None
+
+
+def _resume_signals(db, user_id: str, resume_id: str) -> scoring.ResumeSignals:
+    file = get_resume_file(db, resume_id, user_id)
+    signals = resume_store.signals(resume_store.load_analysis(db, file))
+    if signals is None:
+        raise_error(
+            code="RESUME_UNREADABLE",
+            message="Could not extract text from this résumé file",
+            http_status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return signals
+
+
+def _unscored(db, prefix: str, postings: list[dict]) -> list[dict]:
+    """The postings whose stored score isn't for their current content."""
+    keys = [prefix + str(doc["_id"]) for doc in postings]
+    scored = {
+        row["_id"]: row.get("contentHash")
+        for row in db.match_scores.find({"_id": {"$in": keys}}, {"contentHash": 1})
+    }
+    return [
+        doc
+        for key, doc in zip(keys, postings)
+        if doc.get("contentHash") is None or scored.get(key) != doc["contentHash"]
+    ]
+
+
+def _store(db, prefix: str, owner: dict, postings: list[dict], results: list[dict]):
+    now = datetime.now(tz=timezone.utc)
+    ops = [
+        UpdateOne(
+            {"_id": prefix + str(doc["_id"])},
+            {
+                "$set": {
+                    **owner,
+                    **result,
+                    "postingId": doc["_id"],
+                    "contentHash": doc.get("contentHash"),
+                    "dedupeKey": doc.get("dedupeKey"),
+                    "scoredAt": now,
+                }
+            },
+            upsert=True,
+        )
+        for doc, result in zip(postings, results)
+    ]
+    if ops:
+        db.match_scores.bulk_write(ops, ordered=False)
+
+
+def refresh(db, user_id: str, resume_id: str) -> dict:
+    """Bring one (user, résumé) ranking up to date; returns how many postings
+    were scored and how many scores were dropped."""
+    prefix = key_prefix(user_id, resume_id)
+    owner = {"userId": user_id, "resumeId": resume_id}
+    state = db.match_rankings.find_one(owner)
+    signals = _resume_signals(db, user_id, resume_id)
+    prefilter = Prefilter.for_resume(signals)
+
+    if state is None or state.get("version") != analyze.ANALYZER_VERSION:
+        db.match_scores.delete_many(owner)
+        since = None
+        postings = list(db.discovered_jobs.find(prefilter.query(), _POSTING_FIELDS))
+    else:
+        # Re-read a grace window behind the watermark: an ingest stamps all of
+        # its postings with its start time but writes them over a while, so
+        # some may land after a refresh has moved past that time. Postings
+        # already scored for their current content are skipped below.
+        since = state["scoredThrough"]
+        postings = list(
+            db.discovered_jobs.find(
+                {"updatedAt": {"$gt": since - _INGEST_GRACE}}, _POSTING_FIELDS
+            )
+        )
+
+    rejected = [prefix + str(doc["_id"]) for doc in postings if not prefilter.admits(doc)]
+    dropped = (
+        db.match_scores.delete_many({"_id": {"$in": rejected}}).deleted_count
+        if rejected
+        else 0
+    )
+    candidates = _unscored(db, prefix, [doc for doc in postings if prefilter.admits(doc)])
+    results = batch.score_texts(
+        signals, [match_text(doc) for doc in candidates], _GAP_LIMIT, batch.get_scorer()
+    )
+    _store(db, prefix, owner, candidates, results)
+
+    stamps = [doc["updatedAt"] for doc in postings if doc.get("updatedAt")]
+    watermark = max(stamps) if stamps else since or datetime.now(tz=timezone.utc)
+    db.match_rankings.update_one(
+        owner,
+        {
+            "$set": {
+                "version": analyze.ANALYZER_VERSION,
+                "scoredThrough": watermark,
+                "refreshedAt": datetime.now(tz=timezone.utc),
+            },
+            "$setOnInsert": {"lastUsedAt": datetime.now(tz=timezone.utc)},
+        },
+        upsert=True,
+    )
+    return {"scored": len(candidates), "dropped": dropped}
+
+
+def prepare_feed(
+    db, user_id: str, *, first_page: bool = True, background: BackgroundTasks | None = None
+) -> str:
+    """The ``match_scores`` key prefix of the caller's default-résumé ranking
+    for a best-match feed request.
+
+    Nothing is scored here: a first page only marks the ranking used (creating
+    it, for the background pass to build) and later pages don't touch it. When
+    the board refresh loop is disabled there is no background pass, so a first
+    page queues a one-shot ``refresh_ranking`` on ``background`` (the
+    request's ``BackgroundTasks``) to run after the response.
+    """
+    resume_id = default_resume_id(db, user_id)
+    if resume_id is None:
+        raise_error(
+            code="RESUME_REQUIRED",
+            message="Upload a résumé to rank postings by best match",
+            http_status=status.HTTP_409_CONFLICT,
+        )
+    if first_page:
+        result = db.match_rankings.update_one(
+            {"userId": user_id, "resumeId": resume_id},
+            {"$set": {"lastUsedAt": datetime.now(tz=timezone.utc)}},
+            upsert=True,
+        )
+        if result.upserted_id is not None:
+            _resume_signals(db, user_id, resume_id)  # an unreadable résumé fails now
+        if not settings.discovery_refresh_enabled and background is not None:
+            background.add_task(refresh_ranking, db, user_id, resume_id)
+    return key_prefix(user_id, resume_id)
+
+
+def _drop(db, state: dict) -> None:
+    db.match_scores.delete_many({"userId": state["userId"], "resumeId": state["resumeId"]})
+    db.match_rankings.delete_one({"_id": state["_id"]})
+
+
+def _claim(db, ranking_id, now: datetime) -> dict | None:
+    """Atomically lease a ranking for this pass; None if another worker (or
+    replica) is refreshing it."""
+    lease = timedelta(seconds=max(60, settings.discovery_refresh_lease_seconds))
+    return db.match_rankings.find_one_and_update(
+        {
+            "_id": ranking_id,
+            "$or": [{"claimedUntil": None}, {"claimedUntil": {"$lte": now}}],
+        },
+        {"$set": {"claimedUntil": now + lease}},
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+def _refresh_claimed(db, state: dict, stale: bool) -> str:
+    """Refresh (or drop) one leased ranking; returns which it did."""
+    if stale:
+        _drop(db, state)
+        return "dropped"
+    try:
+        refresh(db, state["userId"], state["resumeId"])
+    except HTTPException:
+        _drop(db, state)
+        return "dropped"
+    return "refreshed"
+
+
+def _refresh_leased(db, ranking_id, now: datetime, stale: bool = False) -> str | None:
+    """Lease one ranking, refresh (or drop) it and release it; returns what
+    was done, or None if another worker holds the ranking."""
+    state = _claim(db, ranking_id, now)
+    if state is None:
+        return None
+    try:
+        outcome = _refresh_claimed(db, state, stale)
+    except Exception:
+        logger.exception("Refreshing the ranking of user %s failed", state["userId"])
+        outcome = "failed"
+    if outcome != "dropped":
+        db.match_rankings.update_one({"_id": state["_id"]}, {"$set": {"claimedUntil": None}})
+    return outcome
+
+
+def refresh_ranking(db, user_id: str, resume_id: str) -> None:
+    """One-shot refresh of one ranking, under its lease (``prepare_feed``'s
+    background task when the board refresh loop is disabled)."""
+    state = db.match_rankings.find_one({"userId": user_id, "resumeId": resume_id}, {"_id": 1})
+    if state is not None:
+        _refresh_leased(db, state["_id"], datetime.now(tz=timezone.utc))
+
+
+def refresh_active(db, now: datetime) -> dict:
+    """Background pass: catch up (or build) every ranking used recently; drop
+    the others (and any whose résumé is gone or unreadable) with their scores.
+
+    Each ranking is leased while it is refreshed (like a tracked board), so
+    concurrent passes in other workers or replicas skip it. A ranking that
+    fails is logged and left for the next pass.
+    """
+    cutoff = now - timedelta(days=settings.matching_rank_active_days)
+    counts = {"refreshed": 0, "dropped": 0, "failed": 0}
+    stale = {
+        row["_id"]
+        for row in db.match_rankings.find({"lastUsedAt": {"$lt": cutoff}}, {"_id": 1})
+    }
+    for row in list(db.match_rankings.find({}, {"_id": 1})):
+        outcome = _refresh_leased(db, row["_id"], now, row["_id"] in stale)
+        if outcome is not None:
+            counts[outcome] += 1
+    return counts
@@ -0,0 +1,82 @@
+"""Persisted résumé analysis, kept in the résumé's GridFS file metadata.
+
+A stored résumé never changes, so its extracted text and everything scoring
+needs from it (``scoring.ResumeSignals``) are computed once — when it is
+uploaded — and saved as ``metadata.analysis`` on the GridFS file, stamped with
+``analyze.ANALYZER_VERSION``. Scoring by ``resumeId`` then loads the analysis
+with the file document instead of reading the chunks and re-running pypdf /
+DOCX extraction and the résumé analysis on every request. Files uploaded
+before this, or analyzed by an older analyzer version, are analyzed on first
+use and updated in place. The analysis lives and dies with the file, so
+deleting a résumé needs no extra cleanup.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from app.matching.analyze import ANALYZER_VERSION
+from app.matching.extract import extract_resume_text
+from app.matching.scoring import ResumeSignals, prepare_resume
+
+logger = logging.getLogger("careerlog.matching")
+
+
+def build_analysis(data: bytes, *, content_type: str | None, filename: str | None) -> dict:
+    """The ``metadata.analysis`` document for a résumé file's bytes.
+
+    An unreadable file gets an analysis with empty ``text`` (and no signals),
+    so it isn't re-extracted on every score either.
+    """
+    text = extract_resume_text(data, content_type=content_type, filename=filename)
+    analysis = {
+        "version": ANALYZER_VERSION,
+        "analyzedAt": datetime.now(tz=timezone.utc),
+        "text": text,
+    }
+    if text:
+        analysis["signals"] = prepare_resume(text).to_doc()
+    return analysis
+
+
+def upload_metadata(
+    user_id: str, data: bytes, *, content_type: str | None, filename: str | None
+) -> dict:
+    """GridFS ``metadata`` for a new résumé upload: the ownership stamp plus
+    its analysis. Analysis is best-effort — a failure here must not block the
+    upload; the file is then analyzed on first use instead."""
+    metadata: dict = {"userId": user_id}
+    try:
+        metadata["analysis"] = build_analysis(
+            data, content_type=content_type, filename=filename
+        )
+    except Exception:
+        logger.warning("Résumé analysis failed at upload", exc_info=True)
+    return metadata
+
+
+def current_analysis(metadata: dict | None) -> dict | None:
+    """The stored analysis, or None when missing or from another analyzer version."""
+    analysis = (metadata or {}).get("analysis")
+    if not analysis or analysis.get("version") != ANALYZER_VERSION:
+        return None
+    return analysis
+
+
+def load_analysis(db, file) -> dict:
+    """The current analysis of an (ownership-checked) GridFS résumé file,
+    computing and saving it first when it is missing or stale."""
+    analysis = current_analysis(file.metadata)
+    if analysis is None:
+        analysis = build_analysis(
+            file.read(), content_type=file.content_type, filename=file.filename
+        )
+        db.fs.files.update_one({"_id": file._id}, {"$set": {"metadata.analysis": analysis}})
+    return analysis
+
+
+def signals(analysis: dict) -> ResumeSignals | None:
+    """The scoring signals of a stored analysis (None for an unreadable file)."""
+    doc = analysis.get("signals")
+    return ResumeSignals.from_doc(doc) if doc else None
@@ -6,6 +6,8 @@ from app.common.responses import success
 from app.matching import service
 from app.matching.schemas import (
     ExtractResumeResponse,
+    ScoreBatchRequest,
+    ScoreBatchResponse,
     ScoreRequest,
     ScoreResponse,
     ScrapeJobRequest,
@@ -48,3 +50,15 @@ def score(
     db = get_db()
     result = service.score(db, payload, current_user_id)
     return success(data=ScoreResponse(**result).model_dump())
+
+
+@router.post("/score-batch")
+def score_batch(
+    payload: ScoreBatchRequest,
+    current_user_id: str = Depends(get_current_user),
+):
+    """Score one résumé against up to ``MAX_BATCH_JOBS`` postings (discovered
+    job ids or pasted text), analyzing the résumé once. Best match first."""
+    db = get_db()
+    result = service.score_batch(db, payload, current_user_id)
+    return success(data=ScoreBatchResponse(**result).model_dump())
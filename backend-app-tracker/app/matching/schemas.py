@@ -32,6 +32,40 @@ class ScoreRequest(BaseModel):
         return self
 
 
+# Postings per ``/score-batch`` request.
+MAX_BATCH_JOBS = 200
+
+
+class BatchJob(BaseModel):
+    """One posting to score: a ``discoveredJobId`` *or* raw ``jobDescription``.
+    ``ref`` is an optional client label echoed back on the result."""
+
+    discoveredJobId: Optional[str] = None
+    jobDescription: Optional[str] = Field(default=None, max_length=100_000)
+    ref: Optional[str] = Field(default=None, max_length=200)
+
+    @model_validator(mode="after")
+    def _require_one_source(self) -> "BatchJob":
+        if bool(self.discoveredJobId) == bool(self.jobDescription):
+            raise ValueError("Provide exactly one of discoveredJobId or jobDescription")
+        return self
+
+
+class ScoreBatchRequest(BaseModel):
+    """Score one résumé (``resumeId`` *or* ``resumeText``) against many postings."""
+
+    resumeId: Optional[str] = None
+    resumeText: Optional[str] = None
+    jobs: list[BatchJob] = Field(min_length=1, max_length=MAX_BATCH_JOBS)
+    gapLimit: int = Field(default=3, ge=0, le=20)
+
+    @model_validator(mode="after")
+    def _require_a_resume(self) -> "ScoreBatchRequest":
+        if not (self.resumeId or self.resumeText):
+            raise ValueError("Provide a resumeId or resumeText")
+        return self
+
+
 # =====================
 # Responses
 # =====================
@@ -94,3 +128,19 @@ class ScoreResponse(BaseModel):
     gaps: list[TermMatchModel]
     resume: ExtractedTerms
     job: ExtractedTerms
+
+
+class BatchResultModel(BaseModel):
+    index: int  # position in the request's ``jobs``
+    ref: str | None = None
+    discoveredJobId: str | None = None
+    title: str | None = None
+    company: str | None = None
+    score: int
+    confidence: str  # high | medium | low
+    topGaps: list[str]  # missing terms, most important first
+
+
+class ScoreBatchResponse(BaseModel):
+    results: list[BatchResultModel]  # best score first
+    notFound: list[str]  # discoveredJobIds with no such posting
@@ -23,8 +23,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from app.matching import analyze, keywords
+from app.matching import analyze, job_cache, keywords
 from app.matching.taxonomy import CONCEPT_BY_ID, TIER_FOUNDATIONAL, related_ids
+from app.metrics.registry import timed
 
 STATUS_STRONG = "strong"
 STATUS_PARTIAL = "partial"
@@ -160,20 +161,18 @@ def _coverage(matches: list[TermMatch], bucket: str) -> float | None:
 def _keyword_coverage(
     job_skills: list[str],
     job_ranked: list[tuple[str, int]],
-    resume_text: str,
-    resume_skills: list[str],
+    resume_vocab: set[str],
 ) -> float:
     """Legacy general keyword overlap (stemmed), kept as a stable fallback.
 
     Takes the job's already-extracted skills + ranked keywords (so the job text
-    isn't tokenized again here) and the résumé's skills (so its vocabulary skips
-    a second skill extraction). Behaviour is identical to profiling the job at
-    the default limit and folding the résumé vocabulary as before.
+    isn't tokenized again here) and the résumé's ``keywords.vocabulary`` (see
+    ``ResumeSignals``). Behaviour is identical to profiling the job at the
+    default limit and folding the résumé vocabulary as before.
     """
     job_keywords = keywords.build_profile(job_skills, job_ranked).keywords
     if not job_keywords:
         return 0.0
-    resume_vocab = keywords.vocabulary(resume_text, skills=resume_skills)
     matched = sum(
         1
         for kw in job_keywords
@@ -212,25 +211,84 @@ def _confidence(
     return level, reason
 
 
+@dataclass(frozen=True)
+class ResumeSignals:
+    """Everything scoring needs from a résumé, computed once from its text.
+
+    Depends only on the text (and ``analyze.ANALYZER_VERSION``), so it can be
+    persisted with the uploaded file (``to_doc``/``from_doc``) and reused for
+    every score instead of re-running the résumé-side text processing.
+    """
+
+    analysis: analyze.ResumeAnalysis
+    skills: list[str]
+    ranked: list[tuple[str, int]]
+    vocabulary: set[str]
+
+    def to_doc(self) -> dict:
+        """A Mongo-safe document (concept ids may contain dots, so evidence is
+        stored as ``[id, phrases]`` pairs rather than a sub-document)."""
+        a = self.analysis
+        return {
+            "conceptIds": sorted(a.concept_ids),
+            "conceptEvidence": [[cid, list(ev)] for cid, ev in sorted(a.concept_evidence.items())],
+            "ngrams": sorted(a.ngrams),
+            "unigrams": sorted(a.unigrams),
+            "skills": list(self.skills),
+            "rankedKeywords": [[term, count] for term, count in self.ranked],
+            "vocabulary": sorted(self.vocabulary),
+        }
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "ResumeSignals":
+        return cls(
+            analysis=analyze.ResumeAnalysis(
+                concept_ids=set(doc["conceptIds"]),
+                concept_evidence={cid: list(ev) for cid, ev in doc["conceptEvidence"]},
+                ngrams=set(doc["ngrams"]),
+                unigrams=set(doc["unigrams"]),
+            ),
+            skills=list(doc["skills"]),
+            ranked=[(term, count) for term, count in doc["rankedKeywords"]],
+            vocabulary=set(doc["vocabulary"]),
+        )
+
+
+def prepare_resume(resume_text: str) -> ResumeSignals:
+    """Run all of the résumé-side text processing once (see ``ResumeSignals``)."""
+    # Tokenize the text once for the keyword signals (AUD-16): the skills list
+    # and the full ranked-keyword list are reused for keyword coverage and the
+    # term profile rather than recomputed inside every ``profile()`` call.
+    skills = keywords.extract_skills(resume_text)
+    return ResumeSignals(
+        analysis=analyze.analyze_resume(resume_text),
+        skills=skills,
+        ranked=keywords.ranked_keywords(resume_text),
+        vocabulary=keywords.vocabulary(resume_text, skills=skills),
+    )
+
+
 def score_match(resume_text: str, job_text: str, *, keyword_limit: int = 25) -> MatchResult:
     """Compare a résumé to a job description and return an explainable result."""
-    job = analyze.analyze_job(job_text)
-    resume = analyze.analyze_resume(resume_text)
+    return score_prepared(prepare_resume(resume_text), job_text, keyword_limit=keyword_limit)
+
 
-    # Tokenize each text once for the keyword signals (AUD-16): the skills list
-    # and the full ranked-keyword list are extracted a single time per text and
-    # reused for keyword coverage and both term profiles below, rather than being
-    # recomputed inside every `profile()` call (the résumé and job were each
-    # tokenized for keywords twice before, at different limits).
-    job_skills = keywords.extract_skills(job_text)
-    job_ranked = keywords.ranked_keywords(job_text)
-    resume_skills = keywords.extract_skills(resume_text)
-    resume_ranked = keywords.ranked_keywords(resume_text)
+@timed("cpu", "matching.score_match")
+def score_prepared(
+    resume_signals: ResumeSignals, job_text: str, *, keyword_limit: int = 25
+) -> MatchResult:
+    """``score_match`` for an already-prepared résumé. The job side comes from
+    ``job_cache``, so a posting's text is only analyzed the first time."""
+    job_signals = job_cache.job_signals(job_text)
+    job = job_signals.analysis
+    resume = resume_signals.analysis
+    job_skills = job_signals.skills
+    job_ranked = job_signals.ranked
 
-    keyword_cov = _keyword_coverage(job_skills, job_ranked, resume_text, resume_skills)
+    keyword_cov = _keyword_coverage(job_skills, job_ranked, resume_signals.vocabulary)
 
     resume_profile = keywords.build_profile(
-        resume_skills, resume_ranked, keyword_limit=keyword_limit * 2
+        resume_signals.skills, resume_signals.ranked, keyword_limit=keyword_limit * 2
     )
     job_profile = keywords.build_profile(
         job_skills, job_ranked, keyword_limit=keyword_limit
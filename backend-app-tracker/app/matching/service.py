@@ -7,29 +7,34 @@ URL. Every function returns plain dicts shaped for the response schemas.
 
 from __future__ import annotations
 
+from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import status
 
 from app.common.errors import raise_error
-from app.matching import keywords, scoring
+from app.discovery.enrich import match_text
+from app.matching import batch, keywords, resume_store, scoring
 from app.matching.extract import extract_resume_text, html_to_text
 from app.matching.fetch import FetchError, fetch_url
 from app.jobs.service import read_validated_resume
 from app.resumes.service import get_resume_file
 
 
-def _resume_text_from_id(db, resume_id: str, user_id: str) -> str:
-    """Load an uploaded résumé (ownership enforced) and extract its text."""
+def _resume_signals_from_id(db, resume_id: str, user_id: str) -> scoring.ResumeSignals:
+    """Load an uploaded résumé's stored analysis (ownership enforced).
+
+    The analysis is saved with the file at upload, so this is normally just
+    the file document; older or stale files are analyzed once and updated.
+    """
     file = get_resume_file(db, resume_id, user_id)
-    text = extract_resume_text(
-        file.read(), content_type=file.content_type, filename=file.filename
-    )
-    if not text:
+    signals = resume_store.signals(resume_store.load_analysis(db, file))
+    if signals is None:
         raise_error(
             code="RESUME_UNREADABLE",
             message="Could not extract text from this résumé file",
             http_status=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
-    return text
+    return signals
 
 
 def _job_text_from_url(url: str) -> tuple[str, str]:
@@ -91,19 +96,74 @@ def extract_resume_upload(upload) -> dict:
     }
 
 
+def _resume_signals(db, payload, user_id: str) -> scoring.ResumeSignals:
+    if payload.resumeText:
+        return scoring.prepare_resume(payload.resumeText)
+    return _resume_signals_from_id(db, payload.resumeId, user_id)
+
+
+def _discovered_postings(db, ids: list[str]) -> dict[str, dict]:
+    """id → posting (title, company, description) for the ids that exist."""
+    oids = []
+    for raw in ids:
+        try:
+            oids.append(ObjectId(raw))
+        except (InvalidId, TypeError):
+            continue
+    if not oids:
+        return {}
+    cursor = db.discovered_jobs.find(
+        {"_id": {"$in": oids}}, {"title": 1, "company": 1, "description": 1}
+    )
+    return {str(doc["_id"]): doc for doc in cursor}
+
+
+def score_batch(db, payload, user_id: str) -> dict:
+    """Score one résumé against many postings; compact results, best first.
+
+    The résumé is resolved and analyzed once. Discovered-job ids that don't
+    exist are reported in ``notFound`` rather than failing the batch.
+    """
+    resume_signals = _resume_signals(db, payload, user_id)
+    postings = _discovered_postings(
+        db, [job.discoveredJobId for job in payload.jobs if job.discoveredJobId]
+    )
+
+    entries: list[dict] = []
+    texts: list[str] = []
+    not_found: list[str] = []
+    for index, job in enumerate(payload.jobs):
+        entry = {"index": index, "ref": job.ref, "discoveredJobId": job.discoveredJobId}
+        if job.discoveredJobId:
+            doc = postings.get(job.discoveredJobId)
+            if doc is None:
+                not_found.append(job.discoveredJobId)
+                continue
+            entry.update(title=doc.get("title"), company=doc.get("company"))
+            texts.append(match_text(doc))
+        else:
+            entry.update(title=None, company=None)
+            texts.append(job.jobDescription)
+        entries.append(entry)
+
+    scored = batch.score_texts(
+        resume_signals, texts, payload.gapLimit, batch.get_scorer()
+    )
+    results = [{**entry, **row} for entry, row in zip(entries, scored)]
+    results.sort(key=lambda r: (-r["score"], r["index"]))
+    return {"results": results, "notFound": not_found}
+
+
 def score(db, payload, user_id: str) -> dict:
     """Resolve résumé + job text from the request and compute a match score."""
-    if payload.resumeText:
-        resume_text = payload.resumeText
-    else:
-        resume_text = _resume_text_from_id(db, payload.resumeId, user_id)
+    resume_signals = _resume_signals(db, payload, user_id)
 
     if payload.jobDescription:
         job_text = payload.jobDescription
     else:
         job_text, _ = _job_text_from_url(str(payload.jobUrl))
 
-    result = scoring.score_match(resume_text, job_text)
+    result = scoring.score_prepared(resume_signals, job_text)
 
     def _term(m) -> dict:
         return {
@@ -22,9 +22,9 @@ says 'lldp neighbor checks'").
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 
+from app.matching.automaton import AliasAutomaton
 from app.matching.keywords import SKILL_ALIASES, normalize
 
 # Tiers, ordered by how strongly a match counts.
@@ -331,6 +331,10 @@ for _c in CONCEPTS:
         _ALIAS_TO_CONCEPT.setdefault(_alias, _c.id)
 _ALIASES_BY_LENGTH: list[str] = sorted(_ALIAS_TO_CONCEPT, key=len, reverse=True)
 
+# One automaton over every concept alias (a superset of the skill aliases),
+# built once at import so detection is a single pass over the text.
+_CONCEPT_AUTOMATON = AliasAutomaton(_ALIASES_BY_LENGTH)
+
 
 @dataclass
 class ConceptHit:
@@ -346,21 +350,21 @@ def detect_concepts(text: str) -> dict[str, ConceptHit]:
 
     Word-boundary aware (so ``java`` isn't found in ``javascript`` and ``go``
     isn't found in ``goal``). Multiple aliases of the same concept accumulate as
-    evidence phrases.
+    evidence phrases. Every alias is located in a single pass over the text.
     """
-    norm = normalize(text)
+    positions = _CONCEPT_AUTOMATON.first_positions(normalize(text))
     hits: dict[str, ConceptHit] = {}
+    # Longest alias first so evidence keeps its established order.
     for alias in _ALIASES_BY_LENGTH:
-        pattern = r"(?<![a-z0-9])" + re.escape(alias) + r"(?![a-z0-9])"
-        m = re.search(pattern, norm)
-        if not m:
+        start = positions.get(alias)
+        if start is None:
             continue
         cid = _ALIAS_TO_CONCEPT[alias]
         concept = CONCEPT_BY_ID[cid]
         hit = hits.get(cid)
         if hit is None:
-            hits[cid] = ConceptHit(concept=concept, evidence=[alias], position=m.start())
+            hits[cid] = ConceptHit(concept=concept, evidence=[alias], position=start)
         elif alias not in hit.evidence:
             hit.evidence.append(alias)
-            hit.position = min(hit.position, m.start())
+            hit.position = min(hit.position, start)
     return hits
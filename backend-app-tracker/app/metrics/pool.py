@@ -0,0 +1,142 @@
+"""Mongo connection-pool usage, for sizing ``MONGODB_MAX_POOL_SIZE``.
+
+Each client (``sync`` pymongo, ``async`` Motor) registers a ``PoolMonitor``
+as a driver event listener. Per server it tracks the connections open, checked
+out and being waited for, with high-water marks since startup. A pool whose
+``maxInUse`` reaches ``maxPoolSize`` or has ``maxWaiting > 0`` is too small
+for the load. Check-out wait time is also observed as a ``pool`` histogram
+(``app.metrics.registry``) per endpoint, so ``GET /metrics`` shows which
+routes queue for a connection.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from pymongo import monitoring
+
+from app.metrics.registry import registry
+
+
+class _PoolStats:
+    __slots__ = (
+        "max_pool_size",
+        "open",
+        "in_use",
+        "waiting",
+        "max_in_use",
+        "max_waiting",
+        "checkouts",
+        "failed_checkouts",
+        "cleared",
+    )
+
+    def __init__(self):
+        self.max_pool_size: int | None = None
+        self.open = self.in_use = self.waiting = 0
+        self.max_in_use = self.max_waiting = 0
+        self.checkouts = self.failed_checkouts = self.cleared = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "maxPoolSize": self.max_pool_size,
+            "open": self.open,
+            "inUse": self.in_use,
+            "waiting": self.waiting,
+            "maxInUse": self.max_in_use,
+            "maxWaiting": self.max_waiting,
+            "checkouts": self.checkouts,
+            "failedCheckouts": self.failed_checkouts,
+            "cleared": self.cleared,
+        }
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Pool listener for one client; see the module docstring."""
+
+    def __init__(self, client: str):
+        self.client = client
+        self._lock = threading.Lock()
+        self._pools: dict[str, _PoolStats] = {}
+
+    def _stats(self, address) -> _PoolStats:
+        # Called with the lock held.
+        key = "%s:%s" % address if isinstance(address, tuple) else str(address)
+        stats = self._pools.get(key)
+        if stats is None:
+            stats = self._pools[key] = _PoolStats()
+        return stats
+
+    def pool_created(self, event) -> None:
+        with self._lock:
+            self._stats(event.address).max_pool_size = event.options.get("maxPoolSize")
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        with self._lock:
+            self._stats(event.address).cleared += 1
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self._stats(event.address).open += 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            self._stats(event.address).open -= 1
+
+    def connection_check_out_started(self, event) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.waiting += 1
+            stats.max_waiting = max(stats.max_waiting, stats.waiting)
+
+    def connection_check_out_failed(self, event) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.waiting -= 1
+            stats.failed_checkouts += 1
+
+    def connection_checked_out(self, event) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.waiting -= 1
+            stats.in_use += 1
+            stats.checkouts += 1
+            stats.max_in_use = max(stats.max_in_use, stats.in_use)
+        if event.duration is not None:
+            registry.observe("pool", f"{self.client}.checkout", event.duration)
+
+    def connection_checked_in(self, event) -> None:
+        with self._lock:
+            self._stats(event.address).in_use -= 1
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [
+                {"client": self.client, "address": address, **stats.snapshot()}
+                for address, stats in sorted(self._pools.items())
+            ]
+
+
+_monitors: dict[str, PoolMonitor] = {}
+
+
+def pool_monitor(client: str) -> PoolMonitor:
+    """The (shared) monitor for the named client."""
+    monitor = _monitors.get(client)
+    if monitor is None:
+        monitor = _monitors[client] = PoolMonitor(client)
+    return monitor
+
+
+def pool_snapshot() -> list[dict]:
+    """Usage of every monitored pool, one row per client and server."""
+    return [row for name in sorted(_monitors) for row in _monitors[name].snapshot()]
@@ -0,0 +1,195 @@
+"""Mongo query profiling: latency histograms, slow-query log, sampled plans.
+
+Hot read paths wrap their driver call in ``profile_query``::
+
+    with profile_query(jobs, "find", filter=query, sort=sort, limit=n) as span:
+        docs = list(jobs.find(query).sort(sort).limit(n))
+        span.returned = len(docs)
+
+Every call is timed as a ``mongo`` span (``app.metrics.registry``) named
+``<collection>.<op>``, feeding the per-endpoint histograms and the request's
+``Server-Timing``. A call slower than ``SLOW_QUERY_MS`` is logged with its
+filter's field names (never its values).
+A ``QUERY_PLAN_SAMPLE_RATE`` fraction of calls is re-run through ``explain``
+with execution stats on a single background thread — off the request path,
+and dropped rather than queued when the thread is busy — and the summary
+(documents and keys examined vs returned, plan stages) is kept in a short ring
+buffer served by ``GET /metrics``. A server that can't explain (e.g. the test
+backend) simply produces no samples.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from pymongo.collection import Collection
+from pymongo.errors import PyMongoError
+
+from app.config import settings
+from app.metrics.registry import current_endpoint, span
+
+logger = logging.getLogger("careerlog.metrics")
+
+_MAX_PLAN_SAMPLES = 200
+_MAX_PENDING_EXPLAINS = 8
+
+_samples: deque[dict] = deque(maxlen=_MAX_PLAN_SAMPLES)
+_pending = threading.BoundedSemaphore(_MAX_PENDING_EXPLAINS)
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+class QuerySpan:
+    """One profiled call; the caller sets ``returned`` once it has the rows."""
+
+    def __init__(self, collection: Collection, op: str, command: dict):
+        self.collection = collection
+        self.name = f"{collection.name}.{op}"
+        self.command = command
+        self.returned: int | None = None
+
+
+def plan_stages(plan: dict) -> set[str]:
+    """Every stage name in an explain plan tree (classic or SBE layout)."""
+    stages: set[str] = set()
+    pending = [plan]
+    while pending:
+        node = pending.pop()
+        if not isinstance(node, dict):
+            continue
+        if "stage" in node:
+            stages.add(node["stage"])
+        for key in ("inputStage", "queryPlan", "winningPlan"):
+            if key in node:
+                pending.append(node[key])
+        pending.extend(node.get("inputStages", []))
+    return stages
+
+
+def _explain_command(collection: Collection, op: str, **spec) -> dict:
+    """The command ``explain`` should run for a ``find``/``aggregate``/``count``."""
+    name = collection.name
+    if op == "aggregate":
+        return {"aggregate": name, "pipeline": spec.get("pipeline") or [], "cursor": {}}
+    if op == "count":
+        return {"count": name, "query": spec.get("filter") or {}}
+    command = {"find": name, "filter": spec.get("filter") or {}}
+    for key in ("sort", "projection", "skip", "limit"):
+        if spec.get(key):
+            value = spec[key]
+            command[key] = dict(value) if key == "sort" else value
+    return command
+
+
+def summarize_explain(result: dict) -> dict:
+    """Docs/keys examined, rows returned and plan stages of an explain result.
+
+    Handles a plain find/count explain and an aggregate whose first stage is
+    the ``$cursor`` that did the collection access.
+    """
+    source = result
+    stages = result.get("stages")
+    if "executionStats" not in result and stages and isinstance(stages[0], dict):
+        source = stages[0].get("$cursor", {})
+    stats = source.get("executionStats", {})
+    winning = source.get("queryPlanner", {}).get("winningPlan", {})
+    return {
+        "docsExamined": stats.get("totalDocsExamined"),
+        "keysExamined": stats.get("totalKeysExamined"),
+        "nReturned": stats.get("nReturned"),
+        "stages": sorted(plan_stages(winning)),
+    }
+
+
+def _explain(query: QuerySpan, endpoint: str, ms: float) -> None:
+    # Runs on the explain thread, so a Motor collection explains through the
+    # sync driver it wraps.
+    database = query.collection.database
+    database = getattr(database, "delegate", database)
+    try:
+        result = database.command("explain", query.command, verbosity="executionStats")
+    except (PyMongoError, NotImplementedError, TypeError):
+        return
+    finally:
+        _pending.release()
+    _samples.append(
+        {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "endpoint": endpoint,
+            "name": query.name,
+            "ms": round(ms, 3),
+            "returned": query.returned,
+            **summarize_explain(result),
+        }
+    )
+
+
+def _submit_explain(query: QuerySpan, ms: float) -> None:
+    global _executor
+    if not _pending.acquire(blocking=False):
+        return
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="query-plan")
+        executor = _executor
+    try:
+        future = executor.submit(_explain, query, current_endpoint(), ms)
+    except RuntimeError:  # shut down meanwhile (``shutdown_explainer``)
+        _pending.release()
+        logger.debug("Query plan sample for %s dropped: explainer shut down", query.name)
+        return
+    future.add_done_callback(_release_if_cancelled)
+
+
+def _release_if_cancelled(future: Future) -> None:
+    # A sample cancelled by ``shutdown_explainer`` never runs ``_explain``,
+    # which would otherwise release its slot.
+    if future.cancelled():
+        _pending.release()
+
+
+@contextmanager
+def profile_query(collection: Collection, op: str, **spec) -> Iterator[QuerySpan]:
+    """Time the Mongo call made inside; see the module docstring. Works for a
+    sync or an async (Motor) collection — the call inside may ``await``.
+
+    ``spec`` describes the call for ``explain``: ``filter``, ``sort``,
+    ``projection``, ``skip`` and ``limit`` for a find, ``filter`` for a count,
+    ``pipeline`` for an aggregate.
+    """
+    query = QuerySpan(collection, op, _explain_command(collection, op, **spec))
+    with span("mongo", query.name) as timing:
+        yield query
+    ms = timing.seconds * 1000
+    if ms >= settings.slow_query_ms:
+        logger.warning(
+            "Slow query %s on %s: %.1f ms, %s rows (filter fields: %s)",
+            query.name,
+            current_endpoint(),
+            ms,
+            "?" if query.returned is None else query.returned,
+            ", ".join(sorted(spec.get("filter") or {})) or "-",
+        )
+    if settings.query_plan_sample_rate > 0 and random.random() < settings.query_plan_sample_rate:
+        _submit_explain(query, ms)
+
+
+def plan_samples() -> list[dict]:
+    """The most recent sampled plans, oldest first."""
+    return list(_samples)
+
+
+def shutdown_explainer() -> None:
+    """Stop the background explain thread (app shutdown)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
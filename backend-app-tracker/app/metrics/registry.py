@@ -0,0 +1,238 @@
+"""In-process latency metrics: per-endpoint histograms and request timing.
+
+Every instrumented operation lands in one ``Histogram`` per
+``(kind, endpoint, name)`` — e.g. ``("mongo", "/api/discovery/jobs",
+"discovered_jobs.aggregate")``. Kinds are ``request`` (wall time of a whole
+request, named by HTTP method), ``mongo`` (see ``app.metrics.queries``),
+``http`` (outbound fetches), ``cpu`` (the matching engine) and ``pool`` (waits
+for a Mongo connection, see ``app.metrics.pool``). The endpoint is
+the route template of the request being served — ``MetricsMiddleware`` makes
+it available to everything the request runs, including sync routes in the
+threadpool — or the name given to ``endpoint_scope`` by background work such
+as the alert processors.
+
+Histograms use fixed millisecond buckets plus a short window of recent samples
+for rolling p50/p95/p99, so recording is a bisect, a few increments and a
+deque append under a lock — cheap enough to leave on. ``GET /metrics`` serves
+``registry.snapshot()``.
+
+``MetricsMiddleware`` also totals each request's time per kind and reports it
+in a ``Server-Timing`` header (``total``, ``mongo``, ``http``, ``cpu``). A
+kind's total is the wall time during which at least one of its spans was open,
+so nested spans (``score_match`` around ``analyze_job``) and concurrent ones
+(a multi-board fetch) aren't counted twice.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from starlette.datastructures import MutableHeaders
+
+# Upper bounds (ms) of the latency buckets; the last bucket is unbounded.
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Recent samples kept per histogram for the rolling percentiles.
+_WINDOW = 512
+_PERCENTILES = (50, 95, 99)
+
+# The ASGI scope of the request in flight (its ``route`` is filled in once the
+# router has matched), or a fixed name for background work.
+_endpoint: ContextVar[dict | str | None] = ContextVar("metrics_endpoint", default=None)
+
+
+class Histogram:
+    """Bucketed latency distribution, count / sum / max, and recent samples."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: deque[float] = deque(maxlen=_WINDOW)
+
+    def observe(self, ms: float) -> None:
+        self.buckets[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.recent.append(ms)
+
+    def snapshot(self) -> dict:
+        recent = sorted(self.recent)
+        return {
+            "count": self.count,
+            "sumMs": round(self.total_ms, 3),
+            "maxMs": round(self.max_ms, 3),
+            # Per-bucket (not cumulative) counts; the last is "> 10000 ms".
+            "buckets": list(self.buckets),
+            # Percentiles over the last ``_WINDOW`` samples.
+            **{
+                f"p{p}Ms": round(recent[(len(recent) - 1) * p // 100], 3)
+                for p in _PERCENTILES
+                if recent
+            },
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, kind: str, name: str, seconds: float) -> None:
+        """Record one ``name`` operation of ``kind`` for the current endpoint."""
+        key = (kind, current_endpoint(), name)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds * 1000)
+
+    def snapshot(self) -> dict:
+        """``{kind: [{endpoint, name, count, sumMs, maxMs, buckets, p50Ms, …}]}``."""
+        with self._lock:
+            rows = [
+                (kind, endpoint, name, h.snapshot())
+                for (kind, endpoint, name), h in self._histograms.items()
+            ]
+        out: dict[str, list[dict]] = {}
+        for kind, endpoint, name, data in sorted(rows, key=lambda r: r[:3]):
+            out.setdefault(kind, []).append({"endpoint": endpoint, "name": name, **data})
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+registry = MetricsRegistry()
+
+
+def current_endpoint() -> str:
+    """Route template of the current request, a background job's name, or "-"."""
+    value = _endpoint.get()
+    if isinstance(value, dict):
+        route = value.get("route")
+        return getattr(route, "path", None) or "unrouted"
+    return value or "-"
+
+
+@contextmanager
+def endpoint_scope(name: str) -> Iterator[None]:
+    """Attribute everything recorded inside to ``name`` (background work)."""
+    token = _endpoint.set(name)
+    try:
+        yield
+    finally:
+        _endpoint.reset(token)
+
+
+class RequestTimings:
+    """Per-request wall time spent in each kind of span (see module docstring)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open: dict[str, int] = {}
+        self._since: dict[str, float] = {}
+        self.seconds: dict[str, float] = {}
+
+    def enter(self, kind: str, now: float) -> None:
+        with self._lock:
+            if not self._open.get(kind):
+                self._since[kind] = now
+            self._open[kind] = self._open.get(kind, 0) + 1
+
+    def exit(self, kind: str, now: float) -> None:
+        with self._lock:
+            self._open[kind] -= 1
+            if not self._open[kind]:
+                self.seconds[kind] = self.seconds.get(kind, 0.0) + now - self._since[kind]
+
+    def server_timing(self, total: float) -> str:
+        with self._lock:
+            parts = [("total", total), *sorted(self.seconds.items())]
+        return ", ".join(f"{kind};dur={seconds * 1000:.1f}" for kind, seconds in parts)
+
+
+_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+class Span:
+    """An open timing span; ``seconds`` is set once it closes."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self):
+        self.seconds = 0.0
+
+
+@contextmanager
+def span(kind: str, name: str) -> Iterator[Span]:
+    """Time the block into ``kind`` histograms and the request's totals."""
+    timings = _timings.get()
+    started = time.perf_counter()
+    if timings is not None:
+        timings.enter(kind, started)
+    current = Span()
+    try:
+        yield current
+    finally:
+        finished = time.perf_counter()
+        if timings is not None:
+            timings.exit(kind, finished)
+        current.seconds = finished - started
+        registry.observe(kind, name, current.seconds)
+
+
+def timed(kind: str, name: str):
+    """Decorator form of ``span`` for a sync function."""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(kind, name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: exposes the request's scope to ``current_endpoint``,
+    records its wall time, and adds the ``Server-Timing`` header."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        endpoint_token = _endpoint.set(scope)
+        timings_token = _timings.set(timings)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing", timings.server_timing(time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            registry.observe("request", scope["method"], time.perf_counter() - started)
+            _timings.reset(timings_token)
+            _endpoint.reset(endpoint_token)
@@ -0,0 +1,45 @@
+import hmac
+
+from fastapi import APIRouter, Header, status
+
+from app.common.errors import raise_error
+from app.common.responses import success
+from app.config import settings
+from app.matching import job_cache
+from app.metrics.pool import pool_snapshot
+from app.metrics.queries import plan_samples
+from app.metrics.registry import BUCKETS_MS, registry
+
+router = APIRouter()
+
+
+def _require_token(token: str | None) -> None:
+    expected = settings.metrics_token
+    if not expected:
+        raise_error(
+            code="RESOURCE_NOT_FOUND",
+            message="Metrics are disabled",
+            http_status=status.HTTP_404_NOT_FOUND,
+        )
+    if not token or not hmac.compare_digest(token, expected):
+        raise_error(
+            code="FORBIDDEN",
+            message="Invalid metrics token",
+            http_status=status.HTTP_403_FORBIDDEN,
+        )
+
+
+@router.get("")
+def get_metrics(x_metrics_token: str | None = Header(None)):
+    """Internal: latency histograms per endpoint, sampled query plans and
+    Mongo connection-pool usage and in-process cache counters."""
+    _require_token(x_metrics_token)
+    return success(
+        data={
+            "bucketsMs": list(BUCKETS_MS),
+            "histograms": registry.snapshot(),
+            "planSamples": plan_samples(),
+            "pools": pool_snapshot(),
+            "caches": {"jobAnalysis": job_cache.cache_stats()},
+        }
+    )
@@ -7,6 +7,9 @@ class Preferences(BaseModel):
     preferredCompanies: list[str] = Field(default_factory=list)
     hiddenCompanies: list[str] = Field(default_factory=list)
     hiddenEmploymentTypes: list[str] = Field(default_factory=list)
+    # Résumé the Discover feed's best-match ranking scores against (when unset,
+    # the most recent upload).
+    defaultResumeId: Optional[str] = None
 
 
 class UpdatePreferencesRequest(BaseModel):
@@ -15,3 +18,4 @@ class UpdatePreferencesRequest(BaseModel):
     preferredCompanies: Optional[list[str]] = None
     hiddenCompanies: Optional[list[str]] = None
     hiddenEmploymentTypes: Optional[list[str]] = None
+    defaultResumeId: Optional[str] = None  # "" clears it
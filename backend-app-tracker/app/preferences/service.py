@@ -5,17 +5,29 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from app.common.crud import clean_str_list
+from app.resumes.service import get_resume_file
 
 _LIST_FIELDS = ("preferredCompanies", "hiddenCompanies", "hiddenEmploymentTypes")
 
-_DEFAULTS = {field: [] for field in _LIST_FIELDS}
+_DEFAULTS = {**{field: [] for field in _LIST_FIELDS}, "defaultResumeId": None}
 
 
-def get_preferences(db, user_id: str) -> dict:
-    doc = db.user_preferences.find_one({"userId": user_id})
+def _from_doc(doc: dict | None) -> dict:
     if not doc:
         return dict(_DEFAULTS)
-    return {field: doc.get(field, []) for field in _LIST_FIELDS}
+    return {
+        **{field: doc.get(field, []) for field in _LIST_FIELDS},
+        "defaultResumeId": doc.get("defaultResumeId"),
+    }
+
+
+def get_preferences(db, user_id: str) -> dict:
+    return _from_doc(db.user_preferences.find_one({"userId": user_id}))
+
+
+async def get_preferences_async(db, user_id: str) -> dict:
+    """``get_preferences`` over the async (Motor) database."""
+    return _from_doc(await db.user_preferences.find_one({"userId": user_id}))
 
 
 def update_preferences(db, user_id: str, payload) -> dict:
@@ -24,6 +36,11 @@ def update_preferences(db, user_id: str, payload) -> dict:
         value = getattr(payload, field)
         if value is not None:
             updates[field] = clean_str_list(value)
+    if payload.defaultResumeId is not None:
+        if payload.defaultResumeId:
+            # Must be one of the caller's résumés (raises otherwise).
+            get_resume_file(db, payload.defaultResumeId, user_id)
+        updates["defaultResumeId"] = payload.defaultResumeId or None
 
     updates["updatedAt"] = datetime.now(tz=timezone.utc)
     db.user_preferences.update_one(
@@ -8,6 +8,7 @@ from gridfs import GridFS
 from pymongo.collection import Collection
 from pymongo.database import Database
 
+from app.common.auth import live_users
 from app.common.errors import raise_error
 from app.users.schemas import User
 
@@ -110,6 +111,8 @@ def update_user(users: Collection, user_id: str, payload) -> dict:
 
 def delete_user(users: Collection, user_id: str) -> None:
     result = users.delete_one({"_id": _to_object_id(user_id)})
+    # Its tokens stop authenticating here at once (other replicas: see live_users).
+    live_users.forget(user_id)
     if result.deleted_count == 0:
         raise_error(
             code="RESOURCE_NOT_FOUND",
@@ -0,0 +1 @@
+"""Standalone performance benchmarks (not part of the test suite)."""
@@ -0,0 +1,179 @@
+"""Concurrent load on the hot read paths: sync (threadpool) vs async (Motor).
+
+Seeds a scratch database with one user's tracked jobs and a Discover feed,
+then fires waves of concurrent calls at each read path two ways:
+
+* ``sync``  — the pymongo service function dispatched through a 40-thread
+  limiter, exactly how FastAPI serves a ``def`` route;
+* ``async`` — the ``*_async`` service function awaited on the event loop, how
+  the ``async def`` routes serve it now.
+
+and reports calls/second and p50 / p99 latency per path and concurrency level.
+Needs a reachable MongoDB (``MONGODB_URI``); the scratch database is dropped
+afterwards.
+
+    python -m benchmarks.async_paths [--concurrency 10,100,400] [--rounds 3]
+                                     [--jobs 500] [--postings 5000]
+                                     [--db careerlog_bench]
+
+The gap widens with Mongo latency: a remote cluster makes every sync call hold
+its thread longer, so waves larger than the pool queue behind it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+# Settings are validated on import.
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/bench")
+os.environ.setdefault("JWT_SECRET", "benchmark-only-not-a-real-secret")
+
+import anyio.to_thread  # noqa: E402
+from anyio import CapacityLimiter  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+from pymongo import MongoClient  # noqa: E402
+
+from app.analytics import service as analytics  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import client_options, ensure_indexes  # noqa: E402
+from app.discovery import service as discovery  # noqa: E402
+from app.jobs import service as jobs  # noqa: E402
+
+# FastAPI/Starlette's default threadpool size for sync routes.
+THREADPOOL_SIZE = 40
+
+USER_ID = "bench-user"
+_STATUSES = ("applied", "interviewing", "offer", "rejected")
+
+
+def seed(db, n_jobs: int, n_postings: int) -> None:
+    now = datetime.now(tz=timezone.utc)
+    db.jobs.insert_many(
+        {
+            "userId": USER_ID,
+            "jobTitle": f"Engineer {i}",
+            "company": f"Company {i % 50}",
+            "status": _STATUSES[i % 4],
+            "statusHistory": [{"status": "applied", "at": now - timedelta(days=i % 90)}],
+            "createdAt": now - timedelta(days=i % 90),
+            "updatedAt": now,
+        }
+        for i in range(n_jobs)
+    )
+    db.discovered_jobs.insert_many(
+        {
+            "source": ("greenhouse", "lever")[i % 2],
+            "boardToken": f"board{i % 40}",
+            "sourceId": str(i),
+            "title": f"Software Engineer {i}",
+            "company": f"Company {i % 200}",
+            "url": f"https://example.com/jobs/{i}",
+            # Every third posting is a cross-board duplicate of the one before.
+            "dedupeKey": f"posting-{i - (i % 3 == 2)}",
+            "postedAt": now - timedelta(minutes=i),
+        }
+        for i in range(n_postings)
+    )
+
+
+def read_paths(sync_db, async_db) -> dict:
+    """``{name: (sync call, async coroutine factory)}`` for each hot read path."""
+    page = dict(page=1, page_size=25, sort_by="createdAt", sort_order="desc", filters=None)
+    feed = dict(page=1, page_size=25, sort_by="postedAt", sort_order="desc")
+    filters = discovery.DiscoveryFilters()
+    return {
+        "jobs list": (
+            lambda: jobs.list_jobs(sync_db.jobs, USER_ID, **page),
+            lambda: jobs.list_jobs_async(async_db.jobs, USER_ID, **page),
+        ),
+        "discovery list": (
+            lambda: discovery.list_jobs(sync_db, filters, **feed),
+            lambda: discovery.list_jobs_async(async_db, filters, **feed),
+        ),
+        "analytics summary": (
+            lambda: analytics.get_summary(sync_db.jobs, USER_ID),
+            lambda: analytics.get_summary_async(async_db.jobs, USER_ID),
+        ),
+    }
+
+
+async def _timed(call) -> float:
+    start = time.perf_counter()
+    await call()
+    return time.perf_counter() - start
+
+
+async def wave(mode: str, path, concurrency: int, limiter: CapacityLimiter) -> list[float]:
+    sync_call, async_call = path
+    if mode == "sync":
+
+        def call():
+            return anyio.to_thread.run_sync(sync_call, limiter=limiter)
+
+    else:
+        call = async_call
+    return await asyncio.gather(*(_timed(call) for _ in range(concurrency)))
+
+
+def _percentile(samples: list[float], p: int) -> float:
+    ordered = sorted(samples)
+    return ordered[(len(ordered) - 1) * p // 100] * 1000
+
+
+async def run(args, sync_db, async_db) -> None:
+    limiter = CapacityLimiter(THREADPOOL_SIZE)
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    print(f"{'path':<20}{'mode':<7}{'conc':>6}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, path in read_paths(sync_db, async_db).items():
+        for concurrency in levels:
+            for mode in ("sync", "async"):
+                await wave(mode, path, min(concurrency, 10), limiter)  # warm up
+                samples: list[float] = []
+                start = time.perf_counter()
+                for _ in range(args.rounds):
+                    samples += await wave(mode, path, concurrency, limiter)
+                rate = len(samples) / (time.perf_counter() - start)
+                print(
+                    f"{name:<20}{mode:<7}{concurrency:>6}{rate:>10.0f}"
+                    f"{_percentile(samples, 50):>10.1f}{_percentile(samples, 99):>10.1f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="10,100,400")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--postings", type=int, default=5000)
+    parser.add_argument("--db", default="careerlog_bench")
+    args = parser.parse_args()
+
+    # Measure the paths, not the profiler's slow-query log or sampled explains.
+    settings.slow_query_ms = float("inf")
+    settings.query_plan_sample_rate = 0.0
+
+    # The app's pool settings (MONGODB_MAX_POOL_SIZE etc.) apply here too.
+    sync_client = MongoClient(settings.mongodb_uri, **client_options("sync"))
+    async_client = AsyncIOMotorClient(settings.mongodb_uri, **client_options("async"))
+    sync_db = sync_client[args.db]
+    sync_client.drop_database(args.db)
+    try:
+        ensure_indexes(sync_db)
+        seed(sync_db, args.jobs, args.postings)
+        print(
+            f"{args.jobs} jobs, {args.postings} postings, "
+            f"{THREADPOOL_SIZE}-thread pool for the sync path\n"
+        )
+        asyncio.run(run(args, sync_db, async_client[args.db]))
+    finally:
+        sync_client.drop_database(args.db)
+        sync_client.close()
+        async_client.close()
+
+
+if __name__ == "__main__":
+    main()
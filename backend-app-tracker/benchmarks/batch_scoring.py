@@ -0,0 +1,97 @@
+"""Ranking many postings for one résumé: per-posting ``/score`` vs ``/score-batch``.
+
+Scores one realistic résumé against a synthetic board of postings (as ingest
+stores them) three ways:
+
+* ``per-call`` — what a client ranking the feed through ``/score`` costs:
+  ``scoring.score_match`` per posting, re-analyzing the résumé every time;
+* ``batch``    — ``batch.score_texts`` in-process: the résumé is analyzed once;
+* ``pool N``   — the same on a ``BatchScorer`` of N worker processes.
+
+The job-analysis cache is cleared before every run, so each mode pays for
+analyzing every posting once (a warm cache would only widen the gap). No
+database or network needed.
+
+    python -m benchmarks.batch_scoring [--postings 200] [--workers 2,4]
+                                       [--chunk-size 25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import datetime, timezone
+
+# Settings are validated on import; scoring itself never touches them.
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/bench")
+os.environ.setdefault("JWT_SECRET", "benchmark-only-not-a-real-secret")
+
+from app.discovery import pipeline  # noqa: E402
+from app.discovery.enrich import match_text  # noqa: E402
+from app.matching import batch, job_cache, scoring  # noqa: E402
+from benchmarks.enrich_throughput import synthetic_board  # noqa: E402
+
+_RESUME = (
+    "Senior software engineer with eight years of experience building "
+    "distributed services in Python and Go. Designed event-driven systems on "
+    "AWS (Lambda, SQS, DynamoDB) and Kubernetes, managed infrastructure with "
+    "Terraform, and tuned PostgreSQL for high-volume payments workloads. Led "
+    "CI/CD migrations to GitHub Actions, mentored five engineers and drove "
+    "on-call and incident-review practices.\n"
+) * 6
+
+
+def _postings(n: int) -> list[str]:
+    now = datetime.now(tz=timezone.utc)
+    docs = pipeline.process_items("greenhouse", "acme", now, synthetic_board(n), {})
+    return [match_text(doc) for doc in docs if isinstance(doc, dict)]
+
+
+def _timed(run) -> tuple[float, list[int]]:
+    job_cache.analysis_cache.clear()
+    start = time.perf_counter()
+    scores = run()
+    return time.perf_counter() - start, scores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=200)
+    parser.add_argument("--workers", default="2,4")
+    parser.add_argument("--chunk-size", type=int, default=25)
+    args = parser.parse_args()
+
+    texts = _postings(args.postings)
+
+    def per_call() -> list[int]:
+        return [scoring.score_match(_RESUME, text).score for text in texts]
+
+    def batched(scorer=None) -> list[int]:
+        signals = scoring.prepare_resume(_RESUME)
+        return [r["score"] for r in batch.score_texts(signals, texts, 3, scorer)]
+
+    baseline, expected = _timed(per_call)
+    print(f"{'mode':<12}{'seconds':>10}{'postings/s':>13}{'speedup':>10}")
+    print(f"{'per-call':<12}{baseline:>10.2f}{len(texts) / baseline:>13.0f}{1:>9.1f}x")
+    elapsed, scores = _timed(batched)
+    assert scores == expected
+    print(f"{'batch':<12}{elapsed:>10.2f}{len(texts) / elapsed:>13.0f}{baseline / elapsed:>9.1f}x")
+
+    for workers in (int(w) for w in args.workers.split(",") if w):
+        if workers > (os.cpu_count() or 1):
+            continue
+        scorer = batch.BatchScorer(workers, args.chunk_size)
+        try:
+            # Spawn the workers without warming their caches with these postings.
+            scorer.score(scoring.prepare_resume("Python"), ["Python"] * 2 * workers, 0)
+            elapsed, scores = _timed(lambda: batched(scorer))
+        finally:
+            scorer.shutdown()
+        assert scores == expected
+        label = f"pool {workers}"
+        print(f"{label:<12}{elapsed:>10.2f}{len(texts) / elapsed:>13.0f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
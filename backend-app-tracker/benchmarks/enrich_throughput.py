@@ -0,0 +1,100 @@
+"""Throughput of the ingest CPU stage (normalize + enrich), serial vs pool.
+
+Runs ``pipeline.process_items`` over a synthetic board of realistic raw
+Greenhouse postings (HTML bodies, salary ranges, seniority cues) — first
+in-process, then on ``EnrichExecutor`` pools of increasing size — and reports
+postings/second overall and per worker core. No database or network needed.
+
+    python -m benchmarks.enrich_throughput [--postings 4000] [--workers 1,2,4]
+                                           [--chunk-size 100]
+
+Worker counts above ``os.cpu_count()`` are skipped: they can't add throughput
+and only measure scheduling overhead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import datetime, timezone
+
+# Settings are validated on import; the stage itself never touches them.
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/bench")
+os.environ.setdefault("JWT_SECRET", "benchmark-only-not-a-real-secret")
+
+from app.discovery import pipeline  # noqa: E402
+
+_PARAGRAPH = (
+    "&lt;p&gt;We are looking for an engineer to build and operate distributed "
+    "services in Python and Go on AWS, with Kubernetes, Terraform and "
+    "PostgreSQL. You will own features end to end, mentor teammates and "
+    "improve our CI/CD pipelines.&lt;/p&gt;"
+)
+
+
+def synthetic_board(n: int) -> list[tuple[dict, str]]:
+    items = []
+    for i in range(n):
+        level = ("Senior ", "Staff ", "", "Junior ")[i % 4]
+        items.append(
+            (
+                {
+                    "id": i,
+                    "title": f"{level}Software Engineer, Platform {i}",
+                    "absolute_url": f"https://boards.greenhouse.io/acme/jobs/{i}",
+                    "updated_at": "2026-06-01T12:00:00Z",
+                    "location": {"name": ("Remote, US", "New York, NY", "Berlin")[i % 3]},
+                    "content": _PARAGRAPH * (4 + i % 8)
+                    + f"&lt;p&gt;Salary: ${110 + i % 40},000 - ${150 + i % 40},000. "
+                    "Bachelor's degree in CS required; 5+ years of experience. "
+                    "We are unable to sponsor visas.&lt;/p&gt;",
+                },
+                "Acme",
+            )
+        )
+    return items
+
+
+def _run(items, executor) -> float:
+    now = datetime.now(tz=timezone.utc)
+    start = time.perf_counter()
+    for _ in pipeline.process_items("greenhouse", "acme", now, items, {}, executor):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=4000)
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--chunk-size", type=int, default=100)
+    args = parser.parse_args()
+
+    items = synthetic_board(args.postings)
+    cores = os.cpu_count() or 1
+    print(f"{args.postings} postings, {cores} CPU core(s)\n")
+    print(f"{'mode':<12}{'seconds':>10}{'postings/s':>14}{'per core':>12}")
+
+    serial = _run(items, None)
+    rate = args.postings / serial
+    print(f"{'serial':<12}{serial:>10.2f}{rate:>14.0f}{rate:>12.0f}")
+
+    for workers in (int(w) for w in args.workers.split(",") if w.strip()):
+        if workers > cores:
+            print(f"{f'pool x{workers}':<12}{'skipped (> cores)':>36}")
+            continue
+        executor = pipeline.EnrichExecutor(workers, args.chunk_size)
+        try:
+            _run(items[: args.chunk_size * workers], executor)  # spawn + warm up
+            elapsed = _run(items, executor)
+        finally:
+            executor.shutdown()
+        rate = args.postings / elapsed
+        print(
+            f"{f'pool x{workers}':<12}{elapsed:>10.2f}{rate:>14.0f}{rate / workers:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Response rendering for the big list routes: default path vs ``fast_success``.
+
+Builds the ``data`` of a full page of ``GET /api/discovery/jobs`` (realistic
+postings from the ingest pipeline, descriptions included) and of
+``GET /api/jobs`` (tracked jobs with status history and résumés) exactly as
+their services return it, then times turning it into a response body both
+ways:
+
+* ``before`` — what FastAPI does with a returned dict: ``jsonable_encoder``
+  over the envelope, then ``JSONResponse`` (stdlib ``json``);
+* ``after``  — ``fast_success``: the envelope rendered by orjson in one pass.
+
+The query itself is the same either way, so it's left out. No database or
+network needed.
+
+    python -m benchmarks.json_responses [--feed-page 100] [--jobs-page 200]
+                                        [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+# Settings are validated on import; rendering never touches them.
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/bench")
+os.environ.setdefault("JWT_SECRET", "benchmark-only-not-a-real-secret")
+
+from bson import ObjectId  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.common.query import page_meta  # noqa: E402
+from app.common.responses import fast_success, success  # noqa: E402
+from app.discovery import pipeline  # noqa: E402
+from app.discovery import service as discovery  # noqa: E402
+from app.jobs import service as jobs  # noqa: E402
+from benchmarks.enrich_throughput import synthetic_board  # noqa: E402
+
+
+def feed_page(n: int) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    items = []
+    for doc in pipeline.process_items("greenhouse", "acme", now, synthetic_board(n), {}, None):
+        doc = discovery._serialize({"_id": ObjectId(), **doc})
+        doc["duplicateCount"] = 2
+        doc["sources"] = [
+            {"source": "greenhouse", "boardToken": "acme", "url": doc["url"]},
+            {"source": "lever", "boardToken": "acme", "url": doc["url"] + "?lever"},
+        ]
+        items.append(doc)
+    return {"items": items, "meta": page_meta(1, n, 5000, "cursor-token")}
+
+
+def jobs_page(n: int) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    items = []
+    for i in range(n):
+        created = now - timedelta(days=i % 90)
+        items.append(
+            jobs._serialize_job(
+                {
+                    "_id": ObjectId(),
+                    "userId": "bench-user",
+                    "jobId": f"external-{i}",
+                    "url": f"https://example.com/jobs/{i}",
+                    "jobTitle": f"Software Engineer {i}",
+                    "company": f"Company {i % 50}",
+                    "salaryTarget": 120000,
+                    "salaryRange": "100k-130k",
+                    "status": "interviewing",
+                    "resume": None,
+                    "location": "Remote",
+                    "employmentType": "full-time",
+                    "notes": "Recruiter screen went well; panel next week. " * 3,
+                    "resumes": [
+                        {
+                            "id": str(ObjectId()),
+                            "filename": "resume.pdf",
+                            "contentType": "application/pdf",
+                            "size": 84512,
+                            "uploadedAt": created,
+                        }
+                    ],
+                    "statusHistory": [
+                        {"status": "applied", "at": created},
+                        {"status": "interviewing", "at": created + timedelta(days=5)},
+                    ],
+                    "createdAt": created,
+                    "updatedAt": now,
+                }
+            )
+        )
+    return {"items": items, "meta": page_meta(1, n, 640, None)}
+
+
+def before(data: dict) -> bytes:
+    return JSONResponse(jsonable_encoder(success(data))).body
+
+
+def after(data: dict) -> bytes:
+    return fast_success(data).body
+
+
+def _per_call_ms(render, data: dict, repeat: int) -> float:
+    render(data)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render(data)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feed-page", type=int, default=100)
+    parser.add_argument("--jobs-page", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {
+        f"/api/discovery/jobs ({args.feed_page})": feed_page(args.feed_page),
+        f"/api/jobs ({args.jobs_page})": jobs_page(args.jobs_page),
+    }
+    print(f"{'route (items)':<28}{'KiB':>8}{'before ms':>12}{'after ms':>11}{'speedup':>10}")
+    for name, data in payloads.items():
+        body = after(data)
+        assert json.loads(body) == json.loads(before(data)), name
+        old = _per_call_ms(before, data, args.repeat)
+        new = _per_call_ms(after, data, args.repeat)
+        print(
+            f"{name:<28}{len(body) / 1024:>8.0f}{old:>12.2f}{new:>11.2f}{old / new:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import json
 import os
 
 # Settings are validated at import time, so required env vars must exist before
@@ -8,6 +9,8 @@ os.environ.setdefault("JWT_SECRET", "test-secret-do-not-use-in-prod")
 os.environ.setdefault("JWT_EXPIRY_HOURS", "2")
 # The background alert scheduler is tested via process_due_alerts directly.
 os.environ.setdefault("ALERTS_ENABLED", "false")
+# Likewise the board refresh worker (tested via refresh_due_boards_async).
+os.environ.setdefault("DISCOVERY_REFRESH_ENABLED", "false")
 
 import mongomock
 import mongomock.gridfs
@@ -18,16 +21,33 @@ from fastapi.testclient import TestClient
 # external database.
 mongomock.gridfs.enable_gridfs_integration()
 
+# pymongo >= 4.11 passes a ``sort`` argument when an ``UpdateOne`` is added to a
+# bulk write; mongomock's builder predates it. Accept and drop it (it's always
+# None for our upserts) so ``bulk_write`` works against the in-memory backend.
+_mongomock_add_update = mongomock.collection.BulkOperationBuilder.add_update
+
+
+def _add_update_ignoring_sort(self, selector, doc, *args, sort=None, **kwargs):
+    return _mongomock_add_update(self, selector, doc, *args, **kwargs)
+
+
+mongomock.collection.BulkOperationBuilder.add_update = _add_update_ignoring_sort
+
 import app.database as database
+from mongomock_motor import AsyncMongoMockClient
 
 _mock_client = mongomock.MongoClient()
 _mock_db = _mock_client[os.environ["MONGODB_DB_NAME"]]
+# The async (Motor) handle is served from the same in-memory store.
+_mock_async_client = AsyncMongoMockClient(mock_mongo_client=_mock_client)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def _patch_db():
     database._client = _mock_client
     database._db = _mock_db
+    database._async_client = _mock_async_client
+    database._async_db = _mock_async_client[os.environ["MONGODB_DB_NAME"]]
     yield
 
 
@@ -52,6 +72,28 @@ def db():
     return database.get_db()
 
 
+@pytest.fixture
+def fake_board(monkeypatch):
+    """Serve ATS board bodies from memory instead of the network.
+
+    ``fake_board(payload)`` serves one JSON payload for every board;
+    ``fake_board(fn)`` maps the board URL to a payload (``fn`` may raise
+    ``ConnectorError``). Bodies are streamed in small chunks, as a real
+    download would be.
+    """
+    from app.discovery import connectors
+
+    def serve(payload):
+        def open_board(url, cache=None):
+            data = payload(url) if callable(payload) else payload
+            body = json.dumps(data).encode()
+            return iter([body[i : i + 256] for i in range(0, len(body), 256)]), None
+
+        monkeypatch.setattr(connectors, "_open_board", open_board)
+
+    return serve
+
+
 @pytest.fixture(scope="session")
 def auth_payload():
     return {
@@ -2,8 +2,6 @@
 
 import pytest
 
-from app.discovery import connectors
-
 FIXTURE = {
     "jobs": [
         {
@@ -37,8 +35,8 @@ def _register(client, auth_payload, email):
 
 
 @pytest.fixture
-def fake_greenhouse(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: FIXTURE)
+def fake_greenhouse(fake_board):
+    fake_board(FIXTURE)
 
 
 def test_snapshot_from_ingested_postings(client, auth_payload, fake_greenhouse):
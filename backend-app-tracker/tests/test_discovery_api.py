@@ -38,8 +38,8 @@ def _register(client, auth_payload, email):
 
 
 @pytest.fixture
-def fake_greenhouse(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: GREENHOUSE_FIXTURE)
+def fake_greenhouse(fake_board):
+    fake_board(GREENHOUSE_FIXTURE)
 
 
 def test_list_sources(client, auth_payload):
@@ -154,9 +154,8 @@ def test_location_facets(client, auth_payload, fake_greenhouse):
     assert [f["value"] for f in ny] == ["New York"]
 
 
-def test_no_location_filter(client, auth_payload, monkeypatch):
+def test_no_location_filter(client, auth_payload, fake_board):
     """FEAT-30: postings with no location are filterable via the sentinel."""
-    from app.discovery import connectors
 
     fixture = {
         "jobs": [
@@ -170,7 +169,7 @@ def test_no_location_filter(client, auth_payload, monkeypatch):
             },
         ]
     }
-    monkeypatch.setattr(connectors, "_get_json", lambda url: fixture)
+    fake_board(fixture)
 
     jwt = _register(client, auth_payload, "disc-noloc@example.com")
     headers = _headers(jwt)
@@ -190,6 +189,136 @@ def test_no_location_filter(client, auth_payload, monkeypatch):
     assert [j["title"] for j in listed["items"]] == ["Mystery Role"]
 
 
+def _facet_counts(db, field):
+    return {
+        row["value"]: row["count"]
+        for row in db.discovery_facets.find({"field": field}, {"_id": 0})
+    }
+
+
+def test_facets_follow_changed_postings_incrementally(
+    client, auth_payload, fake_board, db
+):
+    """Ingest moves facet counts from a posting's old values to its new ones."""
+    jwt = _register(client, auth_payload, "disc-facets@example.com")
+    headers = _headers(jwt)
+
+    def board(location):
+        return {
+            "jobs": [
+                {
+                    "id": 1,
+                    "title": "Platform Engineer",
+                    "absolute_url": "https://boards.greenhouse.io/facetco/jobs/1",
+                    "updated_at": "2026-06-01T12:00:00Z",
+                    "location": {"name": location},
+                    "content": "Kubernetes and Go on a small platform team.",
+                },
+            ]
+        }
+
+    ingest = {"source": "greenhouse", "boardToken": "facetco", "companyName": "FacetCo"}
+    fake_board(board("Facetville"))
+    client.post("/api/discovery/ingest", headers=headers, json=ingest)
+    assert _facet_counts(db, "location")["Facetville"] == 1
+    assert _facet_counts(db, "company")["FacetCo"] == 1
+
+    # Re-ingesting the same board doesn't double count.
+    client.post("/api/discovery/ingest", headers=headers, json=ingest)
+    assert _facet_counts(db, "company")["FacetCo"] == 1
+
+    fake_board(board("Facet City"))
+    client.post("/api/discovery/ingest", headers=headers, json=ingest)
+    locations = _facet_counts(db, "location")
+    assert "Facetville" not in locations
+    assert locations["Facet City"] == 1
+    assert _facet_counts(db, "company")["FacetCo"] == 1
+
+    picked = client.get(
+        "/api/discovery/locations?q=facet", headers=headers
+    ).json()["data"]["locations"]
+    assert picked == [{"value": "Facet City", "count": 1}]
+
+
+def test_facet_rebuild_matches_incremental_counts(
+    client, auth_payload, fake_greenhouse, db
+):
+    from app.discovery import facets
+
+    jwt = _register(client, auth_payload, "disc-facet-rebuild@example.com")
+    client.post(
+        "/api/discovery/ingest",
+        headers=_headers(jwt),
+        json={"source": "greenhouse", "boardToken": "rebuildco"},
+    )
+    incremental = {f: _facet_counts(db, f) for f in facets.FACET_FIELDS}
+    facets.rebuild(db)
+    assert {f: _facet_counts(db, f) for f in facets.FACET_FIELDS} == incremental
+
+
+def test_facet_rebuild_repairs_drifted_counts(client, auth_payload, fake_greenhouse, db):
+    from app.discovery import facets
+
+    jwt = _register(client, auth_payload, "disc-facet-drift@example.com")
+    client.post(
+        "/api/discovery/ingest",
+        headers=_headers(jwt),
+        json={"source": "greenhouse", "boardToken": "driftco"},
+    )
+    expected = {f: _facet_counts(db, f) for f in facets.FACET_FIELDS}
+    db.discovery_facets.update_one(
+        {"field": "source", "value": "greenhouse"}, {"$inc": {"count": 7}}
+    )
+    db.discovery_facets.delete_one({"field": "location", "value": "New York"})
+    db.discovery_facets.insert_one({"field": "location", "value": "Nowhere", "count": 3})
+    facets.rebuild(db)
+    assert {f: _facet_counts(db, f) for f in facets.FACET_FIELDS} == expected
+
+
+def test_partly_failed_batch_counts_only_the_writes_that_landed(
+    monkeypatch, db, fake_greenhouse
+):
+    from pymongo.errors import BulkWriteError
+
+    from app.discovery import service
+
+    def half_written(jobs, ops):
+        result = jobs.bulk_write(ops[:1], ordered=False)
+        raise BulkWriteError(
+            {
+                "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+                "upserted": [{"index": 0, "_id": result.upserted_ids[0]}],
+            }
+        )
+
+    with monkeypatch.context() as m:
+        m.setattr(service, "_flush_batch", half_written)
+        with pytest.raises(BulkWriteError):
+            service.ingest(db, "greenhouse", "halfco", "HalfCo")
+    assert db.discovered_jobs.count_documents({"boardToken": "halfco"}) == 1
+    assert _facet_counts(db, "company")["HalfCo"] == 1
+
+    # The retry counts only the posting that didn't land the first time.
+    service.ingest(db, "greenhouse", "halfco", "HalfCo")
+    assert _facet_counts(db, "company")["HalfCo"] == 2
+
+
+def test_filter_facets(client, auth_payload, fake_greenhouse):
+    jwt = _register(client, auth_payload, "disc-filter-facets@example.com")
+    headers = _headers(jwt)
+    client.post(
+        "/api/discovery/ingest",
+        headers=headers,
+        json={"source": "greenhouse", "boardToken": "filterfacetco"},
+    )
+
+    data = client.get("/api/discovery/facets", headers=headers).json()["data"]
+    assert {"source", "employmentType", "experienceLevel", "workArrangement"} <= set(data)
+    greenhouse = [f for f in data["source"] if f["value"] == "greenhouse"]
+    assert greenhouse and greenhouse[0]["count"] >= 2
+    assert any(f["value"] == "remote" for f in data["workArrangement"])
+
+
 def test_ingest_unsupported_source(client, auth_payload):
     jwt = _register(client, auth_payload, "disc-bad@example.com")
     res = client.post(
@@ -201,13 +330,13 @@ def test_ingest_unsupported_source(client, auth_payload):
     assert res.json()["error"]["code"] == "UNSUPPORTED_SOURCE"
 
 
-def test_ingest_fetch_failure_maps_to_error(client, auth_payload, monkeypatch):
+def test_ingest_fetch_failure_maps_to_error(client, auth_payload, fake_board):
     jwt = _register(client, auth_payload, "disc-fail@example.com")
 
     def _boom(url):
         raise connectors.ConnectorError("Unknown company board for this source")
 
-    monkeypatch.setattr(connectors, "_get_json", _boom)
+    fake_board(_boom)
     res = client.post(
         "/api/discovery/ingest",
         headers=_headers(jwt),
@@ -272,3 +401,453 @@ def test_discovery_requires_auth(client):
         ).status_code
         == 401
     )
+
+
+def test_ingest_upserts_in_bulk_batches_and_skips_unchanged(
+    client, auth_payload, fake_board, monkeypatch, db
+):
+    from app.config import settings
+
+    board = {
+        "jobs": [
+            {
+                "id": n,
+                "title": f"Engineer {n}",
+                "absolute_url": f"https://boards.greenhouse.io/bulkco/jobs/{n}",
+                "location": {"name": "Remote"},
+                "content": "Python",
+            }
+            for n in range(5)
+        ]
+    }
+    fake_board(board)
+    monkeypatch.setattr(settings, "discovery_ingest_batch_size", 2)
+    jwt = _register(client, auth_payload, "disc-bulk@example.com")
+    body = {"source": "greenhouse", "boardToken": "bulkco"}
+
+    first = client.post(
+        "/api/discovery/ingest", headers=_headers(jwt), json=body
+    ).json()["data"]
+    assert first["fetched"] == 5 and first["inserted"] == 5
+    assert [b["inserted"] for b in first["batches"]] == [2, 2, 1]
+    ingested_at = db.discovered_jobs.find_one({"boardToken": "bulkco"})["ingestedAt"]
+
+    board["jobs"][0]["title"] = "Staff Engineer 0"
+    second = client.post(
+        "/api/discovery/ingest", headers=_headers(jwt), json=body
+    ).json()["data"]
+    # Only the edited posting is rewritten; the rest match their stored hash.
+    assert second["inserted"] == 0 and second["updated"] == 1
+    assert second["skipped"] == 4
+    assert len(second["batches"]) == 1
+    assert db.discovered_jobs.count_documents({"boardToken": "bulkco"}) == 5
+    # ingestedAt is only set on first insert ($setOnInsert).
+    doc = db.discovered_jobs.find_one({"boardToken": "bulkco", "sourceId": "0"})
+    assert doc["title"] == "Staff Engineer 0"
+    assert doc["ingestedAt"] == ingested_at
+
+
+def test_reingest_skips_enrichment_for_unchanged_postings(
+    client, auth_payload, fake_greenhouse, monkeypatch
+):
+    from app.discovery import pipeline
+
+    jwt = _register(client, auth_payload, "disc-hash@example.com")
+    body = {"source": "greenhouse", "boardToken": "hashco"}
+    client.post("/api/discovery/ingest", headers=_headers(jwt), json=body)
+
+    calls = []
+    monkeypatch.setattr(pipeline, "enrich", lambda p: calls.append(p) or {})
+    again = client.post(
+        "/api/discovery/ingest", headers=_headers(jwt), json=body
+    ).json()["data"]
+    assert again["skipped"] == 2 and again["batches"] == []
+    assert calls == []
+
+
+def _board_transport(boards):
+    """Mock ATS transport: Greenhouse boards by token, 404 for anything else."""
+    import httpx
+
+    def handler(request):
+        token = request.url.path.split("/")[3]
+        if token not in boards:
+            return httpx.Response(404)
+        return httpx.Response(200, json=boards[token])
+
+    return httpx.MockTransport(handler)
+
+
+def test_batch_ingest_reports_per_board_results(client, auth_payload, monkeypatch):
+    import httpx
+
+    from app.discovery import service
+
+    transport = _board_transport({"batcha": GREENHOUSE_FIXTURE, "batchb": GREENHOUSE_FIXTURE})
+    monkeypatch.setattr(
+        service, "async_client", lambda n: httpx.AsyncClient(transport=transport)
+    )
+    jwt = _register(client, auth_payload, "disc-batch@example.com")
+    res = client.post(
+        "/api/discovery/ingest/batch",
+        headers=_headers(jwt),
+        json={
+            "boards": [
+                {"source": "greenhouse", "boardToken": "batcha", "companyName": "A"},
+                {"source": "greenhouse", "boardToken": "batchb"},
+                {"source": "greenhouse", "boardToken": "ghostboard"},
+                {"source": "workday", "boardToken": "batcha"},
+            ]
+        },
+    )
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert data["succeeded"] == 2 and data["failed"] == 2
+    assert data["inserted"] == 4
+    by_token = {(b["source"], b["boardToken"]): b for b in data["boards"]}
+    assert by_token[("greenhouse", "batcha")]["company"] == "A"
+    assert by_token[("greenhouse", "ghostboard")]["status"] == "failed"
+    assert "Unsupported" in by_token[("workday", "batcha")]["error"]
+
+    listed = client.get(
+        "/api/discovery/jobs?company=batchb", headers=_headers(jwt)
+    ).json()["data"]
+    assert listed["meta"]["totalItems"] == 2
+
+
+def test_batch_ingest_caps_concurrency_per_host(monkeypatch, db):
+    import asyncio
+
+    import httpx
+
+    from app.config import settings
+    from app.discovery import service
+
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return httpx.Response(200, json={"jobs": []})
+
+    monkeypatch.setattr(settings, "discovery_fetch_concurrency_per_host", 2)
+    boards = [service.BoardRef("greenhouse", f"capco{n}") for n in range(6)]
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            return await service.ingest_boards_async(db, boards, client=c)
+
+    result = asyncio.run(run())
+    assert result["succeeded"] == 6
+    assert in_flight["peak"] == 2
+
+
+def _etag_transport(board, seen):
+    """Mock ATS that sends an ETag and honours If-None-Match with a 304."""
+    import httpx
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=board, headers={"ETag": '"v1"'})
+
+    return httpx.MockTransport(handler)
+
+
+def test_ingest_revalidates_with_etag_and_reports_not_modified(
+    client, auth_payload, monkeypatch, db
+):
+    import httpx
+
+    seen = []
+    transport = _etag_transport(GREENHOUSE_FIXTURE, seen)
+    monkeypatch.setattr(connectors, "_client", lambda: httpx.Client(transport=transport))
+    jwt = _register(client, auth_payload, "disc-etag@example.com")
+    body = {"source": "greenhouse", "boardToken": "etagco", "companyName": "EtagCo"}
+
+    first = client.post("/api/discovery/ingest", headers=_headers(jwt), json=body)
+    assert first.json()["data"]["inserted"] == 2
+    assert first.json()["data"]["notModified"] is False
+    cached = db.board_http_cache.find_one({"url": {"$regex": "/etagco/"}})
+    assert cached["etag"] == '"v1"' and cached["size"] > len(cached["body"]) / 2
+
+    def _no_enrich(*a, **k):
+        raise AssertionError("a 304 must not reach enrichment")
+
+    from app.discovery import pipeline
+
+    with monkeypatch.context() as m:
+        m.setattr(pipeline, "enrich", _no_enrich)
+        second = client.post("/api/discovery/ingest", headers=_headers(jwt), json=body)
+    data = second.json()["data"]
+    assert data["notModified"] is True and data["fetched"] == 0
+    assert seen == [None, '"v1"']
+
+    # A forced ingest still revalidates, then parses the cached body.
+    forced = client.post(
+        "/api/discovery/ingest", headers=_headers(jwt), json={**body, "force": True}
+    ).json()["data"]
+    assert seen[-1] == '"v1"'
+    assert forced["notModified"] is False and forced["fetched"] == 2
+
+
+def test_failed_upsert_does_not_cache_the_board(monkeypatch, db):
+    import httpx
+    from pymongo.errors import PyMongoError
+
+    from app.discovery import service
+
+    seen = []
+    transport = _etag_transport(GREENHOUSE_FIXTURE, seen)
+    monkeypatch.setattr(connectors, "_client", lambda: httpx.Client(transport=transport))
+
+    def _down(*a, **k):
+        raise PyMongoError("primary stepped down")
+
+    with monkeypatch.context() as m:
+        m.setattr(service, "_flush_batch", _down)
+        with pytest.raises(PyMongoError):
+            service.ingest(db, "greenhouse", "etagfailco", "EtagFail")
+    assert db.board_http_cache.find_one({"url": {"$regex": "/etagfailco/"}}) is None
+
+    # The next fetch is a full download, not a 304 for postings never stored.
+    again = service.ingest(db, "greenhouse", "etagfailco", "EtagFail")
+    assert seen == [None, None]
+    assert again["inserted"] == 2
+
+
+def _truncated_then_etag_transport(board, seen):
+    """Mock ATS whose first answer is cut short mid-body (with an ETag)."""
+    import httpx
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        if len(seen) == 1:
+            return httpx.Response(200, content=b'{"jobs": [{"id": 1', headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=board, headers={"ETag": '"v1"'})
+
+    return httpx.MockTransport(handler)
+
+
+def test_malformed_first_fetch_is_refetched_in_full(monkeypatch, db):
+    import httpx
+    from fastapi import HTTPException
+
+    from app.discovery import service
+
+    seen = []
+    transport = _truncated_then_etag_transport(GREENHOUSE_FIXTURE, seen)
+    monkeypatch.setattr(connectors, "_client", lambda: httpx.Client(transport=transport))
+
+    with pytest.raises(HTTPException) as failed:
+        service.ingest(db, "greenhouse", "truncco", "Trunc")
+    assert failed.value.detail["error"]["code"] == "DISCOVERY_FETCH_FAILED"
+    again = service.ingest(db, "greenhouse", "truncco", "Trunc")
+    assert seen == [None, None] and again["inserted"] == 2
+
+
+def test_batch_malformed_first_fetch_is_refetched_in_full(db):
+    import asyncio
+
+    import httpx
+
+    from app.discovery import service
+
+    seen = []
+    transport = _truncated_then_etag_transport(GREENHOUSE_FIXTURE, seen)
+    boards = [service.BoardRef("greenhouse", "trunccobatch")]
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as c:
+            return await service.ingest_boards_async(db, boards, client=c)
+
+    assert asyncio.run(run())["failed"] == 1
+    again = asyncio.run(run())
+    assert seen == [None, None]
+    assert again["succeeded"] == 1 and again["inserted"] == 2
+    assert asyncio.run(run())["notModified"] == 1  # cached once stored
+
+
+def test_batch_ingest_reports_not_modified_boards(monkeypatch, db):
+    import asyncio
+
+    import httpx
+
+    from app.discovery import service
+
+    seen = []
+    transport = _etag_transport({"jobs": []}, seen)
+    boards = [service.BoardRef("greenhouse", "etagbatch")]
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as c:
+            return await service.ingest_boards_async(db, boards, client=c)
+
+    assert asyncio.run(run())["succeeded"] == 1
+    again = asyncio.run(run())
+    assert again["succeeded"] == 0 and again["notModified"] == 1
+    assert again["failed"] == 0
+    assert again["boards"][0]["status"] == "not_modified"
+
+
+def test_ingest_through_enrich_pool_matches_serial(
+    client, auth_payload, fake_greenhouse, monkeypatch, db
+):
+    from app.config import settings
+    from app.discovery import pipeline
+
+    jwt = _register(client, auth_payload, "disc-pool@example.com")
+
+    def ingest(token):
+        body = {"source": "greenhouse", "boardToken": token, "companyName": "Acme"}
+        res = client.post("/api/discovery/ingest", headers=_headers(jwt), json=body)
+        return res.json()["data"]
+
+    volatile = ("_id", "boardToken", "ingestedAt", "updatedAt")
+
+    def stored(token):
+        docs = db.discovered_jobs.find({"boardToken": token}).sort("sourceId", 1)
+        return [{k: v for k, v in d.items() if k not in volatile} for d in docs]
+
+    ingest("serialco")
+    monkeypatch.setattr(settings, "discovery_enrich_workers", 1)
+    try:
+        first = ingest("poolco")
+        again = ingest("poolco")
+    finally:
+        pipeline.shutdown_executor()
+    assert first["inserted"] == 2
+    assert again["skipped"] == 2 and again["batches"] == []
+    assert stored("poolco") == stored("serialco")
+
+
+def test_feed_totals_are_cached_until_ingest_writes(
+    client, auth_payload, fake_greenhouse, db
+):
+    jwt = _register(client, auth_payload, "disc-count-cache@example.com")
+    headers = _headers(jwt)
+
+    def ingest(token):
+        client.post(
+            "/api/discovery/ingest",
+            headers=headers,
+            json={"source": "greenhouse", "boardToken": token, "companyName": "CountCo"},
+        )
+
+    def totals():
+        return [
+            client.get(
+                f"/api/discovery/jobs?company=CountCo&collapse={collapse}",
+                headers=headers,
+            ).json()["data"]["meta"]["totalItems"]
+            for collapse in ("true", "false")
+        ]
+
+    ingest("countco-a")
+    assert totals() == [2, 2]
+
+    # A row written behind ingest's back isn't seen until the cache is cleared…
+    stray = db.discovered_jobs.insert_one(
+        {"source": "greenhouse", "boardToken": "stray", "sourceId": "1", "company": "CountCo"}
+    )
+    try:
+        assert totals() == [2, 2]
+        # …which any ingest write does.
+        ingest("countco-b")
+        assert totals() == [3, 5]
+    finally:
+        db.discovered_jobs.delete_one({"_id": stray.inserted_id})
+
+
+def test_text_search_matches_words_across_fields_and_ranks(
+    client, auth_payload, fake_board
+):
+    fake_board(
+        {
+            "jobs": [
+                {
+                    "id": 1,
+                    "title": "Data Analyst",
+                    "absolute_url": "https://boards.greenhouse.io/searchco/jobs/1",
+                    "updated_at": "2026-06-02T12:00:00Z",
+                    "location": {"name": "Zanzibar City"},
+                    "content": "Dashboards with Quokkaflow, SQL and Tableau.",
+                },
+                {
+                    "id": 2,
+                    "title": "Quokkaflow Platform Engineer",
+                    "absolute_url": "https://boards.greenhouse.io/searchco/jobs/2",
+                    "updated_at": "2026-06-01T12:00:00Z",
+                    "location": {"name": "Remote"},
+                    "content": "Operate Quokkaflow clusters on AWS.",
+                },
+            ]
+        }
+    )
+    jwt = _register(client, auth_payload, "disc-text-search@example.com")
+    headers = _headers(jwt)
+    client.post(
+        "/api/discovery/ingest",
+        headers=headers,
+        json={"source": "greenhouse", "boardToken": "searchco"},
+    )
+
+    def titles(params):
+        res = client.get(f"/api/discovery/jobs?qMode=text&{params}", headers=headers)
+        assert res.status_code == 200
+        return [j["title"] for j in res.json()["data"]["items"]]
+
+    # Type-ahead: the last word is a prefix; words match any field.
+    assert titles("q=quokkaf") == ["Data Analyst", "Quokkaflow Platform Engineer"]
+    assert titles("q=zanzibar%20ci") == ["Data Analyst"]
+    assert titles("q=quokkaflow%20aws") == ["Quokkaflow Platform Engineer"]
+    # Nothing searchable is an empty page, not a title-substring fallback.
+    assert titles("q=a%20") == []
+    assert titles("q=%2B%2B%2B") == []
+    # Relevance ranks the title hit first (collapsed and raw).
+    for collapse in ("true", "false"):
+        ranked = client.get(
+            "/api/discovery/jobs?qMode=text&q=quokkaflow&sortBy=relevance"
+            f"&collapse={collapse}",
+            headers=headers,
+        ).json()["data"]
+        assert [j["title"] for j in ranked["items"]] == [
+            "Quokkaflow Platform Engineer",
+            "Data Analyst",
+        ]
+        assert ranked["items"][0]["relevance"] > ranked["items"][1]["relevance"]
+        assert ranked["meta"]["totalItems"] == 2
+
+    # The substring mode (default) still matches inside the title only.
+    substring = client.get(
+        "/api/discovery/jobs?q=kkaflow%20plat", headers=headers
+    ).json()["data"]["items"]
+    assert [j["title"] for j in substring] == ["Quokkaflow Platform Engineer"]
+
+
+def test_async_feed_matches_the_sync_service(client, auth_payload, fake_greenhouse, db):
+    import asyncio
+
+    from app.database import get_async_db
+    from app.discovery import service
+
+    jwt = _register(client, auth_payload, "disc-async-feed@example.com")
+    client.post(
+        "/api/discovery/ingest",
+        headers=_headers(jwt),
+        json={"source": "greenhouse", "boardToken": "asyncco", "companyName": "AsyncCo"},
+    )
+    filters = service.DiscoveryFilters(company="AsyncCo")
+    for collapse in (True, False):
+        options = dict(
+            page=1, page_size=1, sort_by="postedAt", sort_order="desc", collapse=collapse
+        )
+        expected = service.list_jobs(db, filters, **options)
+        got = asyncio.run(service.list_jobs_async(get_async_db(), filters, **options))
+        assert got == expected
+        assert got["meta"]["nextCursor"] and got["meta"]["totalItems"] == 2
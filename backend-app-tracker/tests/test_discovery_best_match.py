@@ -0,0 +1,313 @@
+"""Best-match ranking of the Discover feed (``sortBy=matchScore``): prefilter,
+stored scores per (user, résumé, posting) and incremental refresh."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.discovery import enrich
+from app.matching import rankings
+
+
+def _posting(i, title, content):
+    return {
+        "id": i,
+        "title": title,
+        "absolute_url": f"https://boards.greenhouse.io/matchco/jobs/{i}",
+        "updated_at": "2026-06-01T12:00:00Z",
+        "location": {"name": "Remote"},
+        "content": content,
+    }
+
+
+BOARD = {
+    "jobs": [
+        _posting(1, "Registered Nurse", "Required: patient care, BLS certification."),
+        _posting(2, "Django Developer", "Required: Python, Django and PostgreSQL."),
+        _posting(3, "Platform Engineer", "Required: Kubernetes, Terraform and Python."),
+    ]
+}
+RESUME = b"Python developer. Built Django apps on PostgreSQL."
+
+
+def _headers(jwt):
+    return {"Authorization": f"Bearer {jwt}"}
+
+
+def _register(client, auth_payload, email):
+    res = client.post("/api/auth/register", json={**auth_payload, "email": email})
+    assert res.status_code == 200
+    data = res.json()["data"]
+    return _headers(data["jwt"]), data["user"]["id"]
+
+
+def _upload_resume(client, headers, body=RESUME):
+    job = client.post(
+        "/api/jobs/",
+        headers=headers,
+        json={
+            "url": "https://example.com/job",
+            "jobTitle": "Engineer",
+            "company": "Acme",
+            "salaryTarget": 100000,
+            "status": "applied",
+            "location": "Remote",
+            "employmentType": "full-time",
+        },
+    ).json()["data"]["id"]
+    res = client.post(
+        f"/api/jobs/{job}/resumes",
+        headers=headers,
+        files={"resume": ("cv.txt", body, "text/plain")},
+    )
+    assert res.status_code == 200
+    return res.json()["data"]["id"]
+
+
+def _ingest(client, headers, token):
+    res = client.post(
+        "/api/discovery/ingest",
+        headers=headers,
+        json={"source": "greenhouse", "boardToken": token, "companyName": "MatchCo"},
+    )
+    assert res.status_code == 200
+
+
+def _ranked(client, headers):
+    res = client.get(
+        "/api/discovery/jobs",
+        headers=headers,
+        params={"sortBy": "matchScore", "company": "MatchCo", "collapse": "false"},
+    )
+    assert res.status_code == 200
+    return [(j["title"], j["matchScore"]) for j in res.json()["data"]["items"]]
+
+
+@pytest.fixture
+def matchco(client, auth_payload, fake_board, request):
+    fake_board(BOARD)
+    headers, _ = _register(client, auth_payload, f"{request.node.name}@example.com")
+    _ingest(client, headers, "matchco")
+
+
+def test_ingest_stores_the_match_prefilter_signals(db, matchco):
+    nurse = db.discovered_jobs.find_one({"boardToken": "matchco", "sourceId": "1"})
+    django = db.discovered_jobs.find_one({"boardToken": "matchco", "sourceId": "2"})
+    assert "django" in django["conceptIds"] and "python" in django["conceptIds"]
+    assert "django" not in nurse["conceptIds"]
+    assert django["roleFamilies"] and nurse["roleFamilies"] != django["roleFamilies"]
+    signals = enrich.match_signals(django)
+    assert {field: django[field] for field in signals} == signals
+
+
+def test_best_match_ranks_by_fit_and_skips_prefiltered_postings(
+    client, auth_payload, db, matchco
+):
+    headers, user_id = _register(client, auth_payload, "best-match@example.com")
+    resume_id = _upload_resume(client, headers)
+
+    # Nothing is scored inside the request; without the board refresh loop
+    # the ranking is built right after the response.
+    assert {score for _, score in _ranked(client, headers)} == {None}
+    ranked = _ranked(client, headers)
+    assert ranked[0][0] == "Django Developer"
+    assert ranked[-1] == ("Registered Nurse", None)  # prefiltered: never scored
+    scores = [score for _, score in ranked if score is not None]
+    assert scores == sorted(scores, reverse=True) and len(scores) == 2
+
+    stored = db.match_scores.find({"userId": user_id, "resumeId": resume_id})
+    assert {doc["_id"].rsplit(":", 1)[0] for doc in stored} == {f"{user_id}:{resume_id}"}
+
+
+def test_new_postings_are_scored_incrementally(client, auth_payload, db, matchco, fake_board):
+    headers, user_id = _register(client, auth_payload, "best-match-incr@example.com")
+    resume_id = _upload_resume(client, headers)
+    _ranked(client, headers)
+    assert rankings.refresh(db, user_id, resume_id) == {"scored": 0, "dropped": 0}
+
+    fake_board({"jobs": [_posting(9, "Python Engineer", "Required: Python and Django.")]})
+    _ingest(client, headers, "matchco-new")
+    assert rankings.refresh(db, user_id, resume_id) == {"scored": 1, "dropped": 0}
+    assert ("Python Engineer", None) not in _ranked(client, headers)
+
+
+def test_default_resume_preference_picks_the_ranked_resume(
+    client, auth_payload, db, matchco
+):
+    headers, user_id = _register(client, auth_payload, "best-match-default@example.com")
+    chosen = _upload_resume(client, headers)
+    _upload_resume(client, headers, b"Registered nurse. Patient care, BLS certified.")
+
+    assert rankings.default_resume_id(db, user_id) != chosen  # latest upload
+    res = client.put("/api/preferences/", headers=headers, json={"defaultResumeId": chosen})
+    assert res.status_code == 200 and res.json()["data"]["defaultResumeId"] == chosen
+    _ranked(client, headers)
+    assert _ranked(client, headers)[0][0] == "Django Developer"
+    assert db.match_rankings.find_one({"userId": user_id})["resumeId"] == chosen
+
+
+def test_default_resume_must_be_the_callers(client, auth_payload):
+    owner, _ = _register(client, auth_payload, "best-match-owner@example.com")
+    other, _ = _register(client, auth_payload, "best-match-other@example.com")
+    resume_id = _upload_resume(client, owner)
+    res = client.put("/api/preferences/", headers=other, json={"defaultResumeId": resume_id})
+    assert res.status_code == 403
+
+
+def test_best_match_without_a_resume_is_rejected(client, auth_payload):
+    headers, _ = _register(client, auth_payload, "best-match-none@example.com")
+    res = client.get("/api/discovery/jobs", headers=headers, params={"sortBy": "matchScore"})
+    assert res.status_code == 409
+    assert res.json()["error"]["code"] == "RESUME_REQUIRED"
+
+
+def test_unused_rankings_are_dropped_after_ingest(client, auth_payload, db, matchco):
+    headers, user_id = _register(client, auth_payload, "best-match-stale@example.com")
+    _upload_resume(client, headers)
+    _ranked(client, headers)
+    assert db.match_scores.count_documents({"userId": user_id})
+
+    now = datetime.now(tz=timezone.utc)
+    db.match_rankings.update_one(
+        {"userId": user_id}, {"$set": {"lastUsedAt": now - timedelta(days=365)}}
+    )
+    rankings.refresh_active(db, now)
+    assert db.match_rankings.find_one({"userId": user_id}) is None
+    assert db.match_scores.count_documents({"userId": user_id}) == 0
+
+
+def test_a_leased_ranking_is_left_to_its_worker(client, auth_payload, db, matchco):
+    headers, user_id = _register(client, auth_payload, "best-match-leased@example.com")
+    _upload_resume(client, headers)
+    _ranked(client, headers)
+    scored = db.match_scores.count_documents({"userId": user_id})
+
+    now = datetime.now(tz=timezone.utc)
+    db.match_scores.delete_many({"userId": user_id})
+    db.match_rankings.update_one(
+        {"userId": user_id}, {"$set": {"claimedUntil": now + timedelta(minutes=5)}}
+    )
+    rankings.refresh_active(db, now)
+    assert db.match_scores.count_documents({"userId": user_id}) == 0
+
+    # An expired lease (a worker that died mid-refresh) is taken over, and
+    # released once the ranking is refreshed.
+    later = now + timedelta(minutes=10)
+    db.match_rankings.update_one({"userId": user_id}, {"$set": {"version": None}})
+    rankings.refresh_active(db, later)
+    assert db.match_scores.count_documents({"userId": user_id}) == scored
+    assert db.match_rankings.find_one({"userId": user_id})["claimedUntil"] is None
+
+
+def test_a_failing_ranking_does_not_stop_the_pass(
+    client, auth_payload, db, matchco, monkeypatch
+):
+    first, first_id = _register(client, auth_payload, "best-match-fails@example.com")
+    second, second_id = _register(client, auth_payload, "best-match-after@example.com")
+    _upload_resume(client, first)
+    _upload_resume(client, second)
+    _ranked(client, first)
+    _ranked(client, second)
+
+    refresh = rankings.refresh
+
+    def flaky(db, user_id, resume_id):
+        if user_id == first_id:
+            raise RuntimeError("scorer crashed")
+        return refresh(db, user_id, resume_id)
+
+    monkeypatch.setattr(rankings, "refresh", flaky)
+    db.match_scores.delete_many({"userId": second_id})
+    assert rankings.refresh_active(db, datetime.now(tz=timezone.utc))["failed"] == 1
+    assert db.match_scores.count_documents({"userId": second_id})
+    # The failed ranking is kept (and unleased) for the next pass.
+    failed = db.match_rankings.find_one({"userId": first_id})
+    assert failed is not None and failed["claimedUntil"] is None
+    assert db.match_rankings.find_one({"userId": second_id})["claimedUntil"] is None
+
+
+@pytest.fixture
+def background_ranking(monkeypatch):
+    # As deployed: the board refresh loop builds and refreshes the rankings.
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "discovery_refresh_enabled", True)
+
+
+def _feed(client, headers, **params):
+    res = client.get(
+        "/api/discovery/jobs", headers=headers, params={"sortBy": "matchScore", **params}
+    )
+    assert res.status_code == 200
+    return res.json()["data"]
+
+
+def test_rankings_are_scored_in_the_background(
+    client, auth_payload, db, matchco, background_ranking
+):
+    headers, user_id = _register(client, auth_payload, "best-match-bg@example.com")
+    _upload_resume(client, headers)
+
+    # The request only registers the ranking; nothing is scored inline.
+    assert {score for _, score in _ranked(client, headers)} == {None}
+    assert db.match_scores.count_documents({"userId": user_id}) == 0
+    rankings.refresh_active(db, datetime.now(tz=timezone.utc))
+    assert _ranked(client, headers)[0][0] == "Django Developer"
+
+    # Following a cursor doesn't touch the ranking at all.
+    first = _feed(client, headers, company="MatchCo", pageSize=1)
+    used = db.match_rankings.find_one({"userId": user_id})["lastUsedAt"]
+    _feed(client, headers, company="MatchCo", pageSize=1, cursor=first["meta"]["nextCursor"])
+    assert db.match_rankings.find_one({"userId": user_id})["lastUsedAt"] == used
+
+
+def test_best_match_pages_walk_one_order(client, auth_payload, fake_board, matchco):
+    headers, _ = _register(client, auth_payload, "best-match-pages@example.com")
+    fake_board(BOARD)
+    _ingest(client, headers, "matchco-dup")  # the same postings on a second board
+    _upload_resume(client, headers)
+    _ranked(client, headers)  # builds the ranking after the response
+
+    for collapse in ("true", "false"):
+        params = {"company": "MatchCo", "collapse": collapse}
+        whole = _feed(client, headers, pageSize=100, **params)
+        expected = [(j["id"], j["matchScore"]) for j in whole["items"]]
+        assert whole["meta"]["totalItems"] == len(expected)
+        scores = [score for _, score in expected]
+        assert None in scores and scores.index(None) == sum(s is not None for s in scores)
+
+        by_page = [
+            (j["id"], j["matchScore"])
+            for n in range(1, len(expected) + 1)
+            for j in _feed(client, headers, pageSize=1, page=n, **params)["items"]
+        ]
+        by_cursor, cursor = [], None
+        while True:
+            more = {"cursor": cursor} if cursor else {}
+            page = _feed(client, headers, pageSize=2, **params, **more)
+            by_cursor += [(j["id"], j["matchScore"]) for j in page["items"]]
+            cursor = page["meta"]["nextCursor"]
+            if not cursor:
+                break
+        assert by_page == expected and by_cursor == expected
+
+    collapsed = _feed(client, headers, pageSize=100, company="MatchCo")["items"]
+    django = next(j for j in collapsed if j["title"] == "Django Developer")
+    assert django["duplicateCount"] == 2
+    assert {s["boardToken"] for s in django["sources"]} == {"matchco", "matchco-dup"}
+    assert django["sources"][0]["boardToken"] == django["boardToken"]
+
+
+def test_scored_pages_never_look_scores_up_per_posting(
+    client, auth_payload, matchco, monkeypatch
+):
+    headers, _ = _register(client, auth_payload, "best-match-page-only@example.com")
+    _upload_resume(client, headers)
+    _ranked(client, headers)
+
+    def per_row_lookup(prefix):
+        raise AssertionError("the page is within the scored postings")
+
+    monkeypatch.setattr(rankings, "feed_stages", per_row_lookup)
+    items = _feed(client, headers, pageSize=1)["items"]
+    assert items[0]["matchScore"] is not None
@@ -3,7 +3,6 @@
 
 import pytest
 
-from app.discovery import connectors
 
 # Same role ("Backend Engineer" @ "DupCo" / "Remote") posted on both Greenhouse
 # and Lever — these should collapse into one listing.
@@ -44,13 +43,13 @@ def _register(client, auth_payload, email):
 
 
 @pytest.fixture
-def fake_both_sources(monkeypatch):
+def fake_both_sources(fake_board):
     def _dispatch(url: str):
         if "greenhouse" in url:
             return GREENHOUSE
         return LEVER
 
-    monkeypatch.setattr(connectors, "_get_json", _dispatch)
+    fake_board(_dispatch)
 
 
 def _ingest_both(client, headers):
@@ -92,6 +91,81 @@ def test_collapse_false_returns_raw_rows(client, auth_payload, fake_both_sources
     assert raw["meta"]["totalItems"] == 2
 
 
+def test_collapsed_feed_pages_through_every_group(client, auth_payload, fake_board):
+    """Collapsing happens before pagination: pages are disjoint, cover every
+    listing once, and totals count listings rather than rows."""
+    titles = [f"Role {n}" for n in range(5)]
+    greenhouse = {
+        "jobs": [
+            {
+                "id": n,
+                "title": title,
+                "absolute_url": f"https://boards.greenhouse.io/pageco/jobs/{n}",
+                "updated_at": f"2026-06-{10 + n}T12:00:00Z",
+                "location": {"name": "Remote"},
+                "content": f"{title} working on Python services. " * 5,
+            }
+            for n, title in enumerate(titles)
+        ]
+    }
+    lever = [
+        {
+            "id": f"x{n}",
+            "text": titles[n],
+            "hostedUrl": f"https://jobs.lever.co/pageco/x{n}",
+            "categories": {"location": "Remote"},
+            "descriptionPlain": f"{titles[n]} working on Python services. " * 5,
+            "createdAt": 1717900000000,
+        }
+        for n in (1, 3)
+    ]
+    fake_board(lambda url: greenhouse if "greenhouse" in url else lever)
+
+    jwt = _register(client, auth_payload, "disc-collapse-pages@example.com")
+    headers = _headers(jwt)
+    for source in ("greenhouse", "lever"):
+        client.post(
+            "/api/discovery/ingest",
+            headers=headers,
+            json={"source": source, "boardToken": "pageco", "companyName": "PageCo"},
+        )
+
+    seen = []
+    for page in (1, 2, 3):
+        data = client.get(
+            f"/api/discovery/jobs?company=PageCo&pageSize=2&page={page}",
+            headers=headers,
+        ).json()["data"]
+        assert data["meta"]["totalItems"] == 5
+        assert data["meta"]["totalPages"] == 3
+        seen.extend(data["items"])
+
+    assert sorted(item["title"] for item in seen) == titles
+    by_title = {item["title"]: item for item in seen}
+    assert by_title["Role 1"]["duplicateCount"] == 2
+    assert by_title["Role 0"]["duplicateCount"] == 1
+    assert "Python services" in by_title["Role 1"]["description"]
+
+    # Following cursors yields the same listings, in the same order.
+    for params in ("", "&collapse=false", "&sortBy=salaryMax&collapse=false"):
+        url = f"/api/discovery/jobs?company=PageCo&pageSize=2&includeTotal=false{params}"
+        by_number, walked, cursor = [], [], None
+        for page in (1, 2, 3, 4):
+            by_number += client.get(f"{url}&page={page}", headers=headers).json()[
+                "data"
+            ]["items"]
+        while True:
+            data = client.get(
+                url + (f"&cursor={cursor}" if cursor else ""), headers=headers
+            ).json()["data"]
+            walked += data["items"]
+            cursor = data["meta"]["nextCursor"]
+            if cursor is None:
+                break
+        assert [i["id"] for i in walked] == [i["id"] for i in by_number]
+        assert len(walked) == (5 if not params else 7)
+
+
 def test_enrichment_fields_present_and_filterable(
     client, auth_payload, fake_both_sources
 ):
@@ -130,7 +204,7 @@ def test_enrichment_fields_present_and_filterable(
     )
 
 
-def test_min_quality_filter(client, auth_payload, monkeypatch):
+def test_min_quality_filter(client, auth_payload, fake_board):
     # A deliberately low-quality posting (no salary, thin desc, no location).
     low = {
         "jobs": [
@@ -144,7 +218,7 @@ def test_min_quality_filter(client, auth_payload, monkeypatch):
             }
         ]
     }
-    monkeypatch.setattr(connectors, "_get_json", lambda url: low)
+    fake_board(low)
     jwt = _register(client, auth_payload, "disc-quality@example.com")
     headers = _headers(jwt)
     client.post(
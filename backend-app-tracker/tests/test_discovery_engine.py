@@ -1,10 +1,15 @@
 """Unit tests for the discovery engine (FEAT-22): normalization + connectors.
 Connectors are exercised end-to-end with a fake JSON fetcher (no network)."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
 
 from app.discovery import connectors
 from app.discovery.connectors import ConnectorError, fetch_source, valid_token
+from app.discovery.jsonstream import iter_items
 from app.discovery.normalize import (
     normalize_employment_type,
     normalize_location,
@@ -115,8 +120,8 @@ def test_valid_token():
     assert not valid_token("")
 
 
-def test_greenhouse_connector_normalizes(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: GREENHOUSE_FIXTURE)
+def test_greenhouse_connector_normalizes(fake_board):
+    fake_board(GREENHOUSE_FIXTURE)
     jobs = fetch_source("greenhouse", "acme", "Acme Inc")
     assert len(jobs) == 1
     job = jobs[0]
@@ -131,8 +136,8 @@ def test_greenhouse_connector_normalizes(monkeypatch):
     assert job["postedAt"] is not None
 
 
-def test_lever_connector_normalizes(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: LEVER_FIXTURE)
+def test_lever_connector_normalizes(fake_board):
+    fake_board(LEVER_FIXTURE)
     jobs = fetch_source("lever", "acme")
     assert len(jobs) == 1
     job = jobs[0]
@@ -145,8 +150,8 @@ def test_lever_connector_normalizes(monkeypatch):
     assert job["postedAt"] is not None
 
 
-def test_ashby_connector_normalizes(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: ASHBY_FIXTURE)
+def test_ashby_connector_normalizes(fake_board):
+    fake_board(ASHBY_FIXTURE)
     jobs = fetch_source("ashby", "acme")
     assert len(jobs) == 1
     job = jobs[0]
@@ -161,8 +166,18 @@ def test_ashby_connector_normalizes(monkeypatch):
     assert job["postedAt"] is not None
 
 
-def test_recruitee_connector_normalizes(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: RECRUITEE_FIXTURE)
+def test_ashby_board_name_after_the_jobs_array(fake_board):
+    fake_board({"jobs": ASHBY_FIXTURE["jobs"] * 3, "name": "Acme", "apiVersion": "1"})
+    jobs = fetch_source("ashby", "acme")
+    assert [job["company"] for job in jobs] == ["Acme"] * 3
+    # A display name still wins, and without any name the token is used.
+    assert fetch_source("ashby", "acme", "Acme Inc")[0]["company"] == "Acme Inc"
+    fake_board({"jobs": ASHBY_FIXTURE["jobs"]})
+    assert fetch_source("ashby", "acme")[0]["company"] == "acme"
+
+
+def test_recruitee_connector_normalizes(fake_board):
+    fake_board(RECRUITEE_FIXTURE)
     jobs = fetch_source("recruitee", "acme", "Acme Inc")
     assert len(jobs) == 1
     job = jobs[0]
@@ -191,3 +206,174 @@ def test_fetch_source_rejects_unknown_source():
 def test_fetch_source_rejects_bad_token():
     with pytest.raises(ConnectorError):
         fetch_source("greenhouse", "../secrets")
+
+
+# --------------------------- streaming -------------------------------------
+
+def _chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_iter_items_matches_json_loads_at_any_chunk_boundary(size):
+    doc = {
+        "name": "Acmé",
+        "count": 12345,
+        "total": 1.5,
+        "scale": 2e10,
+        "offset": -3.25e-4,
+        "jobs": [
+            {"id": 1, "title": "Ingénieur – données", "pay": 150000.5, "tags": ["a", "b"]},
+            98765,
+            "caf\u00e9",
+            None,
+            [True, False, {"nested": {"x": -1e3}}],
+        ],
+        "meta": {"total": 5},
+    }
+    body = json.dumps(doc, ensure_ascii=False).encode()
+    meta = {}
+    assert list(iter_items(_chunked(body, size), "jobs", meta)) == doc["jobs"]
+    assert meta == {
+        "name": "Acmé",
+        "count": 12345,
+        "total": 1.5,
+        "scale": 2e10,
+        "offset": -3.25e-4,
+    }
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 6, 12, 64])
+def test_iter_items_top_level_numbers_at_any_chunk_boundary(size):
+    body = b"[1.5, 2e10, -3, 0.25E+3, 7]"
+    assert list(iter_items(_chunked(body, size))) == [1.5, 2e10, -3, 0.25e3, 7]
+
+
+def test_iter_items_records_scalar_members_after_the_array():
+    body = b'{"jobs": [{"id": 1}], "meta": {"total": 1}, "name": "Acme"}'
+    meta = {}
+    items = iter_items(_chunked(body, 5), "jobs", meta)
+    assert next(items) == {"id": 1} and meta == {}
+    assert list(items) == [] and meta == {"name": "Acme"}
+
+
+def test_iter_items_top_level_array_and_wrong_shapes():
+    assert list(iter_items([b'[{"id": 1}, {"id"', b": 2}]"])) == [{"id": 1}, {"id": 2}]
+    assert list(iter_items([b"[]"])) == []
+    # A body of the wrong shape yields nothing, as data.get(key, []) did.
+    assert list(iter_items([b'{"jobs": []}'])) == []
+    assert list(iter_items([b'[{"id": 1}]'], "jobs")) == []
+    assert list(iter_items([b'{"other": [1, 2]}'], "jobs")) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"", b"not json", b'{"jobs": [{"id": 1},', b'{"jobs" [1]}', b'{"jobs": [], "name": "Ac'],
+)
+def test_iter_items_rejects_malformed_bodies(body):
+    with pytest.raises(ValueError):
+        list(iter_items([body], "jobs"))
+
+
+def test_malformed_board_maps_to_connector_error(monkeypatch):
+    monkeypatch.setattr(
+        connectors,
+        "_open_board",
+        lambda url, cache=None: (iter([b'{"jobs": [{"id": 1']), None),
+    )
+    with pytest.raises(ConnectorError, match="invalid JSON"):
+        fetch_source("greenhouse", "acme")
+
+
+def _streaming_transport(pulled, chunks):
+    """Mock ATS whose body is a lazy generator; ``pulled`` counts chunks read."""
+
+    def body():
+        for chunk in chunks:
+            pulled.append(len(chunk))
+            yield chunk
+
+    return httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+
+def test_byte_cap_is_enforced_while_streaming(monkeypatch):
+    pulled = []
+    posting = json.dumps({"id": 1, "title": "x" * 60_000}).encode()
+    endless = (b'{"jobs": [' if n == 0 else b"," + posting for n in range(10_000))
+    transport = _streaming_transport(pulled, endless)
+    monkeypatch.setattr(connectors, "_client", lambda: httpx.Client(transport=transport))
+
+    with pytest.raises(ConnectorError, match="too large"):
+        fetch_source("greenhouse", "acme")
+    # Reading stopped at the cap instead of downloading the whole ~600 MB body.
+    assert sum(pulled) < 2 * connectors._MAX_BYTES
+
+
+def test_postings_are_parsed_as_the_body_streams(monkeypatch):
+    pulled = []
+    jobs = [{"id": n, "title": f"Role {n}"} for n in range(5000)]
+    chunks = _chunked(json.dumps({"jobs": jobs}).encode(), 8192)
+    transport = _streaming_transport(pulled, chunks)
+    monkeypatch.setattr(connectors, "_client", lambda: httpx.Client(transport=transport))
+
+    postings = connectors.iter_source("greenhouse", "acme")
+    assert pulled == []  # nothing read until the postings are consumed
+    assert next(postings)["sourceId"] == "0"
+    # The first posting arrives after the first read, not the whole body.
+    assert len(pulled) < len(chunks) // 2
+    assert [p["sourceId"] for p in postings] == [str(n) for n in range(1, 5000)]
+    assert len(pulled) == len(chunks)
+
+
+def test_async_postings_are_parsed_as_the_body_downloads():
+    pulled = []
+    jobs = [{"id": n, "title": f"Role {n}"} for n in range(40_000)]
+    chunks = _chunked(json.dumps({"jobs": jobs}).encode(), 8192)
+
+    async def body():
+        for chunk in chunks:
+            pulled.append(len(chunk))
+            yield chunk
+
+    def consume(board):
+        pairs = iter(board)
+        first, _ = next(pairs)
+        at_first = len(pulled)
+        return first, at_first, [raw["id"] for raw, _ in pairs]
+
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            board = await connectors.open_source_async(client, "greenhouse", "acme")
+            try:
+                return await asyncio.to_thread(consume, board)
+            finally:
+                await board.aclose()
+
+    first, at_first, rest = asyncio.run(run())
+    assert first["id"] == 0
+    # Only a few chunks run ahead of the parser, not the whole body.
+    assert at_first < len(chunks) // 2
+    assert rest == list(range(1, 40_000))
+    assert len(pulled) == len(chunks)
+
+
+def test_async_download_stops_when_the_consumer_gives_up():
+    pulled = []
+    jobs = [{"id": n, "title": f"Role {n}"} for n in range(40_000)]
+    chunks = _chunked(json.dumps({"jobs": jobs}).encode(), 8192)
+
+    async def body():
+        for chunk in chunks:
+            pulled.append(len(chunk))
+            yield chunk
+
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            board = await connectors.open_source_async(client, "greenhouse", "acme")
+            await asyncio.to_thread(next, iter(board))
+            await board.aclose()
+
+    asyncio.run(run())
+    assert len(pulled) < len(chunks) // 2
@@ -206,3 +206,172 @@ def test_enrich_bundles_all_fields():
     assert out["qualityFlags"] == []
     assert out["qualityScore"] == 100
     assert out["dedupeKey"]
+
+
+def test_match_signals_bucket_terms_by_section():
+    out = enrich.enrich(
+        {
+            "title": "Django Developer",
+            "description": "Requirements:\n- Python and Django\n- PostgreSQL\n\n"
+            "Nice to have:\n- Kubernetes\n",
+        }
+    )
+    assert out["skills"] == ["python", "django", "postgresql", "kubernetes"]
+    assert set(out["sectionTerms"]["required"]) == {"python", "django", "postgresql"}
+    assert out["sectionTerms"]["preferred"] == ["kubernetes"]
+    assert set(out["conceptIds"]) == {"python", "django", "postgresql", "kubernetes"}
+    assert out["roleFamilies"] and out["analyzerVersion"] == enrich.ANALYZER_VERSION
+
+
+def test_posting_skills_reextracts_when_stored_ones_are_stale():
+    posting = {"description": "Python and Docker.", "skills": ["cobol"]}
+    assert enrich.posting_skills({**posting, "analyzerVersion": enrich.ANALYZER_VERSION}) == [
+        "cobol"
+    ]
+    assert enrich.posting_skills({**posting, "analyzerVersion": "0.old"}) == [
+        "python",
+        "docker",
+    ]
+
+
+def test_reanalyze_backfills_only_stale_postings(db):
+    from app.discovery import reanalyze
+
+    current = enrich.match_signals({"title": "Go Developer", "description": "Go."})
+    db.discovered_jobs.insert_many(
+        [
+            {"boardToken": "reanalyze", "title": "Go Developer", "description": "Go.", **current},
+            {"boardToken": "reanalyze", "title": "Data Engineer", "description": "SQL, Spark."},
+            {
+                "boardToken": "reanalyze",
+                "title": "Web Developer",
+                "description": "React.",
+                "skills": ["cobol"],
+                "analyzerVersion": "0.old",
+            },
+        ]
+    )
+
+    assert reanalyze.backfill(db, batch_size=1) == {"scanned": 2, "updated": 2}
+    docs = {d["title"]: d for d in db.discovered_jobs.find({"boardToken": "reanalyze"})}
+    assert docs["Web Developer"]["skills"] == ["react"]
+    assert "spark" in docs["Data Engineer"]["skills"]
+    assert {d["analyzerVersion"] for d in docs.values()} == {enrich.ANALYZER_VERSION}
+    assert reanalyze.backfill(db) == {"scanned": 0, "updated": 0}
+
+
+# --------------------------- search tokens ---------------------------------
+
+def test_search_tokens_fold_case_accents_and_keep_tech_terms():
+    from app.discovery import search
+
+    assert search.tokenize("Senior C++ / C# Developer — Node.js & Café") == [
+        "senior",
+        "c++",
+        "c#",
+        "developer",
+        "node.js",
+        "cafe",
+    ]
+    # Stopwords and stray single letters aren't indexed; "c"/"r" are languages.
+    assert search.tokenize("The R and a C of x") == ["r", "c"]
+
+    out = enrich.enrich(
+        {
+            "title": "Senior Engineer",
+            "company": "Acme",
+            "location": "New York",
+            "description": "Python and Kubernetes with our senior team.",
+        }
+    )
+    assert out["titleTokens"] == ["senior", "engineer"]
+    assert out["searchTokens"] == [
+        "senior", "engineer", "acme", "new", "york", "python", "kubernetes", "team",
+    ]
+
+
+@pytest.mark.parametrize(
+    "q,terms,prefix",
+    [
+        ("pyth", [], "pyth"),
+        ("python ", ["python"], None),
+        ("senior the pyth", ["senior"], "pyth"),
+        ("  ", [], None),
+    ],
+)
+def test_search_query_treats_last_word_as_prefix(q, terms, prefix):
+    from app.discovery import search
+
+    assert search.parse_query(q) == (terms, prefix)
+
+
+# --------------------------- process pool ----------------------------------
+
+def _raw_board(n: int) -> list[tuple[dict, str]]:
+    jobs = [
+        {
+            "id": i,
+            "title": ("Senior " if i % 3 else "Junior ") + f"Engineer {i}",
+            "absolute_url": f"https://boards.greenhouse.io/acme/jobs/{i}",
+            "updated_at": "2026-06-01T12:00:00Z",
+            "location": {"name": "Remote, US" if i % 2 else "Berlin (Hybrid)"},
+            "content": f"&lt;p&gt;Python, AWS. ${100 + i},000 - ${150 + i},000. "
+            "Bachelor's degree required.&lt;/p&gt;" * (1 + i % 4),
+        }
+        for i in range(n)
+    ]
+    jobs.append({"id": n, "title": ""})  # unusable: no title
+    return [(job, "Acme") for job in jobs]
+
+
+def test_enrich_pool_matches_serial_path():
+    from datetime import datetime, timezone
+
+    from app.discovery import pipeline
+
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    items = _raw_board(23)
+    serial = list(pipeline.process_items("greenhouse", "acme", now, items, {}))
+    # Pretend one posting is already stored unchanged.
+    known = {serial[4]["sourceId"]: serial[4]["contentHash"]}
+    serial = list(pipeline.process_items("greenhouse", "acme", now, items, known))
+
+    pool = pipeline.EnrichExecutor(workers=2, chunk_size=5)
+    try:
+        pooled = list(
+            pipeline.process_items("greenhouse", "acme", now, items, known, pool)
+        )
+    finally:
+        pool.shutdown()
+
+    assert pooled == serial  # same documents, same order
+    assert serial[4] is pipeline.SKIPPED and serial[-1] is None
+    assert serial[0]["experienceLevel"] == "entry" and serial[0]["requiresDegree"]
+
+
+def test_enrich_pool_ships_each_chunk_only_its_stored_hashes():
+    from datetime import datetime, timezone
+
+    from app.discovery import pipeline
+
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    items = _raw_board(12)
+    known = {str(i): f"hash-{i}" for i in range(0, 1000, 2)}  # a big stored board
+    pool = pipeline.EnrichExecutor(workers=1, chunk_size=5)
+    submit, shipped = pool._pool.submit, []
+
+    def recording_submit(fn, *args):
+        shipped.append(args[-1])
+        return submit(fn, *args)
+
+    pool._pool.submit = recording_submit
+    try:
+        list(pipeline.process_items("greenhouse", "acme", now, items, known, pool))
+    finally:
+        pool.shutdown()
+
+    assert shipped == [
+        {"0": "hash-0", "2": "hash-2", "4": "hash-4"},
+        {"6": "hash-6", "8": "hash-8"},
+        {"10": "hash-10", "12": "hash-12"},
+    ]
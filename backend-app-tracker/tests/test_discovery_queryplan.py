@@ -0,0 +1,74 @@
+"""Unit tests for the startup query-plan report (Discover index coverage)."""
+
+import logging
+
+from app.discovery import queryplan
+
+
+def _plan(*stages):
+    """A classic explain plan: a chain of single-input stages."""
+    node = None
+    for stage in reversed(stages):
+        node = {"stage": stage, **({"inputStage": node} if node else {})}
+    return {"queryPlanner": {"winningPlan": node}}
+
+
+class _ExplainingDb:
+    """Answers ``explain`` with a COLLSCAN for queries on ``scanned_field``."""
+
+    def __init__(self, scanned_field):
+        self.scanned_field = scanned_field
+        self.discovered_jobs = type("Coll", (), {"name": "discovered_jobs"})()
+
+    def command(self, name, command, verbosity):
+        assert name == "explain" and verbosity == "queryPlanner"
+        query = command.get("filter", command.get("query"))
+        if self.scanned_field in query:
+            return _plan("LIMIT", "SORT", "COLLSCAN")
+        return _plan("LIMIT", "FETCH", "IXSCAN")
+
+
+def test_plan_stages_walks_classic_and_sbe_layouts():
+    assert queryplan.plan_stages(_plan("FETCH", "IXSCAN")["queryPlanner"]) == {
+        "FETCH",
+        "IXSCAN",
+    }
+    sbe = {
+        "queryPlan": {
+            "stage": "OR",
+            "inputStages": [{"stage": "IXSCAN"}, {"stage": "COLLSCAN"}],
+        }
+    }
+    assert queryplan.plan_stages(sbe) == {"OR", "IXSCAN", "COLLSCAN"}
+
+
+def test_shapes_cover_the_filter_set_and_alert_counts():
+    queries = [shape.query() for shape in queryplan.QUERY_SHAPES]
+    filtered = {key for query in queries for key in query}
+    assert {
+        "workArrangement",
+        "experienceLevel",
+        "employmentType",
+        "source",
+        "sponsorshipAvailable",
+        "qualityScore",
+        "postedAt",
+        "salaryMax",
+        "searchTokens",
+        "ingestedAt",
+    } <= filtered
+    assert any(shape.count for shape in queryplan.QUERY_SHAPES)
+
+
+def test_collection_scans_are_reported(caplog):
+    db = _ExplainingDb("salaryMax")
+    assert queryplan.collection_scans(db) == ["feed:salaryMin"]
+
+    with caplog.at_level(logging.WARNING, logger="careerlog.discovery"):
+        queryplan.log_collection_scans(db)
+    assert "feed:salaryMin" in caplog.text
+
+
+def test_report_is_skipped_when_explain_is_unavailable(db):
+    # The in-memory test backend can't explain; the report must not fail.
+    assert queryplan.collection_scans(db) is None
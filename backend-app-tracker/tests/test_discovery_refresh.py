@@ -0,0 +1,217 @@
+"""Background refresh of tracked boards: registry, claiming, backoff.
+The ATS is a mock httpx transport so the suite stays offline."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.discovery import service, tracking
+from app.discovery.boards import KNOWN_COMPANIES
+
+BOARD = {
+    "jobs": [
+        {
+            "id": 7,
+            "title": "Site Reliability Engineer",
+            "absolute_url": "https://boards.greenhouse.io/x/jobs/7",
+            "location": {"name": "Remote"},
+            "content": "Kubernetes and Terraform.",
+        }
+    ]
+}
+
+
+def _now():
+    return datetime.now(tz=timezone.utc)
+
+
+def _naive_now():
+    # The registry stores naive UTC, as Mongo returns it.
+    return _now().replace(tzinfo=None)
+
+
+@pytest.fixture
+def registry(db):
+    # The registry is global; start each test from an empty one.
+    db.tracked_boards.delete_many({})
+    return db.tracked_boards
+
+
+@pytest.fixture
+def fake_ats(monkeypatch):
+    """Greenhouse boards listed in ``live`` return BOARD; others 404."""
+    live = set()
+
+    def handler(request):
+        token = request.url.path.split("/")[3]
+        return httpx.Response(200, json=BOARD) if token in live else httpx.Response(404)
+
+    monkeypatch.setattr(
+        service,
+        "async_client",
+        lambda n: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return live
+
+
+def _make_due(registry, token):
+    registry.update_one(
+        {"boardToken": token},
+        {"$set": {"nextRefreshAt": _naive_now() - timedelta(minutes=1)}},
+    )
+
+
+def test_ingest_tracks_board(client, auth_payload, registry, fake_board):
+    fake_board(BOARD)
+    res = client.post("/api/auth/register", json={**auth_payload, "email": "track@example.com"})
+    jwt = res.json()["data"]["jwt"]
+    client.post(
+        "/api/discovery/ingest",
+        headers={"Authorization": f"Bearer {jwt}"},
+        json={"source": "greenhouse", "boardToken": "trackco", "companyName": "TrackCo"},
+    )
+    doc = registry.find_one({"source": "greenhouse", "boardToken": "trackco"})
+    assert doc["company"] == "TrackCo"
+    assert doc["intervalSeconds"] == settings.discovery_refresh_interval_seconds
+    # First refresh is staggered somewhere within one interval.
+    assert doc["nextRefreshAt"] <= _naive_now() + timedelta(
+        seconds=doc["intervalSeconds"]
+    )
+
+
+def test_seed_known_boards_is_idempotent(db, registry):
+    tracking.seed_known_boards(db, _now())
+    tracking.seed_known_boards(db, _now())
+    assert registry.count_documents({}) == len(KNOWN_COMPANIES)
+
+
+def test_refresh_ingests_due_boards_and_reschedules(db, registry, fake_ats):
+    fake_ats.add("refreshco")
+    tracking.track_board(db, "greenhouse", "refreshco", "RefreshCo", _now())
+    _make_due(registry, "refreshco")
+
+    result = asyncio.run(service.refresh_due_boards_async(db, _now()))
+    assert result == {"refreshed": 1, "notModified": 0, "failed": 0}
+    assert db.discovered_jobs.count_documents({"boardToken": "refreshco"}) == 1
+
+    doc = registry.find_one({"boardToken": "refreshco"})
+    assert doc["claimedUntil"] is None and doc["failures"] == 0
+    assert doc["lastRefreshedAt"] is not None
+    assert doc["nextRefreshAt"] > _naive_now() + timedelta(
+        seconds=0.8 * doc["intervalSeconds"]
+    )
+    # Not due again, so the next pass is a no-op.
+    assert asyncio.run(service.refresh_due_boards_async(db, _now())) == {
+        "refreshed": 0,
+        "notModified": 0,
+        "failed": 0,
+    }
+
+
+def test_failed_refresh_backs_off_exponentially(db, registry, fake_ats):
+    tracking.track_board(db, "greenhouse", "deadco", None, _now())
+    delays = []
+    for _ in range(3):
+        _make_due(registry, "deadco")
+        assert asyncio.run(service.refresh_due_boards_async(db, _now()))["failed"] == 1
+        doc = registry.find_one({"boardToken": "deadco"})
+        delays.append((doc["nextRefreshAt"] - _naive_now()).total_seconds())
+    assert doc["failures"] == 3 and "Unknown company board" in doc["lastError"]
+    assert delays[0] < delays[1] < delays[2]
+    assert tracking.backoff_seconds(3) == 4 * tracking.backoff_seconds(1)
+    assert tracking.backoff_seconds(50) == settings.discovery_refresh_max_backoff_seconds
+
+
+def test_store_error_fails_only_that_board_and_releases_its_claim(
+    db, registry, fake_ats, monkeypatch
+):
+    from pymongo.errors import PyMongoError
+
+    store = service._store_board
+
+    def flaky_store(db, board, items, now):
+        if board.token == "mongodownco":
+            raise PyMongoError("primary stepped down")
+        return store(db, board, items, now)
+
+    monkeypatch.setattr(service, "_store_board", flaky_store)
+    for token in ("mongodownco", "healthyco"):
+        fake_ats.add(token)
+        tracking.track_board(db, "greenhouse", token, None, _now())
+        _make_due(registry, token)
+
+    result = asyncio.run(service.refresh_due_boards_async(db, _now()))
+    assert result == {"refreshed": 1, "notModified": 0, "failed": 1}
+    failed = registry.find_one({"boardToken": "mongodownco"})
+    assert failed["claimedUntil"] is None and failed["failures"] == 1
+    assert "PyMongoError" in failed["lastError"]
+    assert registry.find_one({"boardToken": "healthyco"})["lastRefreshedAt"] is not None
+
+
+def test_failed_pass_still_releases_claims(db, registry, monkeypatch):
+    async def broken(db, boards, **kwargs):
+        raise RuntimeError("pool gone")
+
+    monkeypatch.setattr(service, "ingest_boards_async", broken)
+    tracking.track_board(db, "greenhouse", "passfailco", None, _now())
+    _make_due(registry, "passfailco")
+
+    result = asyncio.run(service.refresh_due_boards_async(db, _now()))
+    assert result == {"refreshed": 0, "notModified": 0, "failed": 1}
+    doc = registry.find_one({"boardToken": "passfailco"})
+    assert doc["claimedUntil"] is None and doc["failures"] == 1
+
+
+def test_manual_ingest_conflicts_with_a_claimed_board(db, registry, fake_board):
+    from fastapi import HTTPException
+
+    fake_board(BOARD)
+    tracking.track_board(db, "greenhouse", "busyco", None, _now())
+    _make_due(registry, "busyco")
+    assert len(tracking.claim_due_boards(db, _now(), limit=10)) == 1
+
+    with pytest.raises(HTTPException) as exc:
+        service.ingest(db, "greenhouse", "busyco", None)
+    assert exc.value.status_code == 409
+    assert exc.value.detail["error"]["code"] == "INGEST_IN_PROGRESS"
+    assert db.discovered_jobs.count_documents({"boardToken": "busyco"}) == 0
+
+    # Once the refresh lets go, the ingest runs and releases the board itself.
+    registry.update_one({"boardToken": "busyco"}, {"$set": {"claimedUntil": None}})
+    assert service.ingest(db, "greenhouse", "busyco", None)["inserted"] == 1
+    assert registry.find_one({"boardToken": "busyco"})["claimedUntil"] is None
+
+
+def test_failed_first_ingest_does_not_track_the_board(db, registry, fake_board, monkeypatch):
+    from pymongo.errors import PyMongoError
+
+    def down(*args, **kwargs):
+        raise PyMongoError("primary stepped down")
+
+    fake_board(BOARD)
+    monkeypatch.setattr(service, "_store_board", down)
+    with pytest.raises(PyMongoError):
+        service.ingest(db, "greenhouse", "newfailco", None)
+    assert registry.find_one({"boardToken": "newfailco"}) is None
+
+    # A board that was tracked already stays tracked, and unclaimed.
+    tracking.track_board(db, "greenhouse", "oldfailco", None, _now())
+    with pytest.raises(PyMongoError):
+        service.ingest(db, "greenhouse", "oldfailco", None)
+    assert registry.find_one({"boardToken": "oldfailco"}).get("claimedUntil") is None
+
+
+def test_claimed_board_is_not_claimed_twice(db, registry):
+    tracking.track_board(db, "greenhouse", "leaseco", None, _now())
+    _make_due(registry, "leaseco")
+    now = _now()
+    first = tracking.claim_due_boards(db, now, limit=10)
+    second = tracking.claim_due_boards(db, now, limit=10)
+    assert [b["boardToken"] for b in first] == ["leaseco"]
+    assert second == []
+    # Once the lease lapses (a crashed replica), the board is claimable again.
+    later = now + timedelta(seconds=settings.discovery_refresh_lease_seconds + 1)
+    assert len(tracking.claim_due_boards(db, later, limit=10)) == 1
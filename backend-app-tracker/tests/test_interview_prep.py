@@ -73,3 +73,58 @@ def test_requires_auth(client):
         ).status_code
         == 401
     )
+
+
+def test_generate_for_a_discovered_posting(client, auth_payload, db, fake_board):
+    fake_board(
+        {
+            "jobs": [
+                {
+                    "id": 1,
+                    "title": "Senior Backend Engineer",
+                    "absolute_url": "https://boards.greenhouse.io/prepco/jobs/1",
+                    "updated_at": "2026-06-01T12:00:00Z",
+                    "location": {"name": "Remote"},
+                    "content": JD,
+                }
+            ]
+        }
+    )
+    headers = _headers(_register(client, auth_payload, "prep-discovered@example.com"))
+    client.post(
+        "/api/discovery/ingest",
+        headers=headers,
+        json={"source": "greenhouse", "boardToken": "prepco", "companyName": "PrepCo"},
+    )
+    posting = db.discovered_jobs.find_one({"boardToken": "prepco"})
+
+    res = client.post(
+        "/api/interview-prep/generate",
+        headers=headers,
+        json={"discoveredJobId": str(posting["_id"])},
+    )
+    assert res.status_code == 200
+    data = res.json()["data"]
+    # Same prep as pasting the posting, titled from the posting.
+    pasted = client.post(
+        "/api/interview-prep/generate",
+        headers=headers,
+        json={"jobDescription": posting["description"], "jobTitle": posting["title"]},
+    ).json()["data"]
+    assert data == pasted
+    assert "Senior Backend Engineer" in data["notes"]
+
+
+def test_generate_for_unknown_posting(client, auth_payload):
+    headers = _headers(_register(client, auth_payload, "prep-missing@example.com"))
+    for bad in ("not-an-id", "6650f0f0f0f0f0f0f0f0f0f0"):
+        res = client.post(
+            "/api/interview-prep/generate", headers=headers, json={"discoveredJobId": bad}
+        )
+        assert res.status_code == 404
+    both = client.post(
+        "/api/interview-prep/generate",
+        headers=headers,
+        json={"discoveredJobId": "6650f0f0f0f0f0f0f0f0f0f0", "jobDescription": JD},
+    )
+    assert both.status_code == 422
@@ -5,7 +5,6 @@ from datetime import datetime, timezone
 
 import pytest
 
-from app.discovery import connectors
 from app.job_alerts.service import process_due_job_alerts
 
 GREENHOUSE = {
@@ -42,8 +41,8 @@ def _register(client, auth_payload, email):
 
 
 @pytest.fixture
-def fake_greenhouse(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: GREENHOUSE)
+def fake_greenhouse(fake_board):
+    fake_board(GREENHOUSE)
 
 
 def _ingest(client, headers, token, company):
@@ -0,0 +1,76 @@
+"""The content-addressed job analysis cache behind scoring."""
+
+import pytest
+
+from app.config import settings
+from app.matching import analyze, job_cache, scoring
+
+RESUME = "Python developer. Built Django services on AWS."
+JOB = "Required: Python, Django and Kubernetes. Nice to have: Terraform."
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    job_cache.analysis_cache.clear()
+    yield
+    job_cache.analysis_cache.clear()
+
+
+def _refuse_analysis(monkeypatch):
+    def _boom(text):
+        raise AssertionError("job text was analyzed again")
+
+    monkeypatch.setattr(analyze, "analyze_job", _boom)
+
+
+def test_repeated_scoring_skips_job_analysis(monkeypatch):
+    first = scoring.score_match(RESUME, JOB)
+    _refuse_analysis(monkeypatch)
+    assert scoring.score_match("Terraform and Kubernetes operator.", JOB).score >= 0
+    assert scoring.score_match(RESUME, JOB) == first
+    stats = job_cache.cache_stats()
+    assert (stats["misses"], stats["hits"], stats["entries"]) == (1, 2, 1)
+
+
+def test_cached_signals_match_a_fresh_analysis():
+    cached = job_cache.job_signals(JOB)
+    assert job_cache.job_signals(JOB) is cached
+    assert cached == job_cache.prepare_job(JOB)
+    assert job_cache.JobSignals.from_doc(cached.to_doc()) == cached
+
+
+def test_least_recently_used_posting_is_evicted_first():
+    cache = job_cache.JobAnalysisCache(max_entries=2)
+    a, b, c = (job_cache.prepare_job(t) for t in ("Python", "Django", "Kubernetes"))
+    cache.put("a", a)
+    cache.put("b", b)
+    assert cache.get("a") is a  # "b" is now the oldest
+    cache.put("c", c)
+    assert cache.get("b") is None
+    assert cache.get("a") is a and cache.get("c") is c
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_shared_tier_serves_other_processes(monkeypatch, db):
+    monkeypatch.setattr(settings, "matching_job_cache_mongo", True)
+    expected = job_cache.job_signals(JOB)
+    stored = db.job_analysis_cache.find_one({"_id": job_cache.content_key(JOB)})
+    assert stored["version"] == analyze.ANALYZER_VERSION
+
+    job_cache.analysis_cache.clear()  # as if another replica
+    _refuse_analysis(monkeypatch)
+    assert job_cache.job_signals(JOB) == expected
+    assert job_cache.cache_stats()["sharedHits"] == 1
+
+
+def test_shared_entries_from_another_analyzer_version_are_ignored(monkeypatch, db):
+    monkeypatch.setattr(settings, "matching_job_cache_mongo", True)
+    text = "Required: SQL and Tableau."
+    db.job_analysis_cache.insert_one(
+        {"_id": job_cache.content_key(text), "version": "0.old", "signals": {}}
+    )
+    assert job_cache.job_signals(text) == job_cache.prepare_job(text)
+    assert job_cache.cache_stats()["misses"] == 1
+    stored = db.job_analysis_cache.find_one({"_id": job_cache.content_key(text)})
+    assert stored["version"] == analyze.ANALYZER_VERSION
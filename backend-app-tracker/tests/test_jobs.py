@@ -161,3 +161,91 @@ def test_resume_upload_rejects_bad_type(client, auth_token):
     )
     assert res.status_code == 400
     assert res.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+def _walk_cursor(client, headers, url):
+    """Follow ``meta.nextCursor`` from ``url`` to the end; returns all items."""
+    items, cursor = [], None
+    while True:
+        page = client.get(
+            url + (f"&cursor={cursor}" if cursor else ""), headers=headers
+        ).json()["data"]
+        items.extend(page["items"])
+        cursor = page["meta"]["nextCursor"]
+        if cursor is None:
+            return items, page["meta"]
+
+
+def test_cursor_pagination_matches_page_numbers(client, auth_token):
+    headers = {"Authorization": f"Bearer {auth_token['jwt']}"}
+    for n in range(7):
+        # Repeated companies exercise the _id tie-break.
+        _make_job(client, headers, jobTitle=f"Cursor {n}", company=f"Cursorco {n % 3}")
+
+    base = '/api/jobs?pageSize=3&sortBy=company&sortOrder=desc&filters={"company":"cursorco"}'
+    by_page = []
+    for page in (1, 2, 3):
+        by_page += client.get(f"{base}&page={page}", headers=headers).json()["data"][
+            "items"
+        ]
+
+    walked, meta = _walk_cursor(client, headers, base + "&includeTotal=false")
+    assert [j["id"] for j in walked] == [j["id"] for j in by_page]
+    assert len(walked) == 7
+    assert [j["company"] for j in walked] == sorted(
+        (j["company"] for j in walked), reverse=True
+    )
+    assert meta["totalItems"] is None and meta["page"] is None
+
+
+def test_cursor_is_validated(client, auth_token):
+    headers = {"Authorization": f"Bearer {auth_token['jwt']}"}
+    for n in range(3):
+        _make_job(client, headers, jobTitle=f"Cursor check {n}")
+
+    bad = client.get("/api/jobs?cursor=not-a-cursor", headers=headers)
+    assert bad.status_code == 400
+    assert bad.json()["error"]["code"] == "VALIDATION_ERROR"
+
+    cursor = client.get("/api/jobs?pageSize=1", headers=headers).json()["data"]["meta"][
+        "nextCursor"
+    ]
+    assert cursor
+    other_sort = client.get(
+        f"/api/jobs?pageSize=1&sortBy=jobTitle&cursor={cursor}", headers=headers
+    )
+    assert other_sort.status_code == 400
+
+
+def test_approximate_total_caps_the_count(client, auth_token, monkeypatch):
+    from app.config import settings
+
+    headers = {"Authorization": f"Bearer {auth_token['jwt']}"}
+    for n in range(3):
+        _make_job(client, headers, jobTitle=f"Approx {n}", company="Approxco")
+    monkeypatch.setattr(settings, "list_count_estimate_cap", 2)
+
+    url = '/api/jobs?pageSize=1&filters={"company":"approxco"}'
+    meta = client.get(url + "&approxTotal=true", headers=headers).json()["data"]["meta"]
+    assert meta["totalItems"] == 2 and meta["totalIsEstimate"] is True
+
+    exact = client.get(url, headers=headers).json()["data"]["meta"]
+    assert exact["totalItems"] == 3 and exact["totalIsEstimate"] is False
+
+
+def test_async_jobs_list_matches_the_sync_service(client, auth_token, db):
+    import asyncio
+
+    from app.database import get_async_db
+    from app.jobs import service
+
+    headers = {"Authorization": f"Bearer {auth_token['jwt']}"}
+    for title in ("Async A", "Async B", "Async C"):
+        _make_job(client, headers, jobTitle=title)
+    user_id = auth_token["userId"]
+
+    options = dict(page=1, page_size=2, sort_by="jobTitle", sort_order="asc", filters=None)
+    expected = service.list_jobs(db.jobs, user_id, **options)
+    got = asyncio.run(service.list_jobs_async(get_async_db().jobs, user_id, **options))
+    assert got == expected
+    assert len(got["items"]) == 2
@@ -2,6 +2,10 @@
 /api/match/scrape. Network-bound paths are monkeypatched so the suite stays
 offline and deterministic."""
 
+from bson import ObjectId
+
+from app.matching import analyze, resume_store
+
 
 def _headers(jwt):
     return {"Authorization": f"Bearer {jwt}"}
@@ -135,6 +139,199 @@ def test_score_rejects_another_users_resume(client, auth_payload):
     assert res.status_code == 403
 
 
+def test_uploaded_resume_is_analyzed_once_and_scored_from_the_stored_analysis(
+    client, auth_payload, db, monkeypatch
+):
+    jwt, _ = _register(client, auth_payload, "match-stored@example.com")
+    headers = _headers(jwt)
+    resume_id = _upload_resume(client, headers, _create_job(client, headers))
+
+    stored = db.fs.files.find_one({"_id": ObjectId(resume_id)})["metadata"]["analysis"]
+    assert stored["version"] == analyze.ANALYZER_VERSION
+    assert stored["text"] == "Python developer with Django and AWS"
+    assert "python" in stored["signals"]["skills"]
+
+    def _no_extraction(*args, **kwargs):
+        raise AssertionError("stored résumé was re-extracted")
+
+    monkeypatch.setattr(resume_store, "extract_resume_text", _no_extraction)
+    body = {"resumeId": resume_id, "jobDescription": "Python, Django and AWS."}
+    by_id = client.post("/api/match/score", headers=headers, json=body)
+    by_text = client.post(
+        "/api/match/score",
+        headers=headers,
+        json={"resumeText": stored["text"], "jobDescription": body["jobDescription"]},
+    )
+    assert by_id.status_code == 200
+    assert by_id.json()["data"] == by_text.json()["data"]
+
+
+def test_stale_resume_analysis_is_recomputed_and_saved(client, auth_payload, db):
+    jwt, _ = _register(client, auth_payload, "match-stale@example.com")
+    headers = _headers(jwt)
+    resume_id = _upload_resume(client, headers, _create_job(client, headers))
+    db.fs.files.update_one(
+        {"_id": ObjectId(resume_id)},
+        {"$set": {"metadata.analysis": {"version": "0.old", "text": "Barista"}}},
+    )
+
+    res = client.post(
+        "/api/match/score",
+        headers=headers,
+        json={"resumeId": resume_id, "jobDescription": "Python and Django."},
+    )
+    assert res.status_code == 200
+    assert res.json()["data"]["score"] > 0
+    stored = db.fs.files.find_one({"_id": ObjectId(resume_id)})["metadata"]["analysis"]
+    assert stored["version"] == analyze.ANALYZER_VERSION
+    assert stored["text"].startswith("Python developer")
+
+
+def test_unreadable_stored_resume_is_rejected(client, auth_payload):
+    jwt, _ = _register(client, auth_payload, "match-unreadable@example.com")
+    headers = _headers(jwt)
+    job_id = _create_job(client, headers)
+    res = client.post(
+        f"/api/jobs/{job_id}/resumes",
+        headers=headers,
+        files={"resume": ("cv.pdf", b"\x00\x01\x02", "application/pdf")},
+    )
+    assert res.status_code == 200
+    res = client.post(
+        "/api/match/score",
+        headers=headers,
+        json={"resumeId": res.json()["data"]["id"], "jobDescription": "Python"},
+    )
+    assert res.status_code == 422
+    assert res.json()["error"]["code"] == "RESUME_UNREADABLE"
+
+
+# --------------------------- /score-batch -----------------------------------
+
+_BATCH_RESUME = "Python developer using Django, PostgreSQL and AWS."
+
+
+def test_score_batch_ranks_postings_best_first(client, auth_payload):
+    jwt, _ = _register(client, auth_payload, "match-batch@example.com")
+    jobs = [
+        {"jobDescription": "Required: Kubernetes, Terraform and Go.", "ref": "ops"},
+        {"jobDescription": "Required: Python, Django and PostgreSQL.", "ref": "web"},
+        {"jobDescription": "Barista with latte art.", "ref": "cafe"},
+    ]
+    res = client.post(
+        "/api/match/score-batch",
+        headers=_headers(jwt),
+        json={"resumeText": _BATCH_RESUME, "jobs": jobs, "gapLimit": 2},
+    )
+    assert res.status_code == 200
+    data = res.json()["data"]
+    results = data["results"]
+    assert data["notFound"] == []
+    assert [r["score"] for r in results] == sorted(
+        (r["score"] for r in results), reverse=True
+    )
+    assert results[0]["ref"] == "web" and results[0]["index"] == 1
+    ops = next(r for r in results if r["ref"] == "ops")
+    assert "kubernetes" in ops["topGaps"] and len(ops["topGaps"]) <= 2
+
+    single = client.post(
+        "/api/match/score",
+        headers=_headers(jwt),
+        json={"resumeText": _BATCH_RESUME, "jobDescription": jobs[0]["jobDescription"]},
+    ).json()["data"]
+    assert (ops["score"], ops["confidence"]) == (single["score"], single["confidence"])
+
+
+def test_score_batch_scores_discovered_postings_by_id(client, auth_payload, db):
+    jwt, _ = _register(client, auth_payload, "match-batch-ids@example.com")
+    headers = _headers(jwt)
+    resume_id = _upload_resume(client, headers, _create_job(client, headers))
+    inserted = db.discovered_jobs.insert_many(
+        [
+            {"title": "Django Engineer", "company": "WebCo",
+             "description": "Required: Python, Django and AWS."},
+            {"title": "Nurse", "company": "CareCo",
+             "description": "Required: patient care and BLS certification."},
+        ]
+    )
+    ids = [str(i) for i in inserted.inserted_ids]
+    missing = str(ObjectId())
+    try:
+        res = client.post(
+            "/api/match/score-batch",
+            headers=headers,
+            json={
+                "resumeId": resume_id,
+                "jobs": [{"discoveredJobId": i} for i in (ids[1], missing, ids[0], "junk")],
+            },
+        )
+    finally:
+        db.discovered_jobs.delete_many({"_id": {"$in": inserted.inserted_ids}})
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert data["notFound"] == [missing, "junk"]
+    assert [(r["discoveredJobId"], r["company"]) for r in data["results"]] == [
+        (ids[0], "WebCo"),
+        (ids[1], "CareCo"),
+    ]
+    assert data["results"][0]["score"] > data["results"][1]["score"]
+
+
+def test_score_batch_analyzes_the_resume_once(client, auth_payload, monkeypatch):
+    jwt, _ = _register(client, auth_payload, "match-batch-once@example.com")
+    calls = []
+    original = analyze.analyze_resume
+
+    def _counting(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(analyze, "analyze_resume", _counting)
+    res = client.post(
+        "/api/match/score-batch",
+        headers=_headers(jwt),
+        json={
+            "resumeText": _BATCH_RESUME,
+            "jobs": [{"jobDescription": f"Required: Python and skill {i}."} for i in range(5)],
+        },
+    )
+    assert res.status_code == 200
+    assert len(res.json()["data"]["results"]) == 5
+    assert calls == [_BATCH_RESUME]
+
+
+def test_score_batch_validates_its_jobs(client, auth_payload):
+    from app.matching.schemas import MAX_BATCH_JOBS
+
+    jwt, _ = _register(client, auth_payload, "match-batch-invalid@example.com")
+    for jobs in (
+        [],
+        [{"discoveredJobId": str(ObjectId()), "jobDescription": "Python"}],
+        [{"ref": "neither"}],
+        [{"jobDescription": "Python"}] * (MAX_BATCH_JOBS + 1),
+    ):
+        res = client.post(
+            "/api/match/score-batch",
+            headers=_headers(jwt),
+            json={"resumeText": "Python", "jobs": jobs},
+        )
+        assert res.status_code == 422, jobs
+
+
+def test_score_batch_pool_matches_the_serial_path():
+    from app.matching import batch, scoring
+
+    signals = scoring.prepare_resume(_BATCH_RESUME)
+    texts = [f"Required: Python, Django and tool{i}. Nice to have: AWS." for i in range(7)]
+    serial = batch.score_texts(signals, texts, 3)
+    pool = batch.BatchScorer(workers=2, chunk_size=3)
+    try:
+        pooled = batch.score_texts(signals, texts, 3, pool)
+    finally:
+        pool.shutdown()
+    assert pooled == serial
+
+
 # --------------------------- /scrape ----------------------------------------
 
 def test_scrape_extracts_skills(client, auth_payload, monkeypatch):
@@ -2,11 +2,13 @@
 scoring, and the SSRF fetch guard. No app/client needed."""
 
 import io
+import re
 import zipfile
 
 import pytest
 
-from app.matching import keywords, scoring
+from app.matching import keywords, scoring, taxonomy
+from app.matching.automaton import AliasAutomaton
 from app.matching.extract import extract_resume_text, html_to_text
 from app.matching.fetch import FetchError, _is_public_host, _validate_url
 
@@ -113,6 +115,53 @@ def test_vocabulary_with_precomputed_skills_matches_default():
     assert keywords.vocabulary(text, skills=skills) == keywords.vocabulary(text)
 
 
+# --------------------------- single-pass alias matching ---------------------
+# Skills and concepts are found with one Aho–Corasick pass instead of a regex
+# per alias. These pin that the automaton reproduces the per-alias scan exactly.
+
+_ALIAS_TEXTS = [
+    "Built APIs in JS and Node.js, deployed on AWS with k8s.",
+    "Strong javascript developer with goals; c++, c#, .net and ci/cd.",
+    "React Native apps; react.js SPA; node. Node.js! tacacs+ and radius.",
+    "go-lang? golang, go lang. python3 py ml machine learning, xml html5",
+    "LAN switching, BGP/OSPF, VLANs, trunk ports, lldp; IS-IS, FP&A, a/b testing.",
+    "",
+]
+
+
+def _regex_first_positions(aliases, norm):
+    found = {}
+    for alias in aliases:
+        m = re.search(r"(?<![a-z0-9])" + re.escape(alias) + r"(?![a-z0-9])", norm)
+        if m:
+            found[alias] = m.start()
+    return found
+
+
+@pytest.mark.parametrize("text", _ALIAS_TEXTS)
+def test_alias_automaton_matches_per_alias_regex_scan(text):
+    norm = keywords.normalize(text)
+    automaton = AliasAutomaton(taxonomy._ALIASES_BY_LENGTH)
+    assert automaton.first_positions(norm) == _regex_first_positions(
+        taxonomy._ALIASES_BY_LENGTH, norm
+    )
+
+
+def test_alias_automaton_reports_overlapping_aliases():
+    automaton = AliasAutomaton(["react", "react native", "native"])
+    assert automaton.first_positions("react native apps") == {
+        "react": 0,
+        "react native": 0,
+        "native": 6,
+    }
+
+
+def test_detect_concepts_keeps_evidence_order_and_first_position():
+    hits = taxonomy.detect_concepts("VLANs first, then a trunk port and vlan tagging")
+    assert hits["vlan"].evidence == ["trunk port", "vlans", "vlan"]
+    assert hits["vlan"].position == 0
+
+
 # --------------------------- text extraction --------------------------------
 
 def test_extract_plain_text():
@@ -297,3 +346,12 @@ def test_validate_url_allows_public(monkeypatch):
     )
     assert _is_public_host("example.com") is True
     assert _validate_url("https://example.com/jobs") == "https://example.com/jobs"
+
+
+def test_prepared_resume_round_trips_through_its_stored_form():
+    resume = "Senior Python developer. Built Django services on AWS with PostgreSQL."
+    jd = "Required: Python, Django, Kubernetes. Nice to have: Terraform."
+    prepared = scoring.prepare_resume(resume)
+    restored = scoring.ResumeSignals.from_doc(prepared.to_doc())
+    assert restored == prepared
+    assert scoring.score_prepared(restored, jd) == scoring.score_match(resume, jd)
@@ -0,0 +1,261 @@
+"""Query profiling, request timing and the internal /metrics surface."""
+
+import logging
+import time
+
+import pytest
+from pydantic import ValidationError
+from pymongo import MongoClient, ReadPreference, monitoring
+
+from app import database
+from app.config import Settings, settings
+from app.matching import job_cache, scoring
+from app.metrics import queries
+from app.metrics.pool import PoolMonitor
+from app.metrics.registry import RequestTimings, endpoint_scope, registry
+
+
+def _register(client, auth_payload, email):
+    res = client.post("/api/auth/register", json={**auth_payload, "email": email})
+    assert res.status_code == 200
+    return {"Authorization": f"Bearer {res.json()['data']['jwt']}"}
+
+
+def _rows(histograms, endpoint):
+    return {r["name"]: r for r in histograms.get("mongo", []) if r["endpoint"] == endpoint}
+
+
+def test_metrics_route_is_disabled_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_token", None)
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setattr(settings, "metrics_token", "metrics-secret")
+    res = client.get("/metrics", headers={"X-Metrics-Token": "wrong"})
+    assert res.status_code == 403
+    assert res.json()["error"]["code"] == "FORBIDDEN"
+
+
+def test_list_queries_are_recorded_per_endpoint(client, db, auth_payload, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_token", "metrics-secret")
+    headers = _register(client, auth_payload, "metrics@example.com")
+    registry.reset()
+
+    assert client.get("/api/jobs/", headers=headers).status_code == 200
+    assert client.get("/api/analytics/funnel", headers=headers).status_code == 200
+    assert client.get("/api/discovery/jobs", headers=headers).status_code == 200
+
+    res = client.get("/metrics", headers={"X-Metrics-Token": "metrics-secret"})
+    assert res.status_code == 200
+    data = res.json()["data"]
+    jobs = _rows(data["histograms"], "/api/jobs/")
+    assert set(jobs) == {"jobs.find", "jobs.count"}
+    assert jobs["jobs.find"]["count"] == 1
+    assert sum(jobs["jobs.find"]["buckets"]) == 1
+    assert len(jobs["jobs.find"]["buckets"]) == len(data["bucketsMs"]) + 1
+    assert "jobs.find" in _rows(data["histograms"], "/api/analytics/funnel")
+    assert "discovered_jobs.aggregate" in _rows(data["histograms"], "/api/discovery/jobs")
+    assert {"hits", "misses", "evictions"} <= set(data["caches"]["jobAnalysis"])
+
+
+def test_slow_queries_are_logged_without_filter_values(
+    client, auth_payload, monkeypatch, caplog
+):
+    headers = _register(client, auth_payload, "slowquery@example.com")
+    monkeypatch.setattr(settings, "slow_query_ms", 0)
+    with caplog.at_level(logging.WARNING, logger="careerlog.metrics"):
+        client.get("/api/analytics/funnel", headers=headers)
+    slow = [r.getMessage() for r in caplog.records if "Slow query" in r.getMessage()]
+    assert slow and "jobs.find on /api/analytics/funnel" in slow[0]
+    assert "userId" in slow[0] and "slowquery" not in slow[0]
+
+
+def test_summarize_explain_reads_find_and_aggregate_layouts():
+    stats = {"nReturned": 3, "totalDocsExamined": 40, "totalKeysExamined": 41}
+    plan = {"stage": "LIMIT", "inputStage": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}}
+    find = {"queryPlanner": {"winningPlan": plan}, "executionStats": stats}
+    aggregate = {"stages": [{"$cursor": find}, {"$group": {}}]}
+    expected = {
+        "docsExamined": 40,
+        "keysExamined": 41,
+        "nReturned": 3,
+        "stages": ["FETCH", "IXSCAN", "LIMIT"],
+    }
+    assert queries.summarize_explain(find) == expected
+    assert queries.summarize_explain(aggregate) == expected
+
+
+class _ExplainingCollection:
+    name = "things"
+
+    def __init__(self):
+        self.commands = []
+        self.database = self
+
+    def command(self, name, command, verbosity):
+        self.commands.append((name, command, verbosity))
+        return {
+            "queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}},
+            "executionStats": {"nReturned": 2, "totalDocsExamined": 9},
+        }
+
+
+def test_sampled_calls_are_explained_off_the_request_path(monkeypatch):
+    monkeypatch.setattr(settings, "query_plan_sample_rate", 1.0)
+    coll = _ExplainingCollection()
+    with endpoint_scope("background:test"):
+        with queries.profile_query(
+            coll, "find", filter={"kind": "a"}, sort=[("at", -1)], limit=5
+        ) as span:
+            span.returned = 2
+
+    deadline = time.monotonic() + 2
+    while not coll.commands or not queries.plan_samples():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert coll.commands == [
+        (
+            "explain",
+            {"find": "things", "filter": {"kind": "a"}, "sort": {"at": -1}, "limit": 5},
+            "executionStats",
+        )
+    ]
+    sample = queries.plan_samples()[-1]
+    assert sample["endpoint"] == "background:test"
+    assert sample["name"] == "things.find"
+    assert (sample["returned"], sample["docsExamined"], sample["stages"]) == (
+        2,
+        9,
+        ["COLLSCAN"],
+    )
+
+
+def test_a_sample_submitted_after_shutdown_is_dropped(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(settings, "query_plan_sample_rate", 1.0)
+    stopped = ThreadPoolExecutor(max_workers=1)
+    stopped.shutdown()
+    monkeypatch.setattr(queries, "_executor", stopped)  # shut down mid-submit
+    with queries.profile_query(_ExplainingCollection(), "find", filter={}) as span:
+        span.returned = 0
+    # The sample's slot is given back instead of leaking.
+    assert queries._pending._value == queries._MAX_PENDING_EXPLAINS
+
+
+def _server_timing(res):
+    return dict(
+        part.split(";dur=") for part in res.headers["Server-Timing"].split(", ")
+    )
+
+
+def test_responses_carry_server_timing(client, auth_payload):
+    assert set(_server_timing(client.get("/health"))) == {"total"}
+
+    headers = _register(client, auth_payload, "servertiming@example.com")
+    timing = _server_timing(client.get("/api/jobs/", headers=headers))
+    assert set(timing) == {"total", "mongo"}
+    assert 0 <= float(timing["mongo"]) <= float(timing["total"])
+
+
+def test_request_wall_time_has_rolling_percentiles(client, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_token", "metrics-secret")
+    registry.reset()
+    for _ in range(3):
+        client.get("/health")
+
+    res = client.get("/metrics", headers={"X-Metrics-Token": "metrics-secret"})
+    [health] = [r for r in res.json()["data"]["histograms"]["request"] if r["endpoint"] == "/health"]
+    assert health["name"] == "GET" and health["count"] == 3
+    assert health["p50Ms"] <= health["p95Ms"] <= health["p99Ms"] <= health["maxMs"]
+
+
+def test_nested_and_overlapping_spans_count_once():
+    timings = RequestTimings()
+    timings.enter("cpu", 0.0)
+    timings.enter("cpu", 1.0)  # nested inside the first
+    timings.exit("cpu", 2.0)
+    timings.exit("cpu", 3.0)
+    timings.enter("http", 10.0)
+    timings.enter("http", 11.0)  # concurrent fetch
+    timings.exit("http", 12.0)
+    timings.exit("http", 14.0)
+    assert timings.seconds == {"cpu": 3.0, "http": 4.0}
+    assert timings.server_timing(20.0) == "total;dur=20000.0, cpu;dur=3000.0, http;dur=4000.0"
+
+
+def test_matching_stages_are_timed_as_cpu_spans():
+    registry.reset()
+    job_cache.analysis_cache.clear()  # a cached posting skips analyze_job
+    with endpoint_scope("background:test"):
+        scoring.score_match("Python and SQL developer", "We need Python and SQL.")
+    names = {r["name"] for r in registry.snapshot()["cpu"]}
+    assert names == {
+        "matching.analyze_job",
+        "matching.analyze_resume",
+        "matching.score_match",
+    }
+
+
+def test_pool_monitor_tracks_usage_and_high_water_marks():
+    registry.reset()
+    pool = PoolMonitor("sync")
+    address = ("db.internal", 27017)
+    pool.pool_created(monitoring.PoolCreatedEvent(address, {"maxPoolSize": 2}))
+    for conn in (1, 2):
+        pool.connection_check_out_started(monitoring.ConnectionCheckOutStartedEvent(address))
+        pool.connection_created(monitoring.ConnectionCreatedEvent(address, conn))
+        pool.connection_checked_out(monitoring.ConnectionCheckedOutEvent(address, conn, 0.004))
+    pool.connection_check_out_started(monitoring.ConnectionCheckOutStartedEvent(address))
+    pool.connection_checked_in(monitoring.ConnectionCheckedInEvent(address, 1))
+    pool.connection_checked_out(monitoring.ConnectionCheckedOutEvent(address, 1, 0.25))
+    pool.connection_checked_in(monitoring.ConnectionCheckedInEvent(address, 1))
+    pool.connection_checked_in(monitoring.ConnectionCheckedInEvent(address, 2))
+
+    [row] = pool.snapshot()
+    assert row == {
+        "client": "sync",
+        "address": "db.internal:27017",
+        "maxPoolSize": 2,
+        "open": 2,
+        "inUse": 0,
+        "waiting": 0,
+        "maxInUse": 2,
+        "maxWaiting": 1,
+        "checkouts": 3,
+        "failedCheckouts": 0,
+        "cleared": 0,
+    }
+    [waits] = registry.snapshot()["pool"]
+    assert waits["name"] == "sync.checkout" and waits["count"] == 3
+
+
+def test_client_options_come_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "mongodb_max_pool_size", 20)
+    monkeypatch.setattr(settings, "mongodb_server_selection_timeout_ms", 2000)
+    monkeypatch.setattr(settings, "mongodb_compressors", "zlib")
+    options = database.client_options("sync")
+    assert options["maxPoolSize"] == 20 and "minPoolSize" not in options
+
+    client = MongoClient("mongodb://db.internal:27017", connect=False, **options)
+    try:
+        assert client.options.pool_options.max_pool_size == 20
+        assert client.options.server_selection_timeout == 2
+    finally:
+        client.close()
+
+
+def test_unknown_mongodb_compressor_is_rejected():
+    with pytest.raises(ValidationError):
+        Settings(
+            mongodb_uri="mongodb://localhost:27017",
+            jwt_secret="test-secret-do-not-use-in-prod",
+            mongodb_compressors="zstd,lz4",
+        )
+
+
+def test_secondary_reads_apply_to_the_read_db_only(monkeypatch):
+    assert database.get_read_db() is database.get_db()
+    monkeypatch.setattr(settings, "mongodb_secondary_reads", True)
+    read_db = database.get_read_db()
+    assert read_db.read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert database.get_db().read_preference == ReadPreference.PRIMARY
@@ -3,7 +3,6 @@ discovery listing."""
 
 import pytest
 
-from app.discovery import connectors
 
 # Two companies, each with one posting; used to verify hide/prefer behaviour.
 GREENHOUSE = {
@@ -39,6 +38,7 @@ def test_preferences_default_then_update(client, auth_payload):
         "preferredCompanies": [],
         "hiddenCompanies": [],
         "hiddenEmploymentTypes": [],
+        "defaultResumeId": None,
     }
 
     updated = client.put(
@@ -75,8 +75,8 @@ def test_preferences_require_auth(client):
 
 
 @pytest.fixture
-def fake_greenhouse(monkeypatch):
-    monkeypatch.setattr(connectors, "_get_json", lambda url: GREENHOUSE)
+def fake_greenhouse(fake_board):
+    fake_board(GREENHOUSE)
 
 
 def test_hidden_company_excluded_when_preferences_applied(
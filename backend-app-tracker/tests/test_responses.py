@@ -0,0 +1,71 @@
+"""The orjson response path renders what FastAPI's default encoder would."""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.common.responses import fast_success, success
+
+
+class _Meta(BaseModel):
+    page: int
+    at: datetime
+
+
+def test_fast_success_matches_the_default_encoding():
+    data = {
+        "items": [
+            {
+                "id": "665f1c2e8b3f4a2d9c0e1a2b",
+                "createdAt": datetime(2026, 6, 1, 12, 0, 0, 120000),
+                "postedAt": datetime(2026, 6, 2, 8, 30, tzinfo=timezone.utc),
+                "statusHistory": [{"status": "applied", "at": datetime(2026, 6, 1)}],
+                "salary": Decimal("120000.5"),
+                "tags": ("python", "remote"),
+                "description": "Ünïcode — “quotes” & <html>",
+                "missing": None,
+            }
+        ],
+        "meta": _Meta(page=1, at=datetime(2026, 6, 3, tzinfo=timezone.utc)),
+    }
+    response = fast_success(data)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(success(data))
+
+
+def test_fast_success_renders_object_ids_as_hex():
+    oid = ObjectId("665f1c2e8b3f4a2d9c0e1a2c")
+    body = json.loads(fast_success({"resumeId": oid}).body)
+    assert body["data"] == {"resumeId": "665f1c2e8b3f4a2d9c0e1a2c"}
+
+
+def test_jobs_list_is_served_by_the_fast_path(client, auth_token):
+    headers = {"Authorization": f"Bearer {auth_token['jwt']}"}
+    created = client.post(
+        "/api/jobs",
+        headers=headers,
+        json={
+            "jobId": "fast-1",
+            "url": "https://example.com/job",
+            "jobTitle": "Engineer",
+            "company": "FastCo",
+            "salaryTarget": 120000,
+            "salaryRange": "100k-130k",
+            "status": "applied",
+            "resume": "base64resume",
+            "location": "Remote",
+            "employmentType": "full-time",
+        },
+    )
+    assert created.status_code == 200
+    res = client.get("/api/jobs", headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    [job] = [j for j in res.json()["data"]["items"] if j["jobId"] == "fast-1"]
+    assert job["id"] == created.json()["data"]["id"]
+    assert job["statusHistory"][0]["status"] == "applied"
+    assert datetime.fromisoformat(job["createdAt"])
@@ -1,6 +1,9 @@
 import importlib
 
 import pytest
+from bson import ObjectId
+
+from app.common.auth import create_access_token, live_users
 
 
 def test_jwt_secret_rejects_weak_value(monkeypatch):
@@ -57,6 +60,42 @@ def test_deleted_user_token_is_rejected(client, auth_payload):
     assert after.json()["error"]["code"] == "AUTH_TOKEN_INVALID"
 
 
+def test_user_liveness_is_cached_between_requests(client, db, auth_payload):
+    """Authenticated requests don't re-read the user every time; deleting the
+    account through the API still revokes its tokens at once (above)."""
+    res = client.post(
+        "/api/auth/register", json={**auth_payload, "email": "livecache@example.com"}
+    )
+    data = res.json()["data"]
+    headers = {"Authorization": f"Bearer {data['jwt']}"}
+    assert client.get("/api/jobs/", headers=headers).status_code == 200
+
+    # Removed behind the service's back: the cached entry still vouches for it
+    # until it expires or is forgotten.
+    db.users.delete_one({"_id": ObjectId(data["user"]["id"])})
+    assert client.get("/api/jobs/", headers=headers).status_code == 200
+    live_users.forget(data["user"]["id"])
+    assert client.get("/api/jobs/", headers=headers).status_code == 401
+
+
+def test_generation_bump_revokes_access_tokens(client, db, auth_payload):
+    """A newer-generation token refreshes a stale cache entry (a bump on another
+    replica); tokens from older generations are then rejected."""
+    data = _fresh_session(client, auth_payload, "gen-bump@example.com")
+    user_id = data["user"]["id"]
+    old = {"Authorization": f"Bearer {data['jwt']}"}
+    assert client.get("/api/jobs/", headers=old).status_code == 200
+
+    db.users.update_one({"_id": ObjectId(user_id)}, {"$inc": {"tokenGeneration": 1}})
+    new_jwt = create_access_token(user_id, "gen-bump@example.com", generation=1)["jwt"]
+    new = {"Authorization": f"Bearer {new_jwt}"}
+    assert client.get("/api/jobs/", headers=new).status_code == 200
+
+    res = client.get("/api/jobs/", headers=old)
+    assert res.status_code == 401
+    assert res.json()["error"]["code"] == "AUTH_TOKEN_INVALID"
+
+
 def _fresh_session(client, auth_payload, email):
     res = client.post("/api/auth/register", json={**auth_payload, "email": email})
     assert res.status_code == 200